@@ -0,0 +1,51 @@
+"""add_specialist_day_availability
+
+Revision ID: 9b2f4c6d8e10
+Revises: 4976b5d06d1e
+Create Date: 2025-11-20 09:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2f4c6d8e10"
+down_revision: Union[str, Sequence[str], None] = "4976b5d06d1e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add specialist_day_availability summary table."""
+    op.create_table(
+        "specialist_day_availability",
+        sa.Column("specialist_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("has_free_slots", sa.Boolean(), nullable=False),
+        sa.Column("slot_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["specialist_id"],
+            ["specialists.id"],
+        ),
+        sa.PrimaryKeyConstraint("specialist_id", "date"),
+    )
+    op.create_index(
+        "ix_specialist_day_availability_date_free",
+        "specialist_day_availability",
+        ["date", "has_free_slots"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop specialist_day_availability summary table."""
+    op.drop_index(
+        "ix_specialist_day_availability_date_free",
+        table_name="specialist_day_availability",
+    )
+    op.drop_table("specialist_day_availability")
@@ -0,0 +1,58 @@
+"""add_search_trigram_indexes
+
+Revision ID: a2d7e5c8f3b9
+Revises: f1c6d9b3a2e8
+Create Date: 2025-11-26 10:31:52.604217
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a2d7e5c8f3b9"
+down_revision: Union[str, Sequence[str], None] = "f1c6d9b3a2e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column) for every column searched with ILIKE '%term%'
+TRIGRAM_INDEXES = [
+    ("ix_specialist_name_trgm", "specialists", "name"),
+    ("ix_specialist_bio_trgm", "specialists", "bio"),
+    ("ix_service_name_trgm", "services", "name"),
+    ("ix_workplace_name_trgm", "workplaces", "name"),
+    ("ix_workplace_description_trgm", "workplaces", "description"),
+    ("ix_workplace_city_trgm", "workplaces", "city"),
+    ("ix_workplace_state_trgm", "workplaces", "state"),
+    ("ix_workplace_address_trgm", "workplaces", "address"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add pg_trgm GIN indexes for search columns (PostgreSQL only)."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop the search trigram indexes (PostgreSQL only)."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for name, table, _ in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name=table)
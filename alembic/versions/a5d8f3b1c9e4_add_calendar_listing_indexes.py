@@ -0,0 +1,41 @@
+"""add_calendar_listing_indexes
+
+Revision ID: a5d8f3b1c9e4
+Revises: f4c9e2a7d1b8
+Create Date: 2025-11-22 09:14:27.508316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5d8f3b1c9e4"
+down_revision: Union[str, Sequence[str], None] = "f4c9e2a7d1b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add composite indexes for calendar event and recurring schedule listings."""
+    op.create_index(
+        "ix_cal_specialist_active_range",
+        "calendar_events",
+        ["specialist_id", "is_active", "start_datetime", "end_datetime"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_cal_recurring_lookup",
+        "calendar_events",
+        ["specialist_id", "is_recurring", "is_active", "recurring_event_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove calendar listing indexes."""
+    op.drop_index("ix_cal_recurring_lookup", table_name="calendar_events")
+    op.drop_index("ix_cal_specialist_active_range", table_name="calendar_events")
@@ -0,0 +1,40 @@
+"""add_workplace_fts_index
+
+Revision ID: b3e8f6d1a4c7
+Revises: a2d7e5c8f3b9
+Create Date: 2025-11-26 11:08:17.942630
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8f6d1a4c7"
+down_revision: Union[str, Sequence[str], None] = "a2d7e5c8f3b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add workplace full-text search index (PostgreSQL only)."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Must match database.workplace_search_vector() exactly
+    op.execute(
+        "CREATE INDEX ix_workplace_fts ON workplaces USING gin ("
+        "to_tsvector('english', "
+        "coalesce(name, '') || ' ' || coalesce(description, '')))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop the workplace full-text index (PostgreSQL only)."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_workplace_fts", table_name="workplaces")
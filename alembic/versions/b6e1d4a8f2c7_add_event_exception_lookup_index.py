@@ -0,0 +1,34 @@
+"""add_event_exception_lookup_index
+
+Revision ID: b6e1d4a8f2c7
+Revises: a5d8f3b1c9e4
+Create Date: 2025-11-23 10:41:52.184903
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6e1d4a8f2c7"
+down_revision: Union[str, Sequence[str], None] = "a5d8f3b1c9e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add index for looking up event exceptions by event and date."""
+    op.create_index(
+        "ix_event_exception_event_date",
+        "event_exceptions",
+        ["event_id", "exception_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove event exception lookup index."""
+    op.drop_index("ix_event_exception_event_date", table_name="event_exceptions")
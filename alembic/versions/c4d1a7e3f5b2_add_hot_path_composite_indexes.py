@@ -0,0 +1,48 @@
+"""add_hot_path_composite_indexes
+
+Revision ID: c4d1a7e3f5b2
+Revises: 9b2f4c6d8e10
+Create Date: 2025-11-20 14:38:02.711240
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d1a7e3f5b2"
+down_revision: Union[str, Sequence[str], None] = "9b2f4c6d8e10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add composite indexes for availability, booking and event lookups."""
+    op.create_index(
+        "ix_avail_spec_date_avail",
+        "availability_slots",
+        ["specialist_id", "date", "is_available"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_booking_spec_date_status",
+        "bookings",
+        ["specialist_id", "date", "status"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_calevent_spec_time",
+        "calendar_events",
+        ["specialist_id", "end_datetime", "start_datetime"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove composite lookup indexes."""
+    op.drop_index("ix_calevent_spec_time", table_name="calendar_events")
+    op.drop_index("ix_booking_spec_date_status", table_name="bookings")
+    op.drop_index("ix_avail_spec_date_avail", table_name="availability_slots")
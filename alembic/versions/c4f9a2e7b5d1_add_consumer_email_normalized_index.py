@@ -0,0 +1,34 @@
+"""add_consumer_email_normalized_index
+
+Revision ID: c4f9a2e7b5d1
+Revises: b3e8f6d1a4c7
+Create Date: 2025-11-26 13:45:09.217384
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f9a2e7b5d1"
+down_revision: Union[str, Sequence[str], None] = "b3e8f6d1a4c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add expression index for normalized consumer email lookups."""
+    op.create_index(
+        "ix_consumer_email_normalized",
+        "consumers",
+        [sa.text("lower(trim(email))")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop the normalized consumer email index."""
+    op.drop_index("ix_consumer_email_normalized", table_name="consumers")
@@ -0,0 +1,40 @@
+"""working_hours_time_ranges_json
+
+Revision ID: c7f2a9d4e1b3
+Revises: b6e1d4a8f2c7
+Create Date: 2025-11-23 15:22:08.731642
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7f2a9d4e1b3"
+down_revision: Union[str, Sequence[str], None] = "b6e1d4a8f2c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Store working_hours.time_ranges as a JSON column."""
+    with op.batch_alter_table("working_hours", schema=None) as batch_op:
+        batch_op.alter_column(
+            "time_ranges",
+            existing_type=sa.Text(),
+            type_=sa.JSON(),
+            postgresql_using="time_ranges::json",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Store working_hours.time_ranges as text."""
+    with op.batch_alter_table("working_hours", schema=None) as batch_op:
+        batch_op.alter_column(
+            "time_ranges",
+            existing_type=sa.JSON(),
+            type_=sa.Text(),
+        )
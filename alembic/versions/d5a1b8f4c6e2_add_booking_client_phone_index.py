@@ -0,0 +1,31 @@
+"""add_booking_client_phone_index
+
+Revision ID: d5a1b8f4c6e2
+Revises: c4f9a2e7b5d1
+Create Date: 2025-11-26 15:12:38.660914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a1b8f4c6e2"
+down_revision: Union[str, Sequence[str], None] = "c4f9a2e7b5d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Index bookings.client_phone for legacy booking matching."""
+    op.create_index(
+        op.f("ix_bookings_client_phone"), "bookings", ["client_phone"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop the bookings.client_phone index."""
+    op.drop_index(op.f("ix_bookings_client_phone"), table_name="bookings")
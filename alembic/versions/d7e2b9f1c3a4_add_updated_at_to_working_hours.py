@@ -0,0 +1,31 @@
+"""add_updated_at_to_working_hours
+
+Revision ID: d7e2b9f1c3a4
+Revises: c4d1a7e3f5b2
+Create Date: 2025-11-21 10:02:55.418903
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e2b9f1c3a4"
+down_revision: Union[str, Sequence[str], None] = "c4d1a7e3f5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add updated_at column to working_hours table."""
+    with op.batch_alter_table("working_hours", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove updated_at column from working_hours table."""
+    with op.batch_alter_table("working_hours", schema=None) as batch_op:
+        batch_op.drop_column("updated_at")
@@ -0,0 +1,49 @@
+"""scheduling_preferences_timestamp_defaults
+
+Revision ID: d8a3f6c2b9e5
+Revises: c7f2a9d4e1b3
+Create Date: 2025-11-24 11:08:36.902417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a3f6c2b9e5"
+down_revision: Union[str, Sequence[str], None] = "c7f2a9d4e1b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Default scheduling_preferences timestamps to the database clock."""
+    with op.batch_alter_table("scheduling_preferences", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove scheduling_preferences timestamp server defaults."""
+    with op.batch_alter_table("scheduling_preferences", schema=None) as batch_op:
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
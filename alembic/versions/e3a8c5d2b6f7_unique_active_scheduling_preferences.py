@@ -0,0 +1,61 @@
+"""unique_active_scheduling_preferences
+
+Revision ID: e3a8c5d2b6f7
+Revises: d7e2b9f1c3a4
+Create Date: 2025-11-21 16:47:13.250871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a8c5d2b6f7"
+down_revision: Union[str, Sequence[str], None] = "d7e2b9f1c3a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Enforce one active scheduling_preferences row per specialist."""
+    # The old insert-always path could leave several active rows per specialist;
+    # keep the newest and deactivate the rest so the unique index can be built
+    preferences = sa.table(
+        "scheduling_preferences",
+        sa.column("id", sa.Integer),
+        sa.column("specialist_id", sa.Integer),
+        sa.column("is_active", sa.Boolean),
+    )
+    newest_active = (
+        sa.select(sa.func.max(preferences.c.id))
+        .where(preferences.c.is_active == sa.true())
+        .group_by(preferences.c.specialist_id)
+    )
+    op.execute(
+        preferences.update()
+        .where(
+            preferences.c.is_active == sa.true(),
+            preferences.c.id.not_in(newest_active),
+        )
+        .values(is_active=False)
+    )
+
+    op.create_index(
+        "uq_scheduling_preferences_specialist_active",
+        "scheduling_preferences",
+        ["specialist_id"],
+        unique=True,
+        sqlite_where=sa.text("is_active = 1"),
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop the active scheduling_preferences unique index."""
+    op.drop_index(
+        "uq_scheduling_preferences_specialist_active",
+        table_name="scheduling_preferences",
+    )
@@ -0,0 +1,36 @@
+"""add_active_workplace_membership_index
+
+Revision ID: e6b2c9d5f7a3
+Revises: d5a1b8f4c6e2
+Create Date: 2025-11-26 16:40:55.318027
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b2c9d5f7a3"
+down_revision: Union[str, Sequence[str], None] = "d5a1b8f4c6e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add partial index for active specialists per workplace."""
+    op.create_index(
+        "ix_spec_workplace_wp_active",
+        "specialist_workplace",
+        ["workplace_id"],
+        unique=False,
+        sqlite_where=sa.text("is_active = 1"),
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop the active workplace membership index."""
+    op.drop_index("ix_spec_workplace_wp_active", table_name="specialist_workplace")
@@ -0,0 +1,81 @@
+"""unique_confirmed_booking_slot
+
+Revision ID: f1c6d9b3a2e8
+Revises: d8a3f6c2b9e5
+Create Date: 2025-11-25 14:22:41.508312
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c6d9b3a2e8"
+down_revision: Union[str, Sequence[str], None] = "d8a3f6c2b9e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Allow one confirmed booking per specialist start time."""
+    # Double bookings from the race this index closes may already exist; they
+    # are customer appointments, so the upgrade stops and reports them for
+    # manual resolution instead of picking a winner
+    bookings = sa.table(
+        "bookings",
+        sa.column("id", sa.Integer),
+        sa.column("specialist_id", sa.Integer),
+        sa.column("date", sa.Date),
+        sa.column("start_time", sa.Time),
+        sa.column("status", sa.String),
+    )
+    slot = (bookings.c.specialist_id, bookings.c.date, bookings.c.start_time)
+    duplicated_slots = (
+        sa.select(*slot)
+        .where(bookings.c.status == "confirmed", bookings.c.start_time.is_not(None))
+        .group_by(*slot)
+        .having(sa.func.count() > 1)
+        .subquery()
+    )
+    rows = op.get_bind().execute(
+        sa.select(bookings.c.id, *slot)
+        .join(
+            duplicated_slots,
+            sa.and_(
+                bookings.c.specialist_id == duplicated_slots.c.specialist_id,
+                bookings.c.date == duplicated_slots.c.date,
+                bookings.c.start_time == duplicated_slots.c.start_time,
+            ),
+        )
+        .where(bookings.c.status == "confirmed")
+        .order_by(*slot, bookings.c.id)
+    )
+    duplicates = {}
+    for booking_id, specialist_id, day, start_time in rows:
+        duplicates.setdefault((specialist_id, day, start_time), []).append(booking_id)
+    if duplicates:
+        report = "; ".join(
+            f"specialist {specialist_id} on {day} at {start_time}: bookings {ids}"
+            for (specialist_id, day, start_time), ids in duplicates.items()
+        )
+        raise RuntimeError(
+            "Confirmed bookings share a slot; cancel or move all but one per "
+            f"slot and re-run the upgrade. {report}"
+        )
+
+    op.create_index(
+        "uq_booking_confirmed_slot",
+        "bookings",
+        ["specialist_id", "date", "start_time"],
+        unique=True,
+        sqlite_where=sa.text("status = 'confirmed'"),
+        postgresql_where=sa.text("status = 'confirmed'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop the confirmed booking slot unique index."""
+    op.drop_index("uq_booking_confirmed_slot", table_name="bookings")
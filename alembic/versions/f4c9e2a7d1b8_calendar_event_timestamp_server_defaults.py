@@ -0,0 +1,49 @@
+"""calendar_event_timestamp_server_defaults
+
+Revision ID: f4c9e2a7d1b8
+Revises: e3a8c5d2b6f7
+Create Date: 2025-11-21 18:05:41.263517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4c9e2a7d1b8"
+down_revision: Union[str, Sequence[str], None] = "e3a8c5d2b6f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Default calendar_events timestamps to the database clock."""
+    with op.batch_alter_table("calendar_events", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove calendar_events timestamp server defaults."""
+    with op.batch_alter_table("calendar_events", schema=None) as batch_op:
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
@@ -8,7 +8,14 @@ and security dependencies for protecting API endpoints.
 from __future__ import annotations
 from typing import Optional
 from datetime import datetime, timedelta
+import base64
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
 import jwt
+import orjson
 from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
@@ -29,6 +36,49 @@ ACCESS_TOKEN_EXPIRE_HOURS = settings.ACCESS_TOKEN_EXPIRE_HOURS
 # Security
 security = HTTPBearer(auto_error=False)
 
+# HS256 tokens share one header, so its encoded segment is built once
+_HS256_SIGNING_PREFIX = (
+    base64.urlsafe_b64encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+    .rstrip(b"=")
+    + b"."
+)
+
+# Verified token payloads, keyed by a digest of the token (never the raw token):
+# digest -> (cached_at, payload). Only the signature check is cached; the
+# specialist itself is always read from the database. Sync dependencies run in
+# the threadpool, so every access holds the lock.
+AUTH_CACHE_TTL_SECONDS = 30
+AUTH_CACHE_MAX_ENTRIES = 10000
+_auth_cache: OrderedDict = OrderedDict()
+_auth_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_auth_cache_entry(token: str) -> Optional[tuple]:
+    key = _token_cache_key(token)
+    with _auth_cache_lock:
+        entry = _auth_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > AUTH_CACHE_TTL_SECONDS:
+            del _auth_cache[key]
+            return None
+        _auth_cache.move_to_end(key)
+        return entry
+
+
+def _set_auth_cache_entry(token: str, payload: dict):
+    key = _token_cache_key(token)
+    with _auth_cache_lock:
+        _auth_cache[key] = (time.monotonic(), payload)
+        _auth_cache.move_to_end(key)
+        # Evict least recently used entries
+        while len(_auth_cache) > AUTH_CACHE_MAX_ENTRIES:
+            _auth_cache.popitem(last=False)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -42,19 +92,41 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         Encoded JWT token string
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
-
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    if JWT_ALGORITHM != "HS256":
+        if expires_delta:
+            expire = datetime.utcnow() + expires_delta
+        else:
+            expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
+
+        to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+        return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+
+    # Same claims PyJWT would produce (integer timestamps), but only the
+    # payload segment is serialized per call
+    now = int(time.time())
+    lifetime = expires_delta or timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
+    to_encode.update({"exp": now + int(lifetime.total_seconds()), "iat": now})
+    signing_input = _HS256_SIGNING_PREFIX + base64.urlsafe_b64encode(
+        orjson.dumps(to_encode)
+    ).rstrip(b"=")
+    signature = hmac.new(
+        JWT_SECRET_KEY.encode(), signing_input, hashlib.sha256
+    ).digest()
+    token = (
+        signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")
+    ).decode()
+
+    # Prime the verification cache so the first authenticated request skips
+    # the decode
+    _set_auth_cache_entry(token, to_encode)
+    return token
 
 
 def verify_token(token: str) -> Optional[dict]:
     """
     Verify JWT token and return payload.
+    Verified payloads are cached briefly by token digest; expiry is re-checked
+    on every call.
 
     Args:
         token: JWT token string to verify
@@ -62,11 +134,21 @@ def verify_token(token: str) -> Optional[dict]:
     Returns:
         Decoded payload dict if valid, None if invalid
     """
-    try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        return payload
-    except jwt.PyJWTError:
+    entry = _get_auth_cache_entry(token)
+    if entry is not None:
+        payload = entry[1]
+    else:
+        try:
+            payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        except jwt.PyJWTError:
+            return None
+        _set_auth_cache_entry(token, payload)
+
+    # A cached payload may have outlived its token
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
         return None
+    return payload
 
 
 def get_current_specialist(request: Request, db: Session):
@@ -80,6 +162,11 @@ def get_current_specialist(request: Request, db: Session):
     Returns:
         Specialist object if authenticated, None otherwise
     """
+    # Reuse the specialist if a dependency already resolved it this request
+    cached = getattr(request.state, "current_specialist", None)
+    if cached is not None:
+        return cached
+
     # Import here to avoid circular imports
     try:
         from .database import Specialist, get_db
@@ -99,8 +186,50 @@ def get_current_specialist(request: Request, db: Session):
     if not specialist_id:
         return None
 
-    # Fetch specialist with services eagerly loaded
-    specialist = db.query(Specialist).filter(Specialist.id == specialist_id).first()
+    # Always the live row, so edits and deletes take effect immediately
+    specialist = db.get(Specialist, specialist_id)
+
+    if specialist:
+        request.state.current_specialist = specialist
+        request.state.specialist_id = specialist.id
+    return specialist
+
+
+async def get_current_specialist_async(request: Request):
+    """
+    Async variant of get_current_specialist for handlers running on the event loop.
+    Reads through the shared `databases` connection so no threadpool hop is needed.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        Specialist row (attribute access) if authenticated, None otherwise
+    """
+    # Import here to avoid circular imports
+    try:
+        from .database import Specialist, database
+    except ImportError:
+        from database import Specialist, database
+    from sqlalchemy import select
+
+    token = request.cookies.get("access_token")
+    if not token:
+        return None
+
+    payload = verify_token(token)
+    if not payload:
+        return None
+
+    specialist_id = payload.get("specialist_id")
+    if not specialist_id:
+        return None
+
+    specialist = await database.fetch_one(
+        select(Specialist.__table__).where(Specialist.id == specialist_id)
+    )
+    if specialist:
+        request.state.specialist_id = specialist.id
     return specialist
 
 
@@ -124,6 +253,8 @@ def require_authentication(request: Request, db: Session):
             status_code=401,
             detail="Authentication required. Please sign in to access professional features.",
         )
+    # Remember the identity for the rest of the request
+    request.state.specialist_id = specialist.id
     return specialist
 
 
@@ -158,3 +289,47 @@ def require_authentication_dep(request: Request, db: Session = Depends(get_db)):
         HTTPException: If authentication fails
     """
     return require_authentication(request, db)
+
+
+def get_current_specialist_id(request: Request, db: Session = Depends(get_db)) -> int:
+    """
+    Dependency that resolves the authenticated specialist's ID.
+    Use this instead of require_authentication_dep when a handler only needs the ID
+    (e.g. for ownership checks): it confirms the specialist still exists with a
+    primary-key lookup on the request's session, without hydrating the row.
+
+    Args:
+        request: FastAPI request object
+        db: Database session (auto-injected by FastAPI)
+
+    Returns:
+        Authenticated specialist ID from the request state or the access token
+
+    Raises:
+        HTTPException: If authentication fails
+    """
+    # Only set once a dependency has loaded the specialist this request
+    specialist_id = getattr(request.state, "specialist_id", None)
+    if specialist_id is not None:
+        return specialist_id
+
+    # Import here to avoid circular imports
+    try:
+        from .database import Specialist
+    except ImportError:
+        from database import Specialist
+
+    token = request.cookies.get("access_token")
+    payload = verify_token(token) if token else None
+    specialist_id = payload.get("specialist_id") if payload else None
+    # A valid token for a deleted specialist must not keep write access
+    if not specialist_id or not (
+        db.query(Specialist.id).filter(Specialist.id == specialist_id).first()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Authentication required. Please sign in to access professional features.",
+        )
+
+    request.state.specialist_id = specialist_id
+    return specialist_id
@@ -23,6 +23,9 @@ class Settings:
     # Database settings
     DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")
 
+    # Redis settings (optional - verification codes fall back to the database)
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+
     # Application settings
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
@@ -3,6 +3,7 @@ Database configuration and models for the calendar app
 """
 
 import databases
+import orjson
 import sqlalchemy
 from sqlalchemy import (
     create_engine,
@@ -18,8 +19,11 @@ from sqlalchemy import (
     Date,
     Time,
     Text,
+    JSON,
 )
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
 from typing import List
 
@@ -27,10 +31,32 @@ from typing import List
 DATABASE_URL = "sqlite:///./calendar_app.db"
 
 # SQLAlchemy setup
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,  # Detect stale connections before handing them out
+    pool_recycle=1800,
+    pool_timeout=5,  # Fail fast instead of queueing on an exhausted pool
+    # JSON columns are encoded/decoded with orjson (handles time/datetime)
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Async engine/session for read-heavy endpoints declared `async def`, so their
+# I/O doesn't tie up a threadpool worker (aiosqlite here, asyncpg on PostgreSQL)
+ASYNC_DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 # Database instance for async operations
 database = databases.Database(DATABASE_URL)
 
@@ -47,9 +73,29 @@ specialist_workplace_association = Table(
     Column("is_active", Boolean, default=True),
     Column("created_at", DateTime, default=datetime.utcnow),
     Column("updated_at", DateTime, default=datetime.utcnow, onupdate=datetime.utcnow),
+    # ✅ Active memberships by workplace (the primary key leads with specialist_id)
+    sqlalchemy.Index(
+        "ix_spec_workplace_wp_active",
+        "workplace_id",
+        sqlite_where=sqlalchemy.text("is_active = 1"),
+        postgresql_where=sqlalchemy.text("is_active"),
+    ),
 )
 
 
+def trigram_index(name: str, column: str) -> sqlalchemy.Index:
+    """
+    GIN trigram index so ILIKE '%term%' searches on the column can use an index.
+    PostgreSQL only (needs the pg_trgm extension); skipped on other dialects.
+    """
+    return sqlalchemy.Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
 # SQLAlchemy Models
 class Workplace(Base):
     __tablename__ = "workplaces"
@@ -76,6 +122,59 @@ class Workplace(Base):
         back_populates="workplaces",
     )
 
+    # ✅ Trigram indexes for the business search ILIKE filters
+    __table_args__ = (
+        trigram_index("ix_workplace_name_trgm", "name"),
+        trigram_index("ix_workplace_description_trgm", "description"),
+        trigram_index("ix_workplace_city_trgm", "city"),
+        trigram_index("ix_workplace_state_trgm", "state"),
+        trigram_index("ix_workplace_address_trgm", "address"),
+    )
+
+    @hybrid_property
+    def specialists_count(self):
+        # A count selected alongside the row takes precedence, so converting
+        # the instance to a response doesn't lazy load the collection
+        count = self.__dict__.get("_specialists_count")
+        return len(self.specialists) if count is None else count
+
+    @specialists_count.setter
+    def specialists_count(self, value):
+        self._specialists_count = value
+
+    @specialists_count.expression
+    def specialists_count(cls):
+        # Correlated scalar subquery, so queries can select the count alongside
+        # the workplace without loading the specialists collection
+        assoc = specialist_workplace_association
+        return (
+            sqlalchemy.select(sqlalchemy.func.count(assoc.c.specialist_id))
+            .where(assoc.c.workplace_id == cls.id)
+            .correlate(cls)
+            .scalar_subquery()
+        )
+
+
+def workplace_search_vector():
+    """
+    English tsvector over a workplace's name and description. Queries must use
+    this exact expression to be served by ix_workplace_fts (PostgreSQL only).
+    """
+    return sqlalchemy.func.to_tsvector(
+        sqlalchemy.literal_column("'english'"),
+        sqlalchemy.func.coalesce(Workplace.name, sqlalchemy.literal_column("''"))
+        + sqlalchemy.literal_column("' '")
+        + sqlalchemy.func.coalesce(
+            Workplace.description, sqlalchemy.literal_column("''")
+        ),
+    )
+
+
+# ✅ Full-text index for multi-word business search
+sqlalchemy.Index(
+    "ix_workplace_fts", workplace_search_vector(), postgresql_using="gin"
+).ddl_if(dialect="postgresql")
+
 
 class Specialist(Base):
     __tablename__ = "specialists"
@@ -100,6 +199,25 @@ class Specialist(Base):
         secondary=specialist_workplace_association,
         back_populates="specialists",
     )
+    # Read-only view of workplaces with an active association (eager-loadable)
+    active_workplaces = relationship(
+        "Workplace",
+        secondary=specialist_workplace_association,
+        primaryjoin=lambda: (
+            (Specialist.id == specialist_workplace_association.c.specialist_id)
+            & (specialist_workplace_association.c.is_active == True)
+        ),
+        secondaryjoin=lambda: (
+            specialist_workplace_association.c.workplace_id == Workplace.id
+        ),
+        viewonly=True,
+    )
+
+    # ✅ Trigram indexes for the professional search ILIKE filters
+    __table_args__ = (
+        trigram_index("ix_specialist_name_trgm", "name"),
+        trigram_index("ix_specialist_bio_trgm", "bio"),
+    )
 
 
 class ServiceDB(Base):
@@ -115,6 +233,9 @@ class ServiceDB(Base):
     specialist = relationship("Specialist", back_populates="services")
     bookings = relationship("Booking", back_populates="service")
 
+    # ✅ Trigram index for service-name search
+    __table_args__ = (trigram_index("ix_service_name_trgm", "name"),)
+
 
 class AvailabilitySlot(Base):
     __tablename__ = "availability_slots"
@@ -129,6 +250,13 @@ class AvailabilitySlot(Base):
     # Relationships
     specialist = relationship("Specialist", back_populates="availability_slots")
 
+    # ✅ Composite index for per-day availability lookups
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_avail_spec_date_avail", "specialist_id", "date", "is_available"
+        ),
+    )
+
 
 class Consumer(Base):
     __tablename__ = "consumers"
@@ -146,6 +274,13 @@ class Consumer(Base):
     bookings = relationship("Booking", back_populates="consumer")
     referrals = relationship("Referral", back_populates="consumer")
 
+    # ✅ Expression index for case-insensitive email matching
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_consumer_email_normalized", sqlalchemy.text("lower(trim(email))")
+        ),
+    )
+
 
 class Referral(Base):
     __tablename__ = "referrals"
@@ -190,7 +325,7 @@ class Booking(Base):
     # Legacy fields - keep for backward compatibility
     client_name = Column(String, index=True)  # ✅ Indexed for search
     client_email = Column(String, index=True)  # ✅ Indexed for lookup
-    client_phone = Column(String)
+    client_phone = Column(String, index=True)  # ✅ Indexed for legacy matching
 
     date = Column(Date, index=True)  # ✅ Indexed for date queries
     start_time = Column(Time)
@@ -203,6 +338,41 @@ class Booking(Base):
     service = relationship("ServiceDB", back_populates="bookings")
     consumer = relationship("Consumer", back_populates="bookings")
 
+    # ✅ Composite index for per-day conflict checks and slot generation
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_booking_spec_date_status", "specialist_id", "date", "status"
+        ),
+        # One confirmed booking per start time, so racing inserts can't both win
+        sqlalchemy.Index(
+            "uq_booking_confirmed_slot",
+            "specialist_id",
+            "date",
+            "start_time",
+            unique=True,
+            sqlite_where=sqlalchemy.text("status = 'confirmed'"),
+            postgresql_where=sqlalchemy.text("status = 'confirmed'"),
+        ),
+    )
+
+    # Appointment session summary - lets booking list responses be built
+    # straight from the ORM row (requires `sessions` to be loaded)
+    @property
+    def session_id(self):
+        return self.sessions[0].id if self.sessions else None
+
+    @property
+    def session_started(self):
+        return self.sessions[0].actual_start if self.sessions else None
+
+    @property
+    def session_ended(self):
+        return self.sessions[0].actual_end if self.sessions else None
+
+    @property
+    def actual_duration(self):
+        return self.sessions[0].actual_duration_minutes if self.sessions else None
+
 
 class AppointmentSession(Base):
     """
@@ -304,8 +474,11 @@ class CalendarEvent(Base):
     )  # 'tentative', 'confirmed', 'cancelled'
     visibility = Column(String, default="public")  # 'public', 'private'
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    # Stamped by the database so bulk inserts don't bind two timestamps per row
+    created_at = Column(DateTime, server_default=sqlalchemy.func.now())
+    updated_at = Column(
+        DateTime, server_default=sqlalchemy.func.now(), onupdate=sqlalchemy.func.now()
+    )
 
     # For recurring event management
     recurring_event_id = Column(String, nullable=True)  # Groups recurring instances
@@ -316,6 +489,29 @@ class CalendarEvent(Base):
     workplace = relationship("Workplace")
     event_exceptions = relationship("EventException", back_populates="event")
 
+    __table_args__ = (
+        # ✅ Composite index for time-range overlap queries per specialist
+        sqlalchemy.Index(
+            "ix_calevent_spec_time", "specialist_id", "end_datetime", "start_datetime"
+        ),
+        # ✅ Active events per specialist in start order (calendar listing)
+        sqlalchemy.Index(
+            "ix_cal_specialist_active_range",
+            "specialist_id",
+            "is_active",
+            "start_datetime",
+            "end_datetime",
+        ),
+        # ✅ Recurring series lookup (recurring schedules listing)
+        sqlalchemy.Index(
+            "ix_cal_recurring_lookup",
+            "specialist_id",
+            "is_recurring",
+            "is_active",
+            "recurring_event_id",
+        ),
+    )
+
 
 class EventException(Base):
     __tablename__ = "event_exceptions"
@@ -336,6 +532,11 @@ class EventException(Base):
     # Relationships
     event = relationship("CalendarEvent", back_populates="event_exceptions")
 
+    __table_args__ = (
+        # ✅ Exception lookup per event occurrence date (calendar listing join)
+        sqlalchemy.Index("ix_event_exception_event_date", "event_id", "exception_date"),
+    )
+
 
 class WorkingHours(Base):
     __tablename__ = "working_hours"
@@ -347,7 +548,7 @@ class WorkingHours(Base):
     day_of_week = Column(Integer)
 
     # Time ranges (supports multiple ranges per day)
-    time_ranges = Column(Text)  # JSON array of {start_time, end_time} objects
+    time_ranges = Column(JSON)  # Array of {start_time, end_time, ...} objects
 
     # Working hours settings
     is_working_day = Column(Boolean, default=True)
@@ -360,6 +561,9 @@ class WorkingHours(Base):
     # Status
     is_active = Column(Boolean, default=True)
     effective_date = Column(Date)  # When these hours take effect
+    updated_at = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )  # Drives ETag validation on reads
 
     # Relationships
     specialist = relationship("Specialist", back_populates="working_hours")
@@ -407,12 +611,51 @@ class SchedulingPreferences(Base):
 
     # Status
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime, server_default=sqlalchemy.func.now())
+    updated_at = Column(
+        DateTime, server_default=sqlalchemy.func.now(), onupdate=sqlalchemy.func.now()
+    )
 
     # Relationships
     specialist = relationship("Specialist", back_populates="scheduling_preferences")
 
+    # One active preferences row per specialist (UPSERT conflict target)
+    __table_args__ = (
+        sqlalchemy.Index(
+            "uq_scheduling_preferences_specialist_active",
+            "specialist_id",
+            unique=True,
+            sqlite_where=sqlalchemy.text("is_active = 1"),
+            postgresql_where=sqlalchemy.text("is_active"),
+        ),
+    )
+
+
+class SpecialistDayAvailability(Base):
+    """
+    Materialized per-(specialist, date) availability summary.
+    Rebuilt on booking/availability writes so read paths such as the consumer
+    catalog can answer "which dates are bookable" with a single indexed lookup.
+    """
+
+    __tablename__ = "specialist_day_availability"
+
+    specialist_id = Column(Integer, ForeignKey("specialists.id"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    has_free_slots = Column(Boolean, default=False, nullable=False)
+    slot_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    specialist = relationship("Specialist")
+
+    # Catalog reads scan future dates that still have free slots
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_specialist_day_availability_date_free", "date", "has_free_slots"
+        ),
+    )
+
 
 class VerificationCode(Base):
     __tablename__ = "verification_codes"
@@ -503,6 +746,18 @@ class ClientContactChangeLog(Base):
 # Base.metadata.create_all(bind=engine)
 
 
+def dialect_insert(session, table):
+    """
+    Return an INSERT construct for the session's dialect that supports
+    ON CONFLICT (upsert) clauses on both SQLite and PostgreSQL.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
+
 # Dependency to get DB session
 def get_db():
     db = SessionLocal()
@@ -510,3 +765,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get an async DB session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
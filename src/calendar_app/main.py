@@ -3,21 +3,45 @@ poetry run uvicorn main:app --reload
 """
 
 from __future__ import annotations
-from typing import Union, List, Optional
+from typing import Union, List, Tuple, Optional, Iterator
 from datetime import date, time, datetime, timedelta, timezone
+import asyncio
 import secrets
+import bisect
+import heapq
+import uuid
+from functools import lru_cache
+import hashlib
 import json
 import re
+import orjson
 from contextlib import asynccontextmanager
 
 # Note: dateutil will need to be installed: pip install python-dateutil
 try:
-    from dateutil.rrule import rrule, DAILY, WEEKLY
+    from dateutil.rrule import rrule, MINUTELY, DAILY, WEEKLY
     from dateutil.rrule import MO, TU, WE, TH, FR, SA, SU
 
     DATEUTIL_AVAILABLE = True
 except ImportError:
     DATEUTIL_AVAILABLE = False
+
+# Optional: numpy vectorizes slot generation for long availability windows
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: Redis caches read-heavy workplace listings when REDIS_URL is configured
+try:
+    import redis
+    import redis.asyncio as redis_asyncio
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 from fastapi import (
     FastAPI,
     Depends,
@@ -30,21 +54,33 @@ from fastapi import (
     File,
     Body,
 )
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.responses import (
+    HTMLResponse,
+    RedirectResponse,
+    ORJSONResponse,
+)
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, insert, literal_column, or_, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.event import listens_for
 import jwt
 import csv
 import io
 
 from .database import (
     get_db,
+    get_async_db,
+    SessionLocal,
+    dialect_insert,
+    workplace_search_vector,
     Specialist,
     ServiceDB,
     AvailabilitySlot,
@@ -62,6 +98,7 @@ from .database import (
     ClientProfile,
     ClientContactChangeLog,
     AppointmentSession,
+    SpecialistDayAvailability,
 )
 from .verification_service import verification_service
 from .yelp_service import yelp_service, YelpAPIError
@@ -141,10 +178,11 @@ from .auth import (
     security,
     create_access_token,
     verify_token,
-    get_current_specialist,
     require_authentication,
     get_current_specialist_dep,
     require_authentication_dep,
+    get_current_specialist_id,
+    get_current_specialist_async,
 )
 from .config import settings
 
@@ -154,6 +192,13 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events."""
     # Startup: Initialize database connection
     await database.connect()
+    # Specialists scheduled before the summary table existed get their rows
+    # built once here, so the catalog read path never writes
+    try:
+        with SessionLocal() as db:
+            backfill_day_availability(db)
+    except Exception as e:
+        print(f"Error backfilling day availability: {e}")
     yield
     # Shutdown: Close database connection
     await database.disconnect()
@@ -186,6 +231,7 @@ app = FastAPI(
     docs_url="/api/docs",  # Better URL structure
     redoc_url="/api/redoc",  # Better URL structure
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Élite Scheduling Support",
         "email": "support@elitescheduling.com",
@@ -202,8 +248,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Calendar event paging
 )
 
+# Compress larger JSON payloads (availability lists, catalog, client lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 import os
 from pathlib import Path
 
@@ -211,13 +261,109 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 
-# Mount static files
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+STATIC_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+STATIC_DEFAULT_CACHE_CONTROL = "public, max-age=300"
+# Content-hashed build output, e.g. main.3f9a1c2e.js
+STATIC_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with explicit Cache-Control. Only content-hashed filenames are
+    cached for a year; everything else (including hand-versioned ``?v=`` URLs,
+    whose module imports aren't versioned) is cached briefly, then revalidated
+    through the ETag/Last-Modified headers Starlette already sends.
+    """
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = (
+                STATIC_IMMUTABLE_CACHE_CONTROL
+                if STATIC_HASHED_NAME.search(path)
+                else STATIC_DEFAULT_CACHE_CONTROL
+            )
+        return response
+
+
+# Mount static files (in production, serve /static from the reverse proxy)
+app.mount(
+    "/static", CachedStaticFiles(directory=str(BASE_DIR / "static")), name="static"
+)
+
+
+# HTTP Caching Helpers
+
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the values that determine a response body."""
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def content_etag(body: bytes) -> str:
+    """Build a strong ETag from a serialized response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header already has this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in [tag.strip() for tag in if_none_match.split(",")] or (
+        if_none_match.strip() == "*"
+    )
 
 
 # Advanced Calendar Management Helper Functions
 
 
+@lru_cache(maxsize=1024)
+def build_rrule(
+    freq: str,
+    interval: int,
+    dtstart: datetime,
+    until: Optional[datetime] = None,
+    count: Optional[int] = None,
+    byweekday: Tuple[int, ...] = (),
+    bymonthday: Tuple[int, ...] = (),
+    bymonth: Tuple[int, ...] = (),
+):
+    """
+    Build (and memoize) a dateutil rrule for a recurrence definition.
+    Rules are immutable, so one compiled rule with its occurrence cache is
+    shared by every caller asking for the same series.
+    """
+    # Map frequency strings to dateutil constants
+    freq_map = {"DAILY": DAILY, "WEEKLY": WEEKLY}
+
+    # Map weekday integers to dateutil weekday objects
+    weekday_map = {0: MO, 1: TU, 2: WE, 3: TH, 4: FR, 5: SA, 6: SU}
+
+    rrule_params = {
+        "freq": freq_map.get(freq, WEEKLY),
+        "interval": interval,
+        "dtstart": dtstart,
+        "cache": True,
+    }
+    if until:
+        rrule_params["until"] = until
+    if count:
+        rrule_params["count"] = count
+    # Add weekday, month day and month restrictions
+    if byweekday:
+        rrule_params["byweekday"] = [weekday_map[day] for day in byweekday]
+    if bymonthday:
+        rrule_params["bymonthday"] = list(bymonthday)
+    if bymonth:
+        rrule_params["bymonth"] = list(bymonth)
+
+    return rrule(**rrule_params)
+
+
 def generate_instances_for_range(
     db: Session,
     base_event: CalendarEvent,
@@ -228,118 +374,110 @@ def generate_instances_for_range(
     """
     Generate instances for a specific date range only (lazy loading).
     Only creates instances that don't already exist.
+    Rows are inserted in the caller's transaction; the caller commits.
     """
     if not DATEUTIL_AVAILABLE:
         print(f"[generate_instances_for_range] dateutil not available, skipping")
         return
 
-    # Map frequency strings to dateutil constants
-    freq_map = {"DAILY": DAILY, "WEEKLY": WEEKLY}
-    weekday_map = {0: MO, 1: TU, 2: WE, 3: TH, 4: FR, 5: SA, 6: SU}
-
-    # Extract the time of day from base_event to apply to all occurrences
-    base_time = base_event.start_datetime.time()
-
-    # Build rrule parameters - restricted to the requested range
-    # Use range_start but with the base event's time
-    dtstart = datetime.combine(range_start.date(), base_time)
-    if dtstart < range_start:
-        dtstart = range_start
-    if dtstart < base_event.start_datetime:
-        dtstart = base_event.start_datetime
-
-    rrule_params = {
-        "freq": freq_map.get(recurrence_rule.freq, WEEKLY),
-        "interval": recurrence_rule.interval,
-        "dtstart": dtstart,
-    }
-
-    # End at the earlier of: recurrence end, requested range end
+    # Anchor the rule at the base event so it is shared (and cached) across
+    # ranges, then only iterate the requested window
+    window_start = max(range_start, base_event.start_datetime)
+    window_end = range_end
+    until = None
     if recurrence_rule.until:
-        rrule_params["until"] = min(
-            datetime.combine(recurrence_rule.until, time.max), range_end
-        )
-    else:
-        rrule_params["until"] = range_end
-
-    # Add weekday restrictions
-    if recurrence_rule.byweekday:
-        rrule_params["byweekday"] = [
-            weekday_map[day] for day in recurrence_rule.byweekday
-        ]
+        until = datetime.combine(recurrence_rule.until, time.max)
+        window_end = min(until, range_end)
 
     # Generate occurrence dates
     try:
-        rule = rrule(**rrule_params)
-        occurrences = list(rule)
+        rule = build_rrule(
+            recurrence_rule.freq,
+            recurrence_rule.interval,
+            base_event.start_datetime,
+            until=until,
+            byweekday=tuple(recurrence_rule.byweekday or ()),
+        )
+        occurrences = rule.between(window_start, window_end, inc=True)
     except Exception as e:
         # Log error but don't fail silently
         return
 
+    if not occurrences:
+        return
+
     # Create event instances (skip if already exists)
     duration = base_event.end_datetime - base_event.start_datetime
     created_count = 0
+    instance_rows = []
+    window_start = occurrences[0]
+    window_end = occurrences[-1] + duration
+
+    # Existing instances and potential conflicts for the whole range, once
+    existing_starts = {
+        start
+        for (start,) in db.query(CalendarEvent.start_datetime).filter(
+            CalendarEvent.recurring_event_id == base_event.recurring_event_id,
+            CalendarEvent.is_recurring == False,
+            CalendarEvent.start_datetime >= window_start,
+            CalendarEvent.start_datetime <= occurrences[-1],
+        )
+    }
+    conflict_index = load_conflict_index(
+        db,
+        base_event.specialist_id,
+        window_start,
+        window_end,
+        exclude_event_id=base_event.id,
+    )
 
     for occurrence_start in occurrences:
         occurrence_end = occurrence_start + duration
 
-        # Check if this instance already exists
-        existing = (
-            db.query(CalendarEvent)
-            .filter(
-                CalendarEvent.recurring_event_id == base_event.recurring_event_id,
-                CalendarEvent.start_datetime == occurrence_start,
-                CalendarEvent.is_recurring == False,
-            )
-            .first()
-        )
-
-        if existing:
+        if occurrence_start in existing_starts:
             # Instance already exists, skip
             continue
 
         # Check for conflicts with other events
-        if has_calendar_conflict(
-            db,
-            base_event.specialist_id,
-            occurrence_start,
-            occurrence_end,
-            exclude_event_id=base_event.id,
-        ):
+        if has_conflict_in_index(conflict_index, occurrence_start, occurrence_end):
             continue
 
         # Create new instance
-        db_instance = CalendarEvent(
-            specialist_id=base_event.specialist_id,
-            workplace_id=base_event.workplace_id,
-            title=base_event.title,
-            description=base_event.description,
-            location=base_event.location,
-            start_datetime=occurrence_start,
-            end_datetime=occurrence_end,
-            is_all_day=base_event.is_all_day,
-            timezone=base_event.timezone,
-            event_type=base_event.event_type,
-            category=base_event.category,
-            priority=base_event.priority,
-            color=base_event.color,
-            is_bookable=base_event.is_bookable,
-            max_bookings=base_event.max_bookings,
-            buffer_before=base_event.buffer_before,
-            buffer_after=base_event.buffer_after,
-            is_recurring=False,  # Individual instances are not recurring
-            status=base_event.status,
-            visibility=base_event.visibility,
-            recurring_event_id=base_event.recurring_event_id,
-            original_start=occurrence_start,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+        instance_rows.append(
+            dict(
+                specialist_id=base_event.specialist_id,
+                workplace_id=base_event.workplace_id,
+                title=base_event.title,
+                description=base_event.description,
+                location=base_event.location,
+                start_datetime=occurrence_start,
+                end_datetime=occurrence_end,
+                is_all_day=base_event.is_all_day,
+                timezone=base_event.timezone,
+                event_type=base_event.event_type,
+                category=base_event.category,
+                priority=base_event.priority,
+                color=base_event.color,
+                is_bookable=base_event.is_bookable,
+                max_bookings=base_event.max_bookings,
+                buffer_before=base_event.buffer_before,
+                buffer_after=base_event.buffer_after,
+                is_recurring=False,  # Individual instances are not recurring
+                status=base_event.status,
+                visibility=base_event.visibility,
+                recurring_event_id=base_event.recurring_event_id,
+                original_start=occurrence_start,
+            )
         )
-        db.add(db_instance)
         created_count += 1
 
     if created_count > 0:
-        db.commit()
+        # Plain mappings go straight to an executemany INSERT - no ORM objects
+        db.bulk_insert_mappings(CalendarEvent, instance_rows)
+        if base_event.event_type == "availability":
+            refresh_day_availability(
+                db, base_event.specialist_id, [o.date() for o in occurrences]
+            )
 
 
 def extend_recurring_instances(db: Session):
@@ -411,6 +549,7 @@ def extend_recurring_instances(db: Session):
             )
             continue
 
+    db.commit()
     return extended_count
 
 
@@ -420,91 +559,83 @@ def generate_recurring_event_instances(
     """
     Generate instances of a recurring event based on sophisticated recurrence rules.
     Supports RFC 5545-like RRULE patterns for Google Calendar-level flexibility.
+    Rows are inserted in the caller's transaction; the caller commits.
     """
     if not DATEUTIL_AVAILABLE:
         # Fallback to simple recurring logic if dateutil is not available
         return generate_simple_recurring_instances(db, base_event, recurrence_rule)
 
-    # Map frequency strings to dateutil constants
-    freq_map = {"DAILY": DAILY, "WEEKLY": WEEKLY}
-
-    # Map weekday integers to dateutil weekday objects
-    weekday_map = {0: MO, 1: TU, 2: WE, 3: TH, 4: FR, 5: SA, 6: SU}
-
-    # Build rrule parameters
-    rrule_params = {
-        "freq": freq_map.get(recurrence_rule.freq, WEEKLY),
-        "interval": recurrence_rule.interval,
-        "dtstart": base_event.start_datetime,
-    }
-
     # Add end conditions
+    until = None
+    count = None
     if recurrence_rule.until:
-        rrule_params["until"] = datetime.combine(recurrence_rule.until, time.max)
+        until = datetime.combine(recurrence_rule.until, time.max)
     elif recurrence_rule.count:
-        rrule_params["count"] = recurrence_rule.count
+        count = recurrence_rule.count
     else:
         # Default to 2 years if no end specified
-        rrule_params["until"] = base_event.start_datetime + timedelta(days=730)
-
-    # Add weekday restrictions
-    if recurrence_rule.byweekday:
-        rrule_params["byweekday"] = [
-            weekday_map[day] for day in recurrence_rule.byweekday
-        ]
-
-    # Add month day restrictions
-    if recurrence_rule.bymonthday:
-        rrule_params["bymonthday"] = recurrence_rule.bymonthday
-
-    # Add month restrictions
-    if recurrence_rule.bymonth:
-        rrule_params["bymonth"] = recurrence_rule.bymonth
+        until = base_event.start_datetime + timedelta(days=730)
 
     # Generate occurrence dates
-    rule = rrule(**rrule_params)
+    rule = build_rrule(
+        recurrence_rule.freq,
+        recurrence_rule.interval,
+        base_event.start_datetime,
+        until=until,
+        count=count,
+        byweekday=tuple(recurrence_rule.byweekday or ()),
+        bymonthday=tuple(recurrence_rule.bymonthday or ()),
+        bymonth=tuple(recurrence_rule.bymonth or ()),
+    )
     occurrences = list(rule)
 
     # Create event instances
     # Note: We create instances for ALL occurrences, including the first one
     # The base event is just a template with is_recurring=True
     duration = base_event.end_datetime - base_event.start_datetime
+    if not occurrences:
+        return
+
+    # One range scan for conflicts instead of a query per occurrence
+    conflict_index = load_conflict_index(
+        db, base_event.specialist_id, occurrences[0], occurrences[-1] + duration
+    )
+    instance_rows = []
 
     for occurrence_start in occurrences:  # Create instances for ALL occurrences
         occurrence_end = occurrence_start + duration
 
         # Check for conflicts with existing events
-        if not has_calendar_conflict(
-            db, base_event.specialist_id, occurrence_start, occurrence_end
-        ):
-            db_instance = CalendarEvent(
-                specialist_id=base_event.specialist_id,
-                title=base_event.title,
-                description=base_event.description,
-                location=base_event.location,
-                start_datetime=occurrence_start,
-                end_datetime=occurrence_end,
-                is_all_day=base_event.is_all_day,
-                timezone=base_event.timezone,
-                event_type=base_event.event_type,
-                category=base_event.category,
-                priority=base_event.priority,
-                color=base_event.color,
-                is_bookable=base_event.is_bookable,
-                max_bookings=base_event.max_bookings,
-                buffer_before=base_event.buffer_before,
-                buffer_after=base_event.buffer_after,
-                is_recurring=False,  # Individual instances are not recurring
-                status=base_event.status,
-                visibility=base_event.visibility,
-                recurring_event_id=base_event.recurring_event_id,
-                original_start=occurrence_start,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+        if not has_conflict_in_index(conflict_index, occurrence_start, occurrence_end):
+            instance_rows.append(
+                dict(
+                    specialist_id=base_event.specialist_id,
+                    title=base_event.title,
+                    description=base_event.description,
+                    location=base_event.location,
+                    start_datetime=occurrence_start,
+                    end_datetime=occurrence_end,
+                    is_all_day=base_event.is_all_day,
+                    timezone=base_event.timezone,
+                    event_type=base_event.event_type,
+                    category=base_event.category,
+                    priority=base_event.priority,
+                    color=base_event.color,
+                    is_bookable=base_event.is_bookable,
+                    max_bookings=base_event.max_bookings,
+                    buffer_before=base_event.buffer_before,
+                    buffer_after=base_event.buffer_after,
+                    is_recurring=False,  # Individual instances are not recurring
+                    status=base_event.status,
+                    visibility=base_event.visibility,
+                    recurring_event_id=base_event.recurring_event_id,
+                    original_start=occurrence_start,
+                )
             )
-            db.add(db_instance)
 
-    db.commit()
+    # Plain mappings go straight to an executemany INSERT - no ORM objects
+    if instance_rows:
+        db.bulk_insert_mappings(CalendarEvent, instance_rows)
 
 
 def generate_simple_recurring_instances(
@@ -512,6 +643,7 @@ def generate_simple_recurring_instances(
 ):
     """
     Fallback simple recurring instance generator when dateutil is not available.
+    Rows are inserted in the caller's transaction; the caller commits.
     """
     current_date = base_event.start_datetime.date()
     end_date = recurrence_rule.until or (current_date + timedelta(days=365))
@@ -519,6 +651,15 @@ def generate_simple_recurring_instances(
     count = 0
     max_count = recurrence_rule.count or 100
 
+    # One range scan for conflicts instead of a query per occurrence
+    conflict_index = load_conflict_index(
+        db,
+        base_event.specialist_id,
+        base_event.start_datetime,
+        datetime.combine(end_date, base_event.start_datetime.time()) + duration,
+    )
+    instance_rows = []
+
     while current_date <= end_date and count < max_count:
         # Simple frequency handling
         if recurrence_rule.freq == "DAILY":
@@ -535,78 +676,70 @@ def generate_simple_recurring_instances(
             )
             occurrence_end = occurrence_start + duration
 
-            if not has_calendar_conflict(
-                db, base_event.specialist_id, occurrence_start, occurrence_end
+            if not has_conflict_in_index(
+                conflict_index, occurrence_start, occurrence_end
             ):
-                db_instance = CalendarEvent(
-                    specialist_id=base_event.specialist_id,
-                    title=base_event.title,
-                    description=base_event.description,
-                    location=base_event.location,
-                    start_datetime=occurrence_start,
-                    end_datetime=occurrence_end,
-                    is_all_day=base_event.is_all_day,
-                    timezone=base_event.timezone,
-                    event_type=base_event.event_type,
-                    category=base_event.category,
-                    priority=base_event.priority,
-                    color=base_event.color,
-                    is_bookable=base_event.is_bookable,
-                    max_bookings=base_event.max_bookings,
-                    buffer_before=base_event.buffer_before,
-                    buffer_after=base_event.buffer_after,
-                    is_recurring=False,
-                    status=base_event.status,
-                    visibility=base_event.visibility,
-                    recurring_event_id=base_event.recurring_event_id,
-                    original_start=occurrence_start,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                instance_rows.append(
+                    dict(
+                        specialist_id=base_event.specialist_id,
+                        title=base_event.title,
+                        description=base_event.description,
+                        location=base_event.location,
+                        start_datetime=occurrence_start,
+                        end_datetime=occurrence_end,
+                        is_all_day=base_event.is_all_day,
+                        timezone=base_event.timezone,
+                        event_type=base_event.event_type,
+                        category=base_event.category,
+                        priority=base_event.priority,
+                        color=base_event.color,
+                        is_bookable=base_event.is_bookable,
+                        max_bookings=base_event.max_bookings,
+                        buffer_before=base_event.buffer_before,
+                        buffer_after=base_event.buffer_after,
+                        is_recurring=False,
+                        status=base_event.status,
+                        visibility=base_event.visibility,
+                        recurring_event_id=base_event.recurring_event_id,
+                        original_start=occurrence_start,
+                    )
                 )
-                db.add(db_instance)
 
         count += 1
 
-    db.commit()
+    if instance_rows:
+        db.bulk_insert_mappings(CalendarEvent, instance_rows)
+
+
+def with_recurring_exceptions(query):
+    """
+    Outer-join each event to the exception for the date it falls on, so events
+    and their exceptions come back in one query as (event, exception) rows.
+    """
+    return query.outerjoin(
+        EventException,
+        (EventException.event_id == CalendarEvent.id)
+        & (EventException.exception_date == func.date(CalendarEvent.start_datetime)),
+    ).add_entity(EventException)
 
 
 def apply_recurring_exceptions(
-    db: Session,
-    events: List[CalendarEvent],
-    start_date: Optional[date],
-    end_date: Optional[date],
+    event_rows: List[Tuple[CalendarEvent, Optional[EventException]]],
 ) -> List[CalendarEvent]:
     """
     Apply exceptions to recurring events (cancellations, modifications).
-    Returns the event list with exceptions applied.
+    Takes (event, exception) rows from with_recurring_exceptions and returns
+    the event list with exceptions applied.
     """
-    # Get all exceptions for the events in the date range
-    event_ids = [event.id for event in events]
-    exceptions = (
-        db.query(EventException).filter(EventException.event_id.in_(event_ids)).all()
-    )
-
-    # Group exceptions by event ID
-    exceptions_by_event = {}
-    for exception in exceptions:
-        if exception.event_id not in exceptions_by_event:
-            exceptions_by_event[exception.event_id] = []
-        exceptions_by_event[exception.event_id].append(exception)
-
-    # Apply exceptions
+    # Apply exceptions; the first exception for an event's date wins
     result_events = []
-    for event in events:
-        event_exceptions = exceptions_by_event.get(event.id, [])
+    seen_event_ids = set()
+    for event, exception_for_date in event_rows:
+        if event.id in seen_event_ids:
+            continue
+        seen_event_ids.add(event.id)
 
         # Check if this specific occurrence should be modified or cancelled
-        event_date = event.start_datetime.date()
-        exception_for_date = None
-
-        for exception in event_exceptions:
-            if exception.exception_date == event_date:
-                exception_for_date = exception
-                break
-
         if exception_for_date:
             if exception_for_date.exception_type == "cancelled":
                 # Skip cancelled events
@@ -650,6 +783,12 @@ def create_event_exception(
     db.commit()
 
 
+@lru_cache(maxsize=None)
+def buffer_delta(minutes: Optional[int]) -> timedelta:
+    """Buffer minutes as a timedelta; only a handful of distinct values exist."""
+    return timedelta(minutes=minutes or 0)
+
+
 def has_calendar_conflict(
     db: Session,
     specialist_id: int,
@@ -661,7 +800,13 @@ def has_calendar_conflict(
     Check if there are any calendar conflicts for the given time range.
     Considers all types of calendar events and buffer times.
     """
-    query = db.query(CalendarEvent).filter(
+    # Only the columns the check reads - no ORM hydration of full events
+    query = db.query(
+        CalendarEvent.start_datetime,
+        CalendarEvent.end_datetime,
+        CalendarEvent.buffer_before,
+        CalendarEvent.buffer_after,
+    ).filter(
         CalendarEvent.specialist_id == specialist_id,
         CalendarEvent.is_active == True,
         CalendarEvent.start_datetime < end_datetime,
@@ -675,15 +820,424 @@ def has_calendar_conflict(
     conflicting_events = query.all()
 
     # Check for buffer time conflicts
-    for event in conflicting_events:
+    for event_start, event_end, buffer_before, buffer_after in conflicting_events:
         # Add buffer times to the event
-        buffered_start = event.start_datetime - timedelta(minutes=event.buffer_before)
-        buffered_end = event.end_datetime + timedelta(minutes=event.buffer_after)
+        buffered_start = event_start - buffer_delta(buffer_before)
+        buffered_end = event_end + buffer_delta(buffer_after)
+
+        if buffered_start < end_datetime and buffered_end > start_datetime:
+            return True
+
+    return False
+
+
+def load_conflict_index(
+    db: Session,
+    specialist_id: int,
+    window_start: datetime,
+    window_end: datetime,
+    exclude_event_id: Optional[int] = None,
+):
+    """
+    Fetch every active event overlapping the window in one query and index it
+    for has_conflict_in_index. Same matching rules as has_calendar_conflict.
+    """
+    query = db.query(CalendarEvent.start_datetime, CalendarEvent.end_datetime).filter(
+        CalendarEvent.specialist_id == specialist_id,
+        CalendarEvent.is_active == True,
+        CalendarEvent.start_datetime < window_end,
+        CalendarEvent.end_datetime > window_start,
+    )
+    if exclude_event_id:
+        query = query.filter(CalendarEvent.id != exclude_event_id)
+
+    return build_conflict_index(query.all())
+
+
+def build_conflict_index(intervals):
+    """Index (start, end) intervals for has_conflict_in_index."""
+    intervals = sorted(intervals)
+    starts = [start for start, _ in intervals]
+    # Running max of end times so one bisect answers "does anything overlap?"
+    max_ends = []
+    for _, end in intervals:
+        max_ends.append(max(max_ends[-1], end) if max_ends else end)
+    return starts, max_ends
+
+
+def has_conflict_in_index(conflict_index, start_datetime, end_datetime) -> bool:
+    """Check a time range against an index from load_conflict_index in O(log n)."""
+    starts, max_ends = conflict_index
+    # Events starting before our end; any of them ending after our start overlaps
+    idx = bisect.bisect_left(starts, end_datetime)
+    return idx > 0 and max_ends[idx - 1] > start_datetime
+
+
+# Shortest service duration per specialist: specialist_id -> (minutes, cached_at).
+# Service writes invalidate their entry; the TTL bounds staleness across workers.
+MIN_SERVICE_DURATION_TTL_SECONDS = 60
+_min_service_duration_cache: dict = {}
+
+
+def invalidate_min_service_duration(specialist_id: int):
+    """Forget the cached shortest service duration for a specialist."""
+    _min_service_duration_cache.pop(specialist_id, None)
+
+
+def get_min_service_duration(db: Session, specialist_id: int) -> int:
+    """
+    Get the shortest service duration for a specialist (defaults to 30 minutes).
+    Slots are generated at this granularity so any service can be booked.
+    """
+    cached = _min_service_duration_cache.get(specialist_id)
+    if (
+        cached
+        and (datetime.utcnow() - cached[1]).total_seconds()
+        < MIN_SERVICE_DURATION_TTL_SECONDS
+    ):
+        return cached[0]
+
+    min_duration = (
+        db.query(func.min(ServiceDB.duration))
+        .filter(ServiceDB.specialist_id == specialist_id)
+        .scalar()
+    )
+    if min_duration is None:
+        min_duration = 30
+    _min_service_duration_cache[specialist_id] = (min_duration, datetime.utcnow())
+    return min_duration
+
+
+def seconds_of_day(value: time) -> float:
+    """Seconds from midnight for a time of day."""
+    return (
+        value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+    )
+
+
+def iter_available_time_slots(
+    db: Session, specialist_id: int, booking_date: date, service_duration: int
+) -> Iterator[dict]:
+    """
+    Lazily yield bookable time slots for a specialist on a date, in start-time order.
+    Walks each availability event in service_duration steps and drops slots that
+    overlap confirmed bookings or other calendar events (blocks, PTO, etc.).
+    Candidate offsets are cheap integers computed up front; the per-slot calendar
+    conflict check and result building happen only as the caller consumes slots.
+    """
+    # Calendar events that represent availability (from recurring schedules).
+    # A start range instead of date(start_datetime) lets the index seek.
+    day_start = datetime.combine(booking_date, time.min)
+    day_end = day_start + timedelta(days=1)
+    availability_filters = (
+        CalendarEvent.specialist_id == specialist_id,
+        CalendarEvent.is_active == True,  # Only return active events
+        CalendarEvent.start_datetime >= day_start,
+        CalendarEvent.start_datetime < day_end,
+        CalendarEvent.event_type == "availability",
+        CalendarEvent.status == "confirmed",
+    )
+    latest_availability_end = (
+        select(func.max(CalendarEvent.end_datetime))
+        .where(*availability_filters)
+        .scalar_subquery()
+    )
+
+    # One round-trip for the availability windows and every active event that
+    # could overlap them (blocks, PTO, etc.); the windows are picked out below.
+    # With no availability the subquery is NULL and nothing comes back.
+    day_events = (
+        db.query(
+            CalendarEvent.id,
+            CalendarEvent.start_datetime,
+            CalendarEvent.end_datetime,
+            CalendarEvent.event_type,
+            CalendarEvent.status,
+        )
+        .filter(
+            CalendarEvent.specialist_id == specialist_id,
+            CalendarEvent.is_active == True,
+            CalendarEvent.start_datetime < latest_availability_end,
+            CalendarEvent.end_datetime > day_start,
+        )
+        .all()
+    )
+    calendar_availability = [
+        event
+        for event in day_events
+        if event.event_type == "availability"
+        and event.status == "confirmed"
+        and day_start <= event.start_datetime < day_end
+    ]
+
+    if not calendar_availability:
+        return
+
+    # Get existing bookings for the date (only the times are needed)
+    existing_bookings = (
+        db.query(Booking.start_time, Booking.end_time)
+        .filter(
+            Booking.specialist_id == specialist_id,
+            Booking.date == booking_date,
+            Booking.status == "confirmed",
+        )
+        .all()
+    )
+
+    # Work in seconds from midnight throughout; datetime/time objects are only
+    # built for slots that are actually yielded. Booking intervals are built
+    # once, sorted, and shared by every availability window.
+    duration = service_duration * 60
+    booking_intervals = sorted(
+        (seconds_of_day(start_time), seconds_of_day(end_time))
+        for start_time, end_time in existing_bookings
+    )
+
+    # Each availability window gets an index of the other events, not itself
+    conflict_indexes = {
+        cal_event.id: build_conflict_index(
+            ((start - day_start).total_seconds(), (end - day_start).total_seconds())
+            for event_id, start, end, _, _ in day_events
+            if event_id != cal_event.id
+        )
+        for cal_event in calendar_availability
+    }
+
+    # Candidates are (time-of-day seconds, seconds from day start, event id).
+    # Offsets come back ascending, so each window yields already-sorted runs
+    # (two if it wraps past midnight) that are merged instead of re-sorted.
+    candidate_runs = []
+    for cal_event in calendar_availability:
+        # Generate time slots within the calendar availability window that
+        # don't overlap existing bookings
+        window_start = (cal_event.start_datetime - day_start).total_seconds()
+        open_offsets = find_open_slot_offsets(
+            window_start,
+            int((cal_event.end_datetime - cal_event.start_datetime).total_seconds()),
+            duration,
+            booking_intervals,
+        )
+        same_day, next_day = [], []
+        for offset in open_offsets:
+            slot_start = window_start + offset
+            run = same_day if slot_start < 86400 else next_day
+            run.append((slot_start % 86400, slot_start, cal_event.id))
+        candidate_runs.extend((same_day, next_day))
+
+    # Merge the runs by time of day so slots can be yielded in final order
+    candidates = heapq.merge(*candidate_runs, key=lambda candidate: candidate[0])
+
+    seen_starts = set()
+    for slot_of_day, slot_start, cal_event_id in candidates:
+        # Skip slots already produced by another availability event
+        if slot_of_day in seen_starts:
+            continue
+
+        # Check if this slot conflicts with calendar events (blocks, PTO, etc.)
+        # The current availability event itself is left out of its index
+        if has_conflict_in_index(
+            conflict_indexes[cal_event_id], slot_start, slot_start + duration
+        ):
+            continue
+
+        seen_starts.add(slot_of_day)
+        current_time = day_start + timedelta(seconds=slot_start)
+        yield {
+            "start_time": current_time.time(),
+            "end_time": (current_time + timedelta(seconds=duration)).time(),
+            "duration_minutes": service_duration,
+        }
+
+
+def compute_available_time_slots(
+    db: Session, specialist_id: int, booking_date: date, service_duration: int
+) -> List[dict]:
+    """Compute all bookable time slots for a specialist on a date."""
+    return list(
+        iter_available_time_slots(db, specialist_id, booking_date, service_duration)
+    )
+
+
+def find_open_slot_offsets(
+    window_start: float,
+    window_length: int,
+    duration: int,
+    busy_intervals: List[tuple],
+) -> List[int]:
+    """
+    Return slot start offsets (seconds from the window start) stepping by duration
+    whose [start, start + duration) interval overlaps no busy interval.
+    busy_intervals are (start, end) pairs in the same seconds-of-day frame as
+    window_start, so callers can build them once and reuse them for every window.
+    Vectorized with numpy when available, otherwise a sweep over the busy
+    intervals in start order, O(slots + intervals).
+    """
+    if NUMPY_AVAILABLE:
+        starts = np.arange(0, window_length - duration + 1, duration, dtype=np.int64)
+        if busy_intervals and starts.size:
+            # Same test as has_conflict_in_index, vectorized over every slot:
+            # busy intervals sorted by start with a running max of their ends,
+            # so one searchsorted answers "does anything overlap?" per slot.
+            # O((slots + intervals) log intervals) instead of a slots x
+            # intervals comparison matrix.
+            busy = np.asarray(busy_intervals, dtype=np.float64) - window_start
+            busy = busy[np.argsort(busy[:, 0], kind="stable")]
+            max_ends = np.maximum.accumulate(busy[:, 1])
+            idx = np.searchsorted(busy[:, 0], starts + duration, side="left")
+            conflict = (idx > 0) & (max_ends[np.maximum(idx - 1, 0)] > starts)
+            starts = starts[~conflict]
+        return starts.tolist()
+
+    # Slots only move forward, so busy intervals enter once (when they start
+    # before the slot ends) and leave once (when they end by the slot start);
+    # a slot is open iff nothing is active. Sorting is linear on sorted input.
+    busy = sorted(
+        (b_start - window_start, b_end - window_start)
+        for b_start, b_end in busy_intervals
+    )
+    active_ends = []
+    next_busy = 0
+    offsets = []
+    for offset in range(0, window_length - duration + 1, duration):
+        slot_end = offset + duration
+        while next_busy < len(busy) and busy[next_busy][0] < slot_end:
+            heapq.heappush(active_ends, busy[next_busy][1])
+            next_busy += 1
+        while active_ends and active_ends[0] <= offset:
+            heapq.heappop(active_ends)
+        if not active_ends:
+            offsets.append(offset)
+    return offsets
+
+
+def refresh_day_availability(
+    db: Session, specialist_id: int, dates, service_duration: Optional[int] = None
+):
+    """
+    Recompute the materialized SpecialistDayAvailability rows for the given dates.
+    Flushes pending changes first so the summary sees them; the caller commits.
+    Pass service_duration when the shortest duration changes in this transaction.
+    """
+    dates = {d.date() if isinstance(d, datetime) else d for d in dates if d}
+    if not dates:
+        return
+
+    db.flush()
+    # Dropped once the summary rows are committed, see _catalog_after_commit
+    db.info["catalog_dirty"] = True
+    if service_duration is None:
+        service_duration = get_min_service_duration(db, specialist_id)
+
+    existing_rows = {
+        row.date: row
+        for row in db.query(SpecialistDayAvailability).filter(
+            SpecialistDayAvailability.specialist_id == specialist_id,
+            SpecialistDayAvailability.date.in_(dates),
+        )
+    }
+
+    now = datetime.utcnow()
+    for day in dates:
+        slot_count = len(
+            compute_available_time_slots(db, specialist_id, day, service_duration)
+        )
+        row = existing_rows.get(day)
+        if row is None:
+            row = SpecialistDayAvailability(specialist_id=specialist_id, date=day)
+            db.add(row)
+        row.slot_count = slot_count
+        row.has_free_slots = slot_count > 0
+        row.updated_at = now
+
+
+def series_future_dates(db: Session, recurring_event_id: Optional[str]) -> set:
+    """
+    Upcoming dates covered by a recurring series' events, active or not.
+    Schedule writes collect these before and after changing the series and
+    refresh just those days.
+    """
+    if not recurring_event_id:
+        return set()
+
+    db.flush()
+    return {
+        start_datetime.date()
+        for (start_datetime,) in db.query(CalendarEvent.start_datetime).filter(
+            CalendarEvent.recurring_event_id == recurring_event_id,
+            CalendarEvent.start_datetime >= datetime.combine(date.today(), time.min),
+        )
+    }
+
+
+def rebuild_day_availability(
+    db: Session, specialist_id: int, service_duration: Optional[int] = None
+):
+    """
+    Rebuild every future SpecialistDayAvailability row for a specialist.
+    Only for changes that affect every day at once - a new shortest service
+    duration, or a specialist whose summary was never built.
+    """
+    db.flush()
+    today = date.today()
+
+    db.query(SpecialistDayAvailability).filter(
+        SpecialistDayAvailability.specialist_id == specialist_id,
+        SpecialistDayAvailability.date >= today,
+    ).delete()
+
+    availability_dates = (
+        db.query(func.date(CalendarEvent.start_datetime))
+        .filter(
+            CalendarEvent.specialist_id == specialist_id,
+            CalendarEvent.event_type == "availability",
+            CalendarEvent.is_active == True,
+            CalendarEvent.start_datetime >= datetime.combine(today, time.min),
+        )
+        .distinct()
+        .all()
+    )
+
+    refresh_day_availability(
+        db,
+        specialist_id,
+        [
+            date.fromisoformat(d) if isinstance(d, str) else d
+            for (d,) in availability_dates
+        ],
+        service_duration,
+    )
 
-        if buffered_start < end_datetime and buffered_end > start_datetime:
-            return True
 
-    return False
+def backfill_day_availability(db: Session):
+    """
+    Build summary rows for specialists with upcoming availability but no
+    SpecialistDayAvailability rows (e.g. schedules written before the summary
+    table existed). A single query once every specialist has been summarized.
+    """
+    today = date.today()
+    has_summary = (
+        select(SpecialistDayAvailability.specialist_id)
+        .where(
+            SpecialistDayAvailability.specialist_id == CalendarEvent.specialist_id,
+            SpecialistDayAvailability.date >= today,
+        )
+        .exists()
+    )
+    missing_ids = db.scalars(
+        select(CalendarEvent.specialist_id)
+        .where(
+            CalendarEvent.event_type == "availability",
+            CalendarEvent.is_active == True,
+            CalendarEvent.start_datetime >= datetime.combine(today, time.min),
+            ~has_summary,
+        )
+        .distinct()
+    ).all()
+
+    for specialist_id in missing_ids:
+        rebuild_day_availability(db, specialist_id)
+    if missing_ids:
+        db.commit()
 
 
 def generate_smart_availability_suggestions(
@@ -713,21 +1267,61 @@ def generate_smart_availability_suggestions(
         .all()
     )
 
+    # Parse time ranges once instead of on every candidate slot
+    ranges_by_weekday = parse_working_hours(working_hours)
+
     # Generate time slots based on working hours
-    current_datetime = query.start_datetime
     end_datetime = query.end_datetime
     duration = timedelta(minutes=query.duration_minutes)
+    increment = preferences.slot_increment if preferences else 30
+    last_start = end_datetime - duration
+    if last_start < query.start_datetime:
+        return []
+
+    if DATEUTIL_AVAILABLE:
+        candidate_starts = rrule(
+            MINUTELY, interval=increment, dtstart=query.start_datetime
+        ).between(query.start_datetime, last_start, inc=True)
+    else:
+        slot_count = int((last_start - query.start_datetime).total_seconds() // 60)
+        candidate_starts = [
+            query.start_datetime + timedelta(minutes=offset)
+            for offset in range(0, slot_count + 1, increment)
+        ]
+
+    # One range scan for conflicts instead of a query per candidate
+    conflict_index = load_conflict_index(
+        db, specialist_id, query.start_datetime, end_datetime
+    )
+
+    # Events within scoring distance of any candidate, sorted by start
+    nearby_window = timedelta(hours=2)
+    sorted_events = sorted(
+        (start, end)
+        for start, end in db.query(
+            CalendarEvent.start_datetime, CalendarEvent.end_datetime
+        ).filter(
+            CalendarEvent.specialist_id == specialist_id,
+            CalendarEvent.is_active == True,
+            CalendarEvent.start_datetime >= query.start_datetime - nearby_window,
+            CalendarEvent.end_datetime <= end_datetime + nearby_window,
+        )
+    )
 
-    while current_datetime + duration <= end_datetime:
+    for current_datetime in candidate_starts:
         # Check if this time falls within working hours
-        if is_within_working_hours(current_datetime, working_hours):
+        check_time = current_datetime.time()
+        if any(
+            start <= check_time <= end
+            for start, end in ranges_by_weekday[current_datetime.weekday()]
+        ):
             # Check for conflicts
-            if not has_calendar_conflict(
-                db, specialist_id, current_datetime, current_datetime + duration
+            if not has_conflict_in_index(
+                conflict_index, current_datetime, current_datetime + duration
             ):
                 # Calculate confidence score based on various factors
                 confidence = calculate_confidence_score(
-                    db, specialist_id, current_datetime, query, preferences
+                    current_datetime, query, preferences, sorted_events
                 )
 
                 suggestion = SmartSchedulingSuggestion(
@@ -740,47 +1334,45 @@ def generate_smart_availability_suggestions(
                 )
                 suggestions.append(suggestion)
 
-        # Move to next time slot
-        increment = preferences.slot_increment if preferences else 30
-        current_datetime += timedelta(minutes=increment)
-
     # Sort by confidence score and return top suggestions
     suggestions.sort(key=lambda x: x.confidence_score, reverse=True)
     return suggestions[:10]  # Return top 10 suggestions
 
 
-def is_within_working_hours(
-    check_datetime: datetime, working_hours: List[WorkingHours]
-) -> bool:
+def parse_working_hours(
+    working_hours: List[WorkingHours],
+) -> List[List[Tuple[time, time]]]:
     """
-    Check if a datetime falls within the specialist's working hours.
+    Parse working hours rows into (start, end) time ranges indexed by weekday
+    (0=Monday), so a slot check is a list index instead of a scan over rows.
     """
-    weekday = check_datetime.weekday()  # 0=Monday, 6=Sunday
-    check_time = check_datetime.time()
-
+    ranges_by_weekday = [[] for _ in range(7)]
     for wh in working_hours:
-        if wh.day_of_week == weekday and wh.is_working_day:
-            # Parse time ranges from JSON
-            time_ranges = json.loads(wh.time_ranges)
-            for tr in time_ranges:
-                if tr.get("start_time") and tr.get("end_time"):
-                    start_time = time.fromisoformat(tr["start_time"])
-                    end_time = time.fromisoformat(tr["end_time"])
-                    if start_time <= check_time <= end_time:
-                        return True
+        if not wh.is_working_day or not 0 <= wh.day_of_week <= 6:
+            continue
+        # Time ranges come back from the JSON column already decoded
+        ranges = ranges_by_weekday[wh.day_of_week]
+        for tr in wh.time_ranges or ():
+            if tr.get("start_time") and tr.get("end_time"):
+                ranges.append(
+                    (
+                        time.fromisoformat(tr["start_time"]),
+                        time.fromisoformat(tr["end_time"]),
+                    )
+                )
 
-    return False
+    return ranges_by_weekday
 
 
 def calculate_confidence_score(
-    db: Session,
-    specialist_id: int,
     suggested_datetime: datetime,
     query: AvailabilityQuery,
     preferences: Optional[SchedulingPreferences],
+    sorted_events: List[Tuple[datetime, datetime]],
 ) -> float:
     """
     Calculate a confidence score for a suggested time slot based on multiple factors.
+    sorted_events holds (start, end) pairs ordered by start, fetched once per run.
     """
     score = 1.0
 
@@ -812,16 +1404,14 @@ def calculate_confidence_score(
             score *= 0.3  # Short notice
 
     # Factor 4: Buffer around existing appointments
-    nearby_events = (
-        db.query(CalendarEvent)
-        .filter(
-            CalendarEvent.specialist_id == specialist_id,
-            CalendarEvent.is_active == True,
-            CalendarEvent.start_datetime >= suggested_datetime - timedelta(hours=2),
-            CalendarEvent.end_datetime <= suggested_datetime + timedelta(hours=2),
-        )
-        .all()
-    )
+    window_start = suggested_datetime - timedelta(hours=2)
+    window_end = suggested_datetime + timedelta(hours=2)
+    # Events starting inside the window; keep those that also end inside it
+    first = bisect.bisect_left(sorted_events, (window_start,))
+    last = bisect.bisect_right(sorted_events, (window_end, datetime.max))
+    nearby_events = [
+        event for event in sorted_events[first:last] if event[1] <= window_end
+    ]
 
     if len(nearby_events) == 0:
         score *= 1.0  # No nearby events
@@ -840,56 +1430,69 @@ def execute_bulk_calendar_operation(
     Execute bulk operations on calendar events for efficiency.
     """
     results = []
+    affected_dates = []
 
     if operation.operation == "create":
+        event_rows = []
         for event_data in operation.events:
             # Convert to CalendarEventCreate if needed
             if isinstance(event_data, CalendarEventUpdate):
                 # Skip updates in create operation
                 continue
 
-            # Create the event
-            db_event = CalendarEvent(
-                specialist_id=specialist_id,
-                **event_data.dict(),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            db.add(db_event)
-            results.append(db_event)
+            event_rows.append(dict(specialist_id=specialist_id, **event_data.dict()))
 
-    elif operation.operation == "update":
-        # Batch update operations
-        for event_data in operation.events:
-            if hasattr(event_data, "id") and event_data.id:
-                db_event = (
-                    db.query(CalendarEvent)
-                    .filter(
-                        CalendarEvent.id == event_data.id,
-                        CalendarEvent.specialist_id == specialist_id,
-                    )
-                    .first()
-                )
+        # One multi-row INSERT ... RETURNING hands back fully loaded events
+        if event_rows:
+            results = db.scalars(
+                insert(CalendarEvent).returning(
+                    CalendarEvent, sort_by_parameter_order=True
+                ),
+                event_rows,
+            ).all()
 
-                if db_event:
-                    for field, value in event_data.dict(exclude_unset=True).items():
-                        if field != "id":
-                            setattr(db_event, field, value)
-                    db_event.updated_at = datetime.utcnow()
-                    results.append(db_event)
+    elif operation.operation == "update":
+        # Load every owned target in one query instead of one SELECT per update
+        updates = [
+            event_data
+            for event_data in operation.events
+            if hasattr(event_data, "id") and event_data.id
+        ]
+        events_by_id = {
+            db_event.id: db_event
+            for db_event in db.query(CalendarEvent).filter(
+                CalendarEvent.id.in_([event_data.id for event_data in updates]),
+                CalendarEvent.specialist_id == specialist_id,
+            )
+        }
 
+        now = datetime.utcnow()
+        for event_data in updates:
+            db_event = events_by_id.get(event_data.id)
+            if db_event:
+                # The day the event moves away from needs its summary refreshed too
+                affected_dates.append(db_event.start_datetime)
+                for field, value in event_data.dict(exclude_unset=True).items():
+                    if field != "id":
+                        setattr(db_event, field, value)
+                db_event.updated_at = now
+                results.append(db_event)
+
+    refresh_day_availability(
+        db,
+        specialist_id,
+        affected_dates + [result.start_datetime for result in results],
+    )
+    # Serialize before commit so expired attributes don't trigger a reload per row
+    responses = [CalendarEventResponse.model_validate(result) for result in results]
     db.commit()
 
-    # Refresh all results
-    for result in results:
-        db.refresh(result)
-
-    return results
+    return responses
 
 
 # Health Check
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint for monitoring."""
     return {
         "status": "healthy",
@@ -907,59 +1510,91 @@ async def logout(response: Response):
 
 
 @app.get("/auth/me")
-async def get_current_user(request: Request, db: Session = Depends(get_db)):
+async def get_current_user(request: Request):
     """Get current authenticated user info with services and availability"""
-    specialist = get_current_specialist(request, db)
-    if not specialist:
+    token = request.cookies.get("access_token")
+    payload = verify_token(token) if token else None
+    specialist_id = payload.get("specialist_id") if payload else None
+    if not specialist_id:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    # Get services for this specialist
-    services = (
-        db.query(ServiceDB).filter(ServiceDB.specialist_id == specialist.id).all()
+    # Specialist and services in a single JOINed query, awaited on the event loop
+    rows = await database.fetch_all(
+        select(
+            Specialist.id,
+            Specialist.name,
+            Specialist.email,
+            Specialist.bio,
+            Specialist.phone,
+            ServiceDB.id.label("service_id"),
+            ServiceDB.name.label("service_name"),
+            ServiceDB.price,
+            ServiceDB.duration,
+        )
+        .select_from(Specialist)
+        .outerjoin(ServiceDB, ServiceDB.specialist_id == Specialist.id)
+        .where(Specialist.id == specialist_id)
+        .order_by(ServiceDB.id)
     )
+    if not rows:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    specialist = rows[0]
+    services = [
+        {
+            "id": row.service_id,
+            "name": row.service_name,
+            "price": row.price,
+            "duration": row.duration,
+            "specialist_id": specialist_id,
+        }
+        for row in rows
+        if row.service_id is not None
+    ]
 
     # Get recent availability from calendar events (recurring schedules)
-    from datetime import date, timedelta
-
     today = date.today()
     next_month = today + timedelta(days=30)
 
-    recent_availability = (
-        db.query(CalendarEvent)
-        .filter(
-            CalendarEvent.specialist_id == specialist.id,
+    # Project only the columns the response needs - no ORM hydration
+    recent_availability = await database.fetch_all(
+        select(
+            CalendarEvent.id, CalendarEvent.start_datetime, CalendarEvent.end_datetime
+        ).where(
+            CalendarEvent.specialist_id == specialist_id,
             CalendarEvent.event_type == "availability",
             CalendarEvent.is_active == True,
             CalendarEvent.start_datetime >= datetime.combine(today, time.min),
             CalendarEvent.start_datetime <= datetime.combine(next_month, time.max),
         )
-        .all()
     )
 
-    specialist_response = SpecialistResponse(
-        id=specialist.id,
-        name=specialist.name,
-        email=specialist.email,
-        bio=specialist.bio,
-        phone=specialist.phone,
-        services=services,
+    # Output shape is built here, so hand orjson plain data and skip the
+    # jsonable_encoder pass. Times keep the explicit HH:MM:SS wire format - native
+    # serialization would append microseconds for sub-minute window starts
+    return ORJSONResponse(
+        content={
+            "specialist": {
+                "id": specialist.id,
+                "name": specialist.name,
+                "email": specialist.email,
+                "bio": specialist.bio,
+                "phone": specialist.phone,
+                "services": services,
+            },
+            "services": services,
+            "availability": [
+                {
+                    "id": event.id,
+                    "date": event.start_datetime.date(),
+                    "start_time": event.start_datetime.strftime("%H:%M:%S"),
+                    "end_time": event.end_datetime.strftime("%H:%M:%S"),
+                    "is_available": True,
+                }
+                for event in recent_availability
+            ],
+        }
     )
 
-    return {
-        "specialist": specialist_response,
-        "services": services,
-        "availability": [
-            {
-                "id": event.id,
-                "date": event.start_datetime.date().isoformat(),
-                "start_time": event.start_datetime.strftime("%H:%M:%S"),
-                "end_time": event.end_datetime.strftime("%H:%M:%S"),
-                "is_available": True,
-            }
-            for event in recent_availability
-        ],
-    }
-
 
 # HTML Routes for Web Interface
 @app.get("/", response_class=HTMLResponse)
@@ -970,7 +1605,6 @@ async def home(request: Request):
 @app.get("/professional", response_class=HTMLResponse)
 async def professional_dashboard(
     request: Request,
-    db: Session = Depends(get_db),
     days: Optional[str] = Query(None, description="Comma-separated day indices (0-6)"),
     start_time: Optional[int] = Query(
         None, ge=0, le=23, description="Start hour (0-23)"
@@ -978,7 +1612,7 @@ async def professional_dashboard(
     end_time: Optional[int] = Query(None, ge=1, le=24, description="End hour (1-24)"),
 ):
     """Professional dashboard - shows verification form if not authenticated, dashboard if authenticated"""
-    specialist = get_current_specialist(request, db)
+    specialist = await get_current_specialist_async(request)
 
     # Parse filter parameters
     visible_days = None
@@ -1019,14 +1653,14 @@ async def consumer_portal(request: Request):
 
 
 @app.get("/consumer/business/{business_id}", response_class=HTMLResponse)
-async def consumer_business_page(
-    request: Request, business_id: int, db: Session = Depends(get_db)
-):
+async def consumer_business_page(request: Request, business_id: int):
     """
     Business detail page showing professionals at that business.
     Used for the business-first booking flow.
     """
-    business = db.query(Workplace).filter(Workplace.id == business_id).first()
+    business = await database.fetch_one(
+        select(Workplace.name).where(Workplace.id == business_id)
+    )
     if not business:
         raise HTTPException(status_code=404, detail="Business not found")
 
@@ -1041,10 +1675,10 @@ async def consumer_business_page(
 
 
 @app.get("/consumer/professional/{specialist_id}", response_class=HTMLResponse)
-async def consumer_professional_page(
-    request: Request, specialist_id: int, db: Session = Depends(get_db)
-):
-    specialist = db.query(Specialist).filter(Specialist.id == specialist_id).first()
+async def consumer_professional_page(request: Request, specialist_id: int):
+    specialist = await database.fetch_one(
+        select(Specialist.__table__).where(Specialist.id == specialist_id)
+    )
     if not specialist:
         raise HTTPException(status_code=404, detail="Professional not found")
 
@@ -1057,17 +1691,17 @@ async def consumer_professional_page(
     "/consumer/professional/{specialist_id}/service/{service_id}",
     response_class=HTMLResponse,
 )
-async def consumer_booking_page(
-    request: Request, specialist_id: int, service_id: int, db: Session = Depends(get_db)
-):
-    specialist = db.query(Specialist).filter(Specialist.id == specialist_id).first()
+async def consumer_booking_page(request: Request, specialist_id: int, service_id: int):
+    specialist = await database.fetch_one(
+        select(Specialist.__table__).where(Specialist.id == specialist_id)
+    )
     if not specialist:
         raise HTTPException(status_code=404, detail="Professional not found")
 
-    service = (
-        db.query(ServiceDB)
-        .filter(ServiceDB.id == service_id, ServiceDB.specialist_id == specialist_id)
-        .first()
+    service = await database.fetch_one(
+        select(ServiceDB.__table__).where(
+            ServiceDB.id == service_id, ServiceDB.specialist_id == specialist_id
+        )
     )
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
@@ -1090,9 +1724,7 @@ We want to build a simple API that allows us to:
 
 # Verification Endpoints
 @app.post("/verification/send", response_model=VerificationResponse)
-async def send_verification_code(
-    request: VerificationRequest, db: Session = Depends(get_db)
-):
+async def send_verification_code(request: VerificationRequest):
     """
     Send a 6-digit verification code via email or SMS
     """
@@ -1111,22 +1743,33 @@ async def send_verification_code(
             )
         request.phone = normalized_phone
 
-    # Clean up expired codes first
-    verification_service.cleanup_expired_codes(db)
-
-    success = False
-    method = ""
-    message = ""
+    # Hold a pooled connection only for the DB work, not while the code is
+    # being delivered over email/SMS
+    channel = "email" if request.email else "sms"
+    try:
+        with SessionLocal() as db:
+            # Clean up expired codes first
+            verification_service.cleanup_expired_codes(db)
+            code = verification_service.create_verification_code(
+                db,
+                channel,
+                request.verification_type,
+                email=request.email,
+                phone=None if request.email else request.phone,
+            )
+    except Exception as e:
+        print(f"Error storing verification code: {e}")
+        raise HTTPException(status_code=500, detail="Failed to send verification code")
 
     if request.email:
-        success = await verification_service.send_email_verification(
-            db, request.email, request.verification_type
+        success = await verification_service.deliver_email_code(
+            request.email, code, request.verification_type
         )
         method = "email"
         message = f"Verification code sent to {request.email}"
-    elif request.phone:
-        success = await verification_service.send_sms_verification(
-            db, request.phone, request.verification_type
+    else:
+        success = await verification_service.deliver_sms_code(
+            request.phone, code, request.verification_type
         )
         method = "sms"
         message = f"Verification code sent to {request.phone}"
@@ -1171,6 +1814,7 @@ async def verify_code(request: CodeVerificationRequest, db: Session = Depends(ge
     # Code verified successfully, now handle authentication
     contact_email = request.email
     specialist = None
+    created_specialist = False
 
     if contact_email:
         # Check if specialist already exists
@@ -1191,9 +1835,10 @@ async def verify_code(request: CodeVerificationRequest, db: Session = Depends(ge
                 bio=request.bio,
                 phone=request.specialist_phone,
             )
+            # Flush for the id; committed once the response is built
             db.add(specialist)
-            db.commit()
-            db.refresh(specialist)
+            db.flush()
+            created_specialist = True
 
         elif not specialist and request.verification_type == "login":
             raise HTTPException(
@@ -1220,6 +1865,9 @@ async def verify_code(request: CodeVerificationRequest, db: Session = Depends(ge
         phone=specialist.phone,
         services=[],
     )
+    if created_specialist:
+        db.commit()
+        invalidate_catalog_cache()
 
     # Create response with cookie
     response_data = CodeVerificationResponse(
@@ -1231,7 +1879,7 @@ async def verify_code(request: CodeVerificationRequest, db: Session = Depends(ge
     )
 
     # Create JSON response and set cookie
-    json_response = JSONResponse(content=response_data.model_dump())
+    json_response = ORJSONResponse(content=response_data.model_dump())
     json_response.set_cookie(
         key="access_token",
         value=access_token,
@@ -1246,16 +1894,16 @@ async def verify_code(request: CodeVerificationRequest, db: Session = Depends(ge
 
 
 @app.get("/auth/my-services", response_model=List[ServiceResponse])
-async def get_current_user_services(request: Request, db: Session = Depends(get_db)):
+async def get_current_user_services(request: Request):
     """Get current authenticated user's services"""
-    specialist = get_current_specialist(request, db)
+    specialist = await get_current_specialist_async(request)
     if not specialist:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    services = (
-        db.query(ServiceDB).filter(ServiceDB.specialist_id == specialist.id).all()
+    services = await database.fetch_all(
+        select(ServiceDB.__table__).where(ServiceDB.specialist_id == specialist.id)
     )
-    return services
+    return [dict(service._mapping) for service in services]
 
 
 @app.post("/specialist/", response_model=SpecialistResponse)
@@ -1268,31 +1916,40 @@ def create_specialist(
     Create a new specialist with enhanced profile info and validation.
     Note: This endpoint is now protected - specialists should be created through the verification process.
     """
-    # Check if specialist with this email already exists
-    existing_specialist = (
-        db.query(Specialist).filter(Specialist.email == specialist.email).first()
-    )
-    if existing_specialist:
-        raise HTTPException(
-            status_code=400, detail="Specialist with this email already exists"
-        )
-
     # Validate name length
     if len(specialist.name.strip()) < 2:
         raise HTTPException(
             status_code=400, detail="Specialist name must be at least 2 characters long"
         )
 
-    db_specialist = Specialist(
-        name=specialist.name.strip(),
-        email=specialist.email.lower().strip(),
-        bio=specialist.bio.strip() if specialist.bio else None,
-        phone=specialist.phone.strip() if specialist.phone else None,
+    # Insert unless the email is taken - one statement, no check-then-insert race
+    stmt = (
+        dialect_insert(db, Specialist)
+        .values(
+            name=specialist.name.strip(),
+            email=specialist.email.lower().strip(),
+            bio=specialist.bio.strip() if specialist.bio else None,
+            phone=specialist.phone.strip() if specialist.phone else None,
+        )
+        .on_conflict_do_nothing(index_elements=[Specialist.email])
+        .returning(
+            Specialist.id,
+            Specialist.name,
+            Specialist.email,
+            Specialist.bio,
+            Specialist.phone,
+        )
     )
-    db.add(db_specialist)
+    created = db.execute(stmt).first()
+    if created is None:
+        raise HTTPException(
+            status_code=400, detail="Specialist with this email already exists"
+        )
+
+    response = SpecialistResponse(**created._mapping, services=[])
     db.commit()
-    db.refresh(db_specialist)
-    return db_specialist
+    invalidate_catalog_cache()
+    return response
 
 
 @app.put("/specialist/{specialist_id}/services")
@@ -1317,11 +1974,7 @@ def update_specialist_services(
     if not specialist:
         raise HTTPException(status_code=404, detail="Specialist not found")
 
-    # Delete existing services for this specialist
-    db.query(ServiceDB).filter(ServiceDB.specialist_id == specialist_id).delete()
-
-    # Add new services with validation
-    db_services = []
+    # Validate everything before touching the database
     for service in services:
         # Validate service data
         if len(service.name.strip()) < 2:
@@ -1340,70 +1993,203 @@ def update_specialist_services(
                 detail=f"Service duration must be between 1 and 1440 minutes, got {service.duration}",
             )
 
-        db_service = ServiceDB(
-            name=service.name.strip(),
-            price=round(service.price, 2),  # Round to 2 decimal places
-            duration=service.duration,
-            specialist_id=specialist_id,
+    # Diff against the existing services by name so unchanged services keep
+    # their IDs (and bookings keep pointing at them)
+    existing_by_name = {}
+    for db_service in (
+        db.query(ServiceDB)
+        .filter(ServiceDB.specialist_id == specialist_id)
+        .order_by(ServiceDB.id)
+    ):
+        existing_by_name.setdefault(db_service.name, []).append(db_service)
+    previous_min_duration = min(
+        (
+            db_service.duration
+            for matches in existing_by_name.values()
+            for db_service in matches
+        ),
+        default=30,
+    )
+
+    db_services = []
+    new_rows = []
+    for service in services:
+        name = service.name.strip()
+        price = round(service.price, 2)  # Round to 2 decimal places
+        matches = existing_by_name.get(name)
+        if matches:
+            db_service = matches.pop(0)
+            db_service.price = price
+            db_service.duration = service.duration
+            db_services.append(db_service)
+        else:
+            new_rows.append(
+                {
+                    "name": name,
+                    "price": price,
+                    "duration": service.duration,
+                    "specialist_id": specialist_id,
+                }
+            )
+            db_services.append(None)  # Filled from the bulk INSERT below
+
+    # Remove services that are no longer offered
+    stale_ids = [
+        db_service.id
+        for matches in existing_by_name.values()
+        for db_service in matches
+    ]
+    if stale_ids:
+        db.query(ServiceDB).filter(ServiceDB.id.in_(stale_ids)).delete()
+
+    # One multi-row INSERT ... RETURNING gives the new IDs without refreshes
+    if new_rows:
+        inserted = iter(
+            db.scalars(
+                insert(ServiceDB).returning(ServiceDB, sort_by_parameter_order=True),
+                new_rows,
+            ).all()
         )
-        db.add(db_service)
-        db_services.append(db_service)
+        db_services = [
+            db_service if db_service is not None else next(inserted)
+            for db_service in db_services
+        ]
 
+    # Slot counts depend on the shortest service duration, so every day's
+    # summary is rebuilt only when that changes. The cached minimum is only
+    # dropped after the commit, so the rebuild is handed the new one.
+    min_duration = min((service.duration for service in services), default=30)
+    if min_duration != previous_min_duration:
+        rebuild_day_availability(db, specialist_id, min_duration)
+    # Serialize before commit so expired attributes don't trigger reloads
+    response = {
+        "specialist_id": specialist_id,
+        "services": [service_payload(service) for service in db_services],
+    }
     db.commit()
+    # Matched services keep their ids, so readers only see the new prices and
+    # durations once every worker drops its cached copy - after the commit
+    invalidate_min_service_duration(specialist_id)
+    invalidate_catalog_cache()
+    invalidate_workplace_specialists_cache()
+
+    return response
 
-    # Refresh to get the IDs
-    for service in db_services:
-        db.refresh(service)
 
+def service_payload(service) -> dict:
+    """Plain-dict ServiceResponse shape; skips Pydantic validation on hot reads."""
     return {
-        "specialist_id": specialist_id,
-        "services": [
-            {
-                "id": service.id,
-                "name": service.name,
-                "price": service.price,
-                "duration": service.duration,
-                "specialist_id": service.specialist_id,
-            }
-            for service in db_services
-        ],
+        "id": service.id,
+        "name": service.name,
+        "price": service.price,
+        "duration": service.duration,
+        "specialist_id": service.specialist_id,
+    }
+
+
+def specialist_payload(specialist: Specialist) -> dict:
+    """Plain-dict SpecialistResponse shape; expects services to be eager-loaded."""
+    return {
+        "id": specialist.id,
+        "name": specialist.name,
+        "email": specialist.email,
+        "bio": specialist.bio,
+        "phone": specialist.phone,
+        "services": [service_payload(service) for service in specialist.services],
     }
 
 
-@app.get("/specialist/{specialist_id}/services", response_model=List[ServiceResponse])
+@app.get(
+    "/specialist/{specialist_id}/services",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[ServiceResponse]}},
+)
 def read_specialist_services(specialist_id: int, db: Session = Depends(get_db)):
     """
     Get the services offered by a specialist from the database.
     """
-    specialist = db.query(Specialist).filter(Specialist.id == specialist_id).first()
-    if not specialist:
-        raise HTTPException(status_code=404, detail="Specialist not found")
-
     services = (
-        db.query(ServiceDB).filter(ServiceDB.specialist_id == specialist_id).all()
+        db.query(
+            ServiceDB.id,
+            ServiceDB.name,
+            ServiceDB.price,
+            ServiceDB.duration,
+            ServiceDB.specialist_id,
+        )
+        .filter(ServiceDB.specialist_id == specialist_id)
+        .all()
     )
-    return services
+    # Only look the specialist up when there is nothing to return
+    if not services and not (
+        db.query(Specialist.id).filter(Specialist.id == specialist_id).first()
+    ):
+        raise HTTPException(status_code=404, detail="Specialist not found")
 
+    return ORJSONResponse([service_payload(service) for service in services])
 
-@app.get("/specialist/{specialist_id}", response_model=SpecialistResponse)
+
+@app.get(
+    "/specialist/{specialist_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": SpecialistResponse}},
+)
 def read_specialist(specialist_id: int, db: Session = Depends(get_db)):
     """
     Get a specialist and their services.
     """
-    specialist = db.query(Specialist).filter(Specialist.id == specialist_id).first()
+    from sqlalchemy.orm import joinedload
+
+    specialist = (
+        db.query(Specialist)
+        .options(joinedload(Specialist.services))
+        .filter(Specialist.id == specialist_id)
+        .first()
+    )
     if not specialist:
         raise HTTPException(status_code=404, detail="Specialist not found")
 
-    return specialist
+    return ORJSONResponse(specialist_payload(specialist))
 
 
-@app.get("/specialists/", response_model=List[SpecialistResponse])
+@app.get(
+    "/specialists/",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[SpecialistResponse]}},
+)
 def read_specialists(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """
     Get all specialists.
-    """
-    specialists = db.query(Specialist).offset(skip).limit(limit).all()
-    return specialists
+    Pages are cached in-process until the next catalog-affecting write.
+    """
+    from sqlalchemy.orm import selectinload
+
+    headers = {"Cache-Control": CATALOG_CACHE_CONTROL}
+    key = (catalog_cache_version(), skip, limit)
+    cached = _specialists_page_cache.get(key)
+    if (
+        cached
+        and (datetime.utcnow() - cached[1]).total_seconds()
+        < CATALOG_CACHE_TTL_SECONDS
+    ):
+        return Response(
+            content=cached[0], media_type="application/json", headers=headers
+        )
+
+    specialists = (
+        db.query(Specialist)
+        .options(selectinload(Specialist.services))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    body = orjson.dumps([specialist_payload(s) for s in specialists])
+
+    # Entries from older versions are dead; drop everything when full
+    if len(_specialists_page_cache) >= SPECIALISTS_CACHE_MAX_PAGES:
+        _specialists_page_cache.clear()
+    _specialists_page_cache[key] = (body, datetime.utcnow())
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # Professional Side - Availability Management
@@ -1430,23 +2216,28 @@ def add_availability_slots(
     if not specialist:
         raise HTTPException(status_code=404, detail="Specialist not found")
 
-    db_slots = []
-    for slot in slots:
-        db_slot = AvailabilitySlot(
-            specialist_id=specialist_id,
-            date=slot.date,
-            start_time=slot.start_time,
-            end_time=slot.end_time,
-        )
-        db.add(db_slot)
-        db_slots.append(db_slot)
+    if not slots:
+        return []
 
+    # One multi-row INSERT ... RETURNING instead of an INSERT + refresh per slot
+    db_slots = db.scalars(
+        insert(AvailabilitySlot).returning(
+            AvailabilitySlot, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "specialist_id": specialist_id,
+                "date": slot.date,
+                "start_time": slot.start_time,
+                "end_time": slot.end_time,
+            }
+            for slot in slots
+        ],
+    ).all()
+    response = [AvailabilitySlotResponse.model_validate(slot) for slot in db_slots]
     db.commit()
 
-    for slot in db_slots:
-        db.refresh(slot)
-
-    return db_slots
+    return response
 
 
 # Advanced Calendar Event Management - Google Calendar Level Features
@@ -1474,7 +2265,7 @@ def create_calendar_event(
     # Generate recurring event ID for recurring events
     recurring_event_id = None
     if event.is_recurring:
-        recurring_event_id = f"{specialist_id}_{datetime.utcnow().timestamp()}"
+        recurring_event_id = f"{specialist_id}_{uuid.uuid4().hex}"
 
     # Convert recurrence rule to JSON
     recurrence_json = None
@@ -1503,24 +2294,36 @@ def create_calendar_event(
         status=event.status,
         visibility=event.visibility,
         recurring_event_id=recurring_event_id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
     )
 
+    # Base event and its instances are written in one transaction; flush
+    # assigns the id without a commit and re-SELECT
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    db.flush()
 
     # Generate recurring event instances if needed
     if event.is_recurring and event.recurrence_rule:
         generate_recurring_event_instances(db, db_event, event.recurrence_rule)
+        refresh_day_availability(
+            db, specialist_id, series_future_dates(db, recurring_event_id)
+        )
+    else:
+        refresh_day_availability(db, specialist_id, [db_event.start_datetime])
+    db.commit()
 
     return db_event
 
 
+@lru_cache(maxsize=256)
+def parse_csv_param(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated filter into distinct, non-empty values (cached)."""
+    return tuple(dict.fromkeys(v for v in (p.strip() for p in value.split(",")) if v))
+
+
 @app.get(
     "/specialist/{specialist_id}/calendar/events",
-    response_model=List[CalendarEventResponse],
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[CalendarEventResponse]}},
 )
 def get_calendar_events(
     specialist_id: int,
@@ -1529,12 +2332,16 @@ def get_calendar_events(
     event_types: Optional[str] = None,  # Comma-separated list
     categories: Optional[str] = None,  # Comma-separated list
     include_recurring: bool = True,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the last page"),
     db: Session = Depends(get_db),
-    current_specialist: Optional[Specialist] = Depends(get_current_user),
+    current_specialist: Optional[Specialist] = Depends(get_current_specialist_async),
 ):
     """
     Get calendar events with advanced filtering options.
     Public availability events are visible to everyone, private events only to owner.
+    With `limit`, results are paged by (start_datetime, id); the X-Next-Cursor
+    response header carries the cursor for the next page.
     """
     query = db.query(CalendarEvent).filter(
         CalendarEvent.specialist_id == specialist_id, CalendarEvent.is_active == True
@@ -1556,21 +2363,55 @@ def get_calendar_events(
 
     # Event type filtering
     if event_types:
-        type_list = [t.strip() for t in event_types.split(",")]
-        query = query.filter(CalendarEvent.event_type.in_(type_list))
+        query = query.filter(CalendarEvent.event_type.in_(parse_csv_param(event_types)))
 
     # Category filtering
     if categories:
-        category_list = [c.strip() for c in categories.split(",")]
-        query = query.filter(CalendarEvent.category.in_(category_list))
+        query = query.filter(CalendarEvent.category.in_(parse_csv_param(categories)))
 
-    events = query.order_by(CalendarEvent.start_datetime).all()
+    # Keyset pagination - resume after the last (start_datetime, id) seen
+    if cursor:
+        try:
+            cursor_start, _, cursor_id = cursor.rpartition("_")
+            cursor_start = datetime.fromisoformat(cursor_start)
+            cursor_id = int(cursor_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            (CalendarEvent.start_datetime > cursor_start)
+            | (
+                (CalendarEvent.start_datetime == cursor_start)
+                & (CalendarEvent.id > cursor_id)
+            )
+        )
 
-    # Apply recurring event exceptions
+    # Recurring event exceptions are fetched in the same query
     if include_recurring:
-        events = apply_recurring_exceptions(db, events, start_date, end_date)
-
-    return events
+        query = with_recurring_exceptions(query).order_by(
+            CalendarEvent.start_datetime, CalendarEvent.id, EventException.id
+        )
+    else:
+        query = query.order_by(CalendarEvent.start_datetime, CalendarEvent.id)
+    if limit:
+        query = query.limit(limit)
+    rows = query.all()
+
+    # Take the cursor before exceptions can move an event's start
+    next_cursor = None
+    if limit and len(rows) == limit:
+        last_event = rows[-1][0] if include_recurring else rows[-1]
+        next_cursor = f"{last_event.start_datetime.isoformat()}_{last_event.id}"
+
+    events = apply_recurring_exceptions(rows) if include_recurring else rows
+
+    # Validate once and let orjson encode the datetimes natively, instead of
+    # response_model validation followed by jsonable_encoder
+    response = ORJSONResponse(
+        [CalendarEventResponse.model_validate(event).model_dump() for event in events]
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 
 @app.put(
@@ -1604,6 +2445,8 @@ def update_calendar_event(
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
 
+    previous_start = db_event.start_datetime
+
     # Handle recurring event modifications
     if db_event.is_recurring and not modify_series:
         # Create exception for this specific instance
@@ -1615,10 +2458,14 @@ def update_calendar_event(
 
         db_event.updated_at = datetime.utcnow()
 
+    refresh_day_availability(
+        db, specialist_id, [previous_start, db_event.start_datetime]
+    )
+    # The in-memory event is current; no re-SELECT after commit
+    response = CalendarEventResponse.model_validate(db_event)
     db.commit()
-    db.refresh(db_event)
 
-    return db_event
+    return response
 
 
 @app.delete("/specialist/{specialist_id}/calendar/events/{event_id}")
@@ -1653,9 +2500,13 @@ def delete_calendar_event(
         db.query(CalendarEvent).filter(
             CalendarEvent.recurring_event_id == db_event.recurring_event_id
         ).update({"is_active": False})
+        refresh_day_availability(
+            db, specialist_id, series_future_dates(db, db_event.recurring_event_id)
+        )
     else:
         # Delete just this event
         db_event.is_active = False
+        refresh_day_availability(db, specialist_id, [db_event.start_datetime])
 
     db.commit()
 
@@ -1760,7 +2611,7 @@ def create_recurring_schedule(
     )
 
     # Generate recurring event ID
-    recurring_event_id = f"{specialist_id}_{datetime.utcnow().timestamp()}"
+    recurring_event_id = f"{specialist_id}_{uuid.uuid4().hex}"
 
     # Create base calendar event
     db_event = CalendarEvent(
@@ -1785,13 +2636,12 @@ def create_recurring_schedule(
         status="confirmed",
         visibility="public",
         recurring_event_id=recurring_event_id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
     )
 
+    # Base event and its instances are written in one transaction; flush
+    # assigns the id without a commit and re-SELECT
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    db.flush()
 
     # Pre-create instances for the lookahead period (default 12 weeks)
     lookahead_weeks = recurrence_rule.lookahead_weeks
@@ -1801,10 +2651,12 @@ def create_recurring_schedule(
     generate_instances_for_range(
         db, db_event, recurrence_rule, datetime.utcnow(), lookahead_end
     )
+    event_id = db_event.id
+    db.commit()
 
     return {
         "message": "Recurring schedule created successfully",
-        "event_id": db_event.id,
+        "event_id": event_id,
         "recurring_event_id": recurring_event_id,
         "recurrence_type": schedule.recurrence_type,
         "workplace_id": schedule.workplace_id,
@@ -1855,53 +2707,57 @@ def get_recurring_schedules(
         .all()
     )
 
+    # Load all referenced workplaces in one query
+    workplace_ids = {e.workplace_id for e in recurring_events if e.workplace_id}
+    workplaces = {}
+    if workplace_ids:
+        for workplace in db.query(Workplace).filter(Workplace.id.in_(workplace_ids)):
+            workplaces[workplace.id] = {
+                "id": workplace.id,
+                "name": workplace.name,
+                "address": workplace.address,
+                "city": workplace.city,
+            }
+
     schedules = []
     for event in recurring_events:
+        # Rules were validated on write; read only the fields shown here
+        # instead of rebuilding a RecurrenceRule per row
         recurrence_rule = None
         if event.recurrence_rule:
             try:
-                import json
-
-                recurrence_data = json.loads(event.recurrence_rule)
-                recurrence_rule = RecurrenceRule(**recurrence_data)
-            except Exception as e:
+                recurrence_data = orjson.loads(event.recurrence_rule)
+                recurrence_rule = {
+                    "freq": recurrence_data["freq"],
+                    "byweekday": recurrence_data.get("byweekday"),
+                    "until": recurrence_data.get("until"),
+                }
+            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
                 print(
                     f"ERROR: Failed to parse recurrence rule for event {event.id}: {e}"
                 )
                 continue
 
-        # Get workplace information if associated
-        workplace_info = None
-        if event.workplace_id:
-            workplace = (
-                db.query(Workplace).filter(Workplace.id == event.workplace_id).first()
-            )
-            if workplace:
-                workplace_info = {
-                    "id": workplace.id,
-                    "name": workplace.name,
-                    "address": workplace.address,
-                    "city": workplace.city,
-                }
-
         schedules.append(
             {
                 "id": event.id,
                 "title": event.title,
                 "recurrence_type": (
-                    recurrence_rule.freq.lower() if recurrence_rule else "unknown"
+                    recurrence_rule["freq"].lower() if recurrence_rule else "unknown"
+                ),
+                "days_of_week": (
+                    recurrence_rule["byweekday"] if recurrence_rule else None
                 ),
-                "days_of_week": recurrence_rule.byweekday if recurrence_rule else None,
                 "start_time": event.start_datetime.strftime("%H:%M"),
                 "end_time": event.end_datetime.strftime("%H:%M"),
                 "start_date": event.start_datetime.strftime("%Y-%m-%d"),
                 "end_date": (
-                    recurrence_rule.until.strftime("%Y-%m-%d")
-                    if recurrence_rule and recurrence_rule.until
+                    recurrence_rule["until"][:10]
+                    if recurrence_rule and recurrence_rule["until"]
                     else None
                 ),
                 "workplace_id": event.workplace_id,
-                "workplace": workplace_info,
+                "workplace": workplaces.get(event.workplace_id),
                 "created_at": event.created_at.isoformat(),
             }
         )
@@ -1985,6 +2841,7 @@ def get_calendar_instances(
 
         except Exception as e:
             continue
+    db.commit()
 
     # Step 3: Now query the instances that exist in this date range
     events = (
@@ -2002,6 +2859,17 @@ def get_calendar_instances(
         .all()
     )
 
+    # Load every referenced workplace in one IN query instead of one per instance
+    workplace_ids = {event.workplace_id for event in events if event.workplace_id}
+    workplaces_by_id = {}
+    if workplace_ids:
+        workplaces_by_id = {
+            workplace.id: workplace
+            for workplace in db.query(Workplace)
+            .filter(Workplace.id.in_(workplace_ids))
+            .all()
+        }
+
     instances = []
     for event in events:
         # Calculate day of week (0=Monday, 6=Sunday)
@@ -2010,9 +2878,7 @@ def get_calendar_instances(
         # Get workplace information if associated
         workplace_info = None
         if event.workplace_id:
-            workplace = (
-                db.query(Workplace).filter(Workplace.id == event.workplace_id).first()
-            )
+            workplace = workplaces_by_id.get(event.workplace_id)
             if workplace:
                 workplace_info = {
                     "id": workplace.id,
@@ -2141,6 +3007,9 @@ def update_recurring_schedule(
             recurrence_data = json.loads(event.recurrence_rule)
             recurrence_rule = RecurrenceRule(**recurrence_data)
 
+            # Days the old instances covered need their summaries refreshed too
+            affected_dates = series_future_dates(db, event.recurring_event_id)
+
             # Delete existing instances for this day of week
             db.query(CalendarEvent).filter(
                 CalendarEvent.recurring_event_id == event.recurring_event_id,
@@ -2150,6 +3019,12 @@ def update_recurring_schedule(
 
             # Regenerate instances with new times
             generate_recurring_event_instances(db, event, recurrence_rule)
+            refresh_day_availability(
+                db,
+                event.specialist_id,
+                affected_dates | series_future_dates(db, event.recurring_event_id),
+            )
+            db.commit()
 
         return {
             "message": "Recurring schedule updated successfully",
@@ -2223,6 +3098,11 @@ def delete_recurring_schedule_day(
                     CalendarEvent.is_active == True,
                 ).update({"is_active": False, "updated_at": datetime.utcnow()})
 
+            refresh_day_availability(
+                db,
+                event.specialist_id,
+                series_future_dates(db, event.recurring_event_id),
+            )
             db.commit()
             return {"message": "Entire recurring schedule deleted"}
 
@@ -2248,6 +3128,11 @@ def delete_recurring_schedule_day(
                     CalendarEvent.is_active == True,
                 ).update({"is_active": False, "updated_at": datetime.utcnow()})
 
+            refresh_day_availability(
+                db,
+                event.specialist_id,
+                series_future_dates(db, event.recurring_event_id),
+            )
             db.commit()
             return {"message": "Last day removed - entire recurring schedule deleted"}
 
@@ -2256,6 +3141,7 @@ def delete_recurring_schedule_day(
         event.updated_at = datetime.utcnow()
 
         # Delete existing instances and regenerate without the removed day
+        affected_dates = series_future_dates(db, event.recurring_event_id)
         if event.recurring_event_id:
             db.query(CalendarEvent).filter(
                 CalendarEvent.recurring_event_id == event.recurring_event_id,
@@ -2266,6 +3152,11 @@ def delete_recurring_schedule_day(
             # Regenerate instances with updated days
             generate_recurring_event_instances(db, event, recurrence_rule)
 
+        refresh_day_availability(
+            db,
+            event.specialist_id,
+            affected_dates | series_future_dates(db, event.recurring_event_id),
+        )
         db.commit()
         return {
             "message": f"Day {day_of_week} removed from recurring schedule",
@@ -2318,6 +3209,9 @@ def delete_recurring_schedule_series(
             CalendarEvent.is_active == True,
         ).update({"is_active": False, "updated_at": datetime.utcnow()})
 
+    refresh_day_availability(
+        db, event.specialist_id, series_future_dates(db, event.recurring_event_id)
+    )
     db.commit()
 
     return {
@@ -2359,6 +3253,7 @@ def delete_calendar_instance(
     event.is_active = False
     event.updated_at = datetime.utcnow()
 
+    refresh_day_availability(db, event.specialist_id, [event.start_datetime])
     db.commit()
 
     return {
@@ -2406,6 +3301,9 @@ def delete_calendar_series(
         .update({"is_active": False, "updated_at": datetime.utcnow()})
     )
 
+    refresh_day_availability(
+        db, sample_event.specialist_id, series_future_dates(db, recurring_event_id)
+    )
     db.commit()
 
     return {
@@ -2558,13 +3456,13 @@ def bulk_calendar_operations(
     specialist_id: int,
     operation: BulkEventOperation,
     db: Session = Depends(get_db),
-    current_specialist: Specialist = Depends(require_authentication_dep),
+    current_specialist_id: int = Depends(get_current_specialist_id),
 ):
     """
     Perform bulk operations on calendar events for efficiency.
     Supports creating multiple events, batch updates, etc.
     """
-    if current_specialist.id != specialist_id:
+    if current_specialist_id != specialist_id:
         raise HTTPException(
             status_code=403, detail="You can only manage your own calendar"
         )
@@ -2575,6 +3473,44 @@ def bulk_calendar_operations(
 # Working Hours and Preferences Management
 
 
+def insert_working_hours(
+    db: Session, specialist_id: int, working_hours_list: List[WorkingHoursCreate]
+) -> List[WorkingHoursResponse]:
+    """
+    Insert one or more working-hours rows with a single multi-row INSERT.
+    Returns responses for exactly the inserted rows, in payload order.
+    """
+    today = date.today()
+    rows = [
+        {
+            "specialist_id": specialist_id,
+            "day_of_week": working_hours.day_of_week,
+            # JSON column - the engine's orjson serializer encodes it once
+            "time_ranges": [tr.model_dump() for tr in working_hours.time_ranges],
+            "is_working_day": working_hours.is_working_day,
+            "break_duration": working_hours.break_duration,
+            "break_start_time": working_hours.break_start_time,
+            "timezone": working_hours.timezone,
+            "effective_date": working_hours.effective_date or today,
+            "is_active": True,
+        }
+        for working_hours in working_hours_list
+    ]
+
+    # INSERT ... RETURNING hands back this request's own rows, lined up with
+    # the payload - duplicate keys and concurrent writers can't be mixed in
+    inserted = db.scalars(
+        insert(WorkingHours).returning(WorkingHours, sort_by_parameter_order=True),
+        rows,
+    ).all()
+
+    # Serialize before commit so expired attributes don't trigger a reload per row
+    responses = [WorkingHoursResponse.model_validate(wh) for wh in inserted]
+    db.commit()
+
+    return responses
+
+
 @app.post(
     "/specialist/{specialist_id}/working-hours",
     response_model=WorkingHoursResponse,
@@ -2583,52 +3519,41 @@ def set_working_hours(
     specialist_id: int,
     working_hours: WorkingHoursCreate,
     db: Session = Depends(get_db),
-    current_specialist: Specialist = Depends(require_authentication_dep),
+    current_specialist_id: int = Depends(get_current_specialist_id),
 ):
     """
     Set working hours with support for multiple time ranges per day and breaks.
     """
-    if current_specialist.id != specialist_id:
+    if current_specialist_id != specialist_id:
         raise HTTPException(
             status_code=403, detail="You can only manage your own working hours"
         )
 
-    # Convert time ranges to JSON
-    time_ranges_json = json.dumps(
-        [
-            {
-                "start_time": tr.start_time.isoformat() if tr.start_time else None,
-                "end_time": tr.end_time.isoformat() if tr.end_time else None,
-                "start_datetime": (
-                    tr.start_datetime.isoformat() if tr.start_datetime else None
-                ),
-                "end_datetime": (
-                    tr.end_datetime.isoformat() if tr.end_datetime else None
-                ),
-                "is_all_day": tr.is_all_day,
-                "timezone": tr.timezone,
-            }
-            for tr in working_hours.time_ranges
-        ]
-    )
+    return insert_working_hours(db, specialist_id, [working_hours])[0]
 
-    db_working_hours = WorkingHours(
-        specialist_id=specialist_id,
-        day_of_week=working_hours.day_of_week,
-        time_ranges=time_ranges_json,
-        is_working_day=working_hours.is_working_day,
-        break_duration=working_hours.break_duration,
-        break_start_time=working_hours.break_start_time,
-        timezone=working_hours.timezone,
-        effective_date=working_hours.effective_date or date.today(),
-        is_active=True,
-    )
 
-    db.add(db_working_hours)
-    db.commit()
-    db.refresh(db_working_hours)
+@app.post(
+    "/specialist/{specialist_id}/working-hours/bulk",
+    response_model=List[WorkingHoursResponse],
+)
+def set_working_hours_bulk(
+    specialist_id: int,
+    working_hours: List[WorkingHoursCreate],
+    db: Session = Depends(get_db),
+    current_specialist_id: int = Depends(get_current_specialist_id),
+):
+    """
+    Set working hours for several days at once (e.g. a full week) in one request.
+    """
+    if current_specialist_id != specialist_id:
+        raise HTTPException(
+            status_code=403, detail="You can only manage your own working hours"
+        )
 
-    return db_working_hours
+    if not working_hours:
+        raise HTTPException(status_code=400, detail="No working hours provided")
+
+    return insert_working_hours(db, specialist_id, working_hours)
 
 
 @app.get(
@@ -2637,20 +3562,41 @@ def set_working_hours(
 )
 def get_working_hours(
     specialist_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
     Get working hours configuration for a specialist.
+    Supports conditional requests: returns 304 when If-None-Match matches.
     """
+    active_filter = (
+        WorkingHours.specialist_id == specialist_id,
+        WorkingHours.is_active == True,
+    )
+
+    # Cheap aggregate to validate the client's cached copy before loading rows
+    row_count, max_id, last_updated = (
+        db.query(
+            func.count(WorkingHours.id),
+            func.max(WorkingHours.id),
+            func.max(WorkingHours.updated_at),
+        )
+        .filter(*active_filter)
+        .one()
+    )
+    etag = make_etag("working-hours", specialist_id, row_count, max_id, last_updated)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     working_hours = (
         db.query(WorkingHours)
-        .filter(
-            WorkingHours.specialist_id == specialist_id, WorkingHours.is_active == True
-        )
+        .filter(*active_filter)
         .order_by(WorkingHours.day_of_week)
         .all()
     )
 
+    response.headers["ETag"] = etag
     return working_hours
 
 
@@ -2662,86 +3608,183 @@ def set_scheduling_preferences(
     specialist_id: int,
     preferences: SchedulingPreferencesCreate,
     db: Session = Depends(get_db),
-    current_specialist: Specialist = Depends(require_authentication_dep),
+    current_specialist_id: int = Depends(get_current_specialist_id),
 ):
     """
     Set comprehensive scheduling preferences for intelligent calendar management.
     """
-    if current_specialist.id != specialist_id:
+    if current_specialist_id != specialist_id:
         raise HTTPException(
             status_code=403, detail="You can only manage your own preferences"
         )
 
-    # Check if preferences already exist
-    existing = (
-        db.query(SchedulingPreferences)
-        .filter(
-            SchedulingPreferences.specialist_id == specialist_id,
-            SchedulingPreferences.is_active == True,
+    # Insert or update the active preferences row in a single statement;
+    # timestamps come from the database clock
+    values = preferences.dict()
+    stmt = (
+        dialect_insert(db, SchedulingPreferences)
+        .values(specialist_id=specialist_id, **values, is_active=True)
+        .on_conflict_do_update(
+            index_elements=[SchedulingPreferences.specialist_id],
+            index_where=SchedulingPreferences.is_active == True,
+            set_={**values, "updated_at": func.now()},
         )
-        .first()
+        .returning(SchedulingPreferences)
+    )
+    db_preferences = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one()
+
+    # RETURNING already populated every column - serialize before commit
+    # expires the instance to avoid reloading it
+    preferences_response = SchedulingPreferencesResponse.model_validate(
+        db_preferences
     )
+    db.commit()
 
-    if existing:
-        # Update existing preferences
-        for field, value in preferences.dict().items():
-            setattr(existing, field, value)
-        existing.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(existing)
-        return existing
-    else:
-        # Create new preferences
-        db_preferences = SchedulingPreferences(
-            specialist_id=specialist_id,
-            **preferences.dict(),
-            is_active=True,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-        db.add(db_preferences)
-        db.commit()
-        db.refresh(db_preferences)
-        return db_preferences
+    return preferences_response
 
 
 # Consumer Side - Browse and Book
-@app.get("/catalog/specialists", response_model=List[SpecialistCatalogResponse])
-def get_specialists_catalog(db: Session = Depends(get_db)):
+# In-process cache of the serialized catalog. Any write that changes specialists,
+# services or availability bumps _catalog_version, plus a shared generation in
+# Redis (when configured) so other workers drop their copies too; without Redis
+# the TTL bounds staleness across worker processes.
+CATALOG_CACHE_TTL_SECONDS = 60
+CATALOG_CACHE_GENERATION_KEY = "catalog:gen"
+_catalog_version = 0
+_catalog_redis = None
+if REDIS_AVAILABLE and settings.REDIS_URL:
+    _catalog_redis = redis.Redis.from_url(settings.REDIS_URL)
+_catalog_cache: Optional[tuple] = None  # (version, day, etag, body, cached_at)
+# Serialized /specialists/ pages: (version, skip, limit) -> (body, cached_at)
+SPECIALISTS_CACHE_MAX_PAGES = 64
+_specialists_page_cache: dict = {}
+# Public directory responses may also be absorbed by browsers/CDNs briefly
+CATALOG_CACHE_CONTROL = "public, max-age=30"
+
+
+def invalidate_catalog_cache():
+    """Invalidate the cached catalog response after a catalog-affecting write."""
+    global _catalog_version
+    _catalog_version += 1
+    if _catalog_redis is None:
+        return
+    try:
+        _catalog_redis.incr(CATALOG_CACHE_GENERATION_KEY)
+    except Exception as e:
+        print(f"Error invalidating catalog cache: {e}")
+
+
+@listens_for(Session, "after_commit")
+def _catalog_after_commit(session: Session):
+    """Invalidate the catalog once summary changes are visible to readers."""
+    if session.info.pop("catalog_dirty", False):
+        invalidate_catalog_cache()
+
+
+@listens_for(Session, "after_rollback")
+def _catalog_after_rollback(session: Session):
+    session.info.pop("catalog_dirty", None)
+
+
+def catalog_cache_version():
+    """Version cached catalog responses are keyed by, shared across workers."""
+    if _catalog_redis is None:
+        return _catalog_version
+    try:
+        return (_catalog_version, _catalog_redis.get(CATALOG_CACHE_GENERATION_KEY))
+    except Exception as e:
+        print(f"Error reading catalog cache generation: {e}")
+        return _catalog_version
+
+
+@app.get(
+    "/catalog/specialists",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[SpecialistCatalogResponse]}},
+)
+def get_specialists_catalog(request: Request, db: Session = Depends(get_db)):
     """
     Get all specialists with their services and availability for consumers to browse.
+    Supports conditional requests: returns 304 when If-None-Match matches.
     """
-    specialists = db.query(Specialist).all()
-    catalog = []
+    global _catalog_cache
+    today = date.today()
 
-    for specialist in specialists:
-        # Get unique dates with availability from CalendarEvent (recurring schedules)
-        available_events = (
-            db.query(CalendarEvent)
-            .filter(CalendarEvent.specialist_id == specialist.id)
-            .filter(CalendarEvent.event_type == "availability")
-            .filter(CalendarEvent.is_active == True)
-            .filter(CalendarEvent.start_datetime >= datetime.now())
-            .all()
+    cached = _catalog_cache
+    if (
+        cached
+        and cached[0] == catalog_cache_version()
+        and cached[1] == today
+        and (datetime.utcnow() - cached[4]).total_seconds()
+        < CATALOG_CACHE_TTL_SECONDS
+    ):
+        headers = {"ETag": cached[2], "Cache-Control": CATALOG_CACHE_CONTROL}
+        if etag_matches(request, cached[2]):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=cached[3], media_type="application/json", headers=headers
         )
 
-        # Extract unique dates
-        available_dates = list(
-            set(event.start_datetime.date() for event in available_events)
+    version = catalog_cache_version()
+
+    # Column projections only - the catalog never needs hydrated ORM objects
+    specialists = db.query(Specialist.id, Specialist.name, Specialist.bio).all()
+    # Read bookable dates from the materialized day-availability summary
+    # instead of scanning CalendarEvent per specialist
+    available_days = (
+        db.query(
+            SpecialistDayAvailability.specialist_id, SpecialistDayAvailability.date
+        )
+        .filter(
+            SpecialistDayAvailability.date >= today,
+            SpecialistDayAvailability.has_free_slots == True,
         )
-        available_dates.sort()
+        .order_by(SpecialistDayAvailability.date)
+        .all()
+    )
 
-        catalog.append(
-            SpecialistCatalogResponse(
-                id=specialist.id,
-                name=specialist.name,
-                bio=specialist.bio,
-                services=specialist.services,
-                available_dates=available_dates,
-            )
+    dates_by_specialist = {}
+    for specialist_id, available_date in available_days:
+        dates_by_specialist.setdefault(specialist_id, []).append(available_date)
+
+    # Load every specialist's services in one query rather than one lazy load each
+    services_by_specialist = {}
+    for service in db.query(
+        ServiceDB.id,
+        ServiceDB.name,
+        ServiceDB.price,
+        ServiceDB.duration,
+        ServiceDB.specialist_id,
+    ).order_by(ServiceDB.id):
+        services_by_specialist.setdefault(service.specialist_id, []).append(
+            service_payload(service)
         )
 
-    return catalog
+    # Build plain dicts (shape of SpecialistCatalogResponse) and encode once with
+    # orjson - no per-row Pydantic validation; dates serialize natively
+    catalog = [
+        {
+            "id": specialist.id,
+            "name": specialist.name,
+            "bio": specialist.bio,
+            "services": services_by_specialist.get(specialist.id, []),
+            "available_dates": dates_by_specialist.get(specialist.id, []),
+        }
+        for specialist in specialists
+    ]
+
+    # The ETag hashes the body itself, so any change to a name, bio, price,
+    # duration or date yields a new tag - ids and counts alone can't see edits
+    body = orjson.dumps(catalog)
+    etag = content_etag(body)
+    _catalog_cache = (version, today, etag, body, datetime.utcnow())
+
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/specialist/{specialist_id}/availability/{booking_date}")
@@ -2763,149 +3806,26 @@ def get_available_time_slots(
         service_duration = service.duration
     else:
         # Find the minimum service duration for this specialist to determine smallest available slots
-        min_service = (
-            db.query(ServiceDB)
-            .filter(ServiceDB.specialist_id == specialist_id)
-            .order_by(ServiceDB.duration)
-            .first()
-        )
-        if not min_service:
-            # If no services exist, default to 30 minutes
-            service_duration = 30
-        else:
-            service_duration = min_service.duration
-
-    # Get availability slots for the date - DEPRECATED: Only using CalendarEvent now
-    # availability_slots = (
-    #     db.query(AvailabilitySlot)
-    #     .filter(
-    #         AvailabilitySlot.specialist_id == specialist_id,
-    #         AvailabilitySlot.date == booking_date,
-    #         AvailabilitySlot.is_available == True,
-    #     )
-    #     .all()
-    # )
-    availability_slots = []  # Ignore legacy availability slots
-
-    # Also get calendar events that represent availability (from recurring schedules)
-    calendar_availability = (
-        db.query(CalendarEvent)
-        .filter(
-            CalendarEvent.specialist_id == specialist_id,
-            CalendarEvent.event_type == "availability",
-            CalendarEvent.status == "confirmed",
-            CalendarEvent.is_active == True,  # Only return active events
-            func.date(CalendarEvent.start_datetime) == booking_date,
-        )
-        .all()
-    )
+        service_duration = get_min_service_duration(db, specialist_id)
 
-    # Get existing bookings for the date
-    existing_bookings = (
-        db.query(Booking)
-        .filter(
-            Booking.specialist_id == specialist_id,
-            Booking.date == booking_date,
-            Booking.status == "confirmed",
-        )
-        .all()
+    # Legacy AvailabilitySlot rows are deprecated - only CalendarEvent availability is used
+    # A day's slot list is small; building it on the request session keeps DB
+    # errors on a proper error status instead of a truncated 200 stream
+    return compute_available_time_slots(
+        db, specialist_id, booking_date, service_duration
     )
 
-    available_slots = []
-    for slot in availability_slots:
-        # Generate time slots within the availability window
-        current_time = datetime.combine(booking_date, slot.start_time)
-        end_time = datetime.combine(booking_date, slot.end_time)
-
-        while current_time + timedelta(minutes=service_duration) <= end_time:
-            slot_end = current_time + timedelta(minutes=service_duration)
-
-            # Check if this slot conflicts with existing bookings
-            conflict = False
-            for booking in existing_bookings:
-                booking_start = datetime.combine(booking_date, booking.start_time)
-                booking_end = datetime.combine(booking_date, booking.end_time)
-
-                if current_time < booking_end and slot_end > booking_start:
-                    conflict = True
-                    break
-
-            # Check if this slot conflicts with calendar events (blocks, PTO, etc.)
-            if not conflict:
-                calendar_conflict = has_calendar_conflict(
-                    db,
-                    specialist_id,
-                    datetime.combine(booking_date, current_time.time()),
-                    datetime.combine(booking_date, slot_end.time()),
-                )
-                conflict = calendar_conflict
-
-            if not conflict:
-                available_slots.append(
-                    {
-                        "start_time": current_time.time(),
-                        "end_time": slot_end.time(),
-                        "duration_minutes": service_duration,
-                    }
-                )
-
-            # Increment by the shortest service duration to allow booking any service
-            # This ensures customers can book any service at properly spaced intervals
-            current_time += timedelta(minutes=service_duration)
-
-    # Also process calendar availability events (from recurring schedules)
-    for cal_event in calendar_availability:
-        # Generate time slots within the calendar availability window
-        current_time = cal_event.start_datetime
-        end_time = cal_event.end_datetime
-
-        while current_time + timedelta(minutes=service_duration) <= end_time:
-            slot_end = current_time + timedelta(minutes=service_duration)
-
-            # Check if this slot conflicts with existing bookings
-            conflict = False
-            for booking in existing_bookings:
-                booking_start = datetime.combine(booking_date, booking.start_time)
-                booking_end = datetime.combine(booking_date, booking.end_time)
-
-                if current_time < booking_end and slot_end > booking_start:
-                    conflict = True
-                    break
-
-            # Check if this slot conflicts with calendar events (blocks, PTO, etc.)
-            # Skip the current availability event itself from conflict check
-            if not conflict:
-                calendar_conflict = has_calendar_conflict(
-                    db,
-                    specialist_id,
-                    current_time,
-                    slot_end,
-                    exclude_event_id=cal_event.id,  # Exclude the current availability event
-                )
-                conflict = calendar_conflict
-
-            if not conflict:
-                # Check if this slot is already in available_slots to avoid duplicates
-                slot_time = current_time.time()
-                slot_exists = any(
-                    slot["start_time"] == slot_time for slot in available_slots
-                )
-
-                if not slot_exists:
-                    available_slots.append(
-                        {
-                            "start_time": slot_time,
-                            "end_time": slot_end.time(),
-                            "duration_minutes": service_duration,
-                        }
-                    )
-
-            # Increment by the service duration
-            current_time += timedelta(minutes=service_duration)
 
-    # Sort available slots by start time and return
-    available_slots.sort(key=lambda slot: slot["start_time"])
-    return available_slots
+def is_booking_slot_conflict(error: IntegrityError) -> bool:
+    """Whether an IntegrityError came from the uq_booking_confirmed_slot index."""
+    # PostgreSQL drivers expose the constraint name; SQLite names the columns
+    constraint = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint:
+        return constraint == "uq_booking_confirmed_slot"
+    message = str(error.orig)
+    return "uq_booking_confirmed_slot" in message or (
+        "bookings.specialist_id, bookings.date, bookings.start_time" in message
+    )
 
 
 @app.post("/booking/", response_model=BookingResponse)
@@ -2913,159 +3833,156 @@ def create_booking(booking: BookingCreate, db: Session = Depends(get_db)):
     """
     Create a new booking for a consumer with comprehensive validation.
     """
-    try:
-        # Validate phone number format if provided
-        if booking.client_phone:
-            normalized_phone = normalize_phone(booking.client_phone)
-            if not normalized_phone:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid phone number. Must be a valid 10-digit US phone number.",
-                )
-            booking.client_phone = normalized_phone
-
-        # Validate specialist exists
-        specialist = (
-            db.query(Specialist).filter(Specialist.id == booking.specialist_id).first()
-        )
-        if not specialist:
-            raise HTTPException(status_code=404, detail="Specialist not found")
-
-        # Validate service exists and belongs to specialist
-        service = (
-            db.query(ServiceDB)
-            .filter(
-                ServiceDB.id == booking.service_id,
-                ServiceDB.specialist_id == booking.specialist_id,
-            )
-            .first()
-        )
-        if not service:
+    # Validate phone number format if provided
+    if booking.client_phone:
+        normalized_phone = normalize_phone(booking.client_phone)
+        if not normalized_phone:
             raise HTTPException(
-                status_code=404, detail="Service not found for this specialist"
-            )
-
-        # Validate that there's an availability slot covering this time
-        # Check calendar events that represent availability (from recurring schedules)
-        calendar_availability = (
-            db.query(CalendarEvent)
-            .filter(
-                CalendarEvent.specialist_id == booking.specialist_id,
-                CalendarEvent.event_type == "availability",
-                CalendarEvent.status == "confirmed",
-                CalendarEvent.is_active == True,
-                func.date(CalendarEvent.start_datetime) == booking.booking_date,
+                status_code=400,
+                detail="Invalid phone number. Must be a valid 10-digit US phone number.",
             )
-            .all()
+        booking.client_phone = normalized_phone
+
+    # Validate specialist exists and the service belongs to them in one query
+    specialist_service = (
+        db.query(Specialist.id, ServiceDB)
+        .outerjoin(
+            ServiceDB,
+            (ServiceDB.specialist_id == Specialist.id)
+            & (ServiceDB.id == booking.service_id),
         )
+        .filter(Specialist.id == booking.specialist_id)
+        .first()
+    )
+    if not specialist_service:
+        raise HTTPException(status_code=404, detail="Specialist not found")
 
-        # Check if the requested time falls within any availability slot
-        booking_start = datetime.combine(booking.booking_date, booking.start_time)
-        booking_end = booking_start + timedelta(minutes=service.duration)
+    service = specialist_service[1]
+    if not service:
+        raise HTTPException(
+            status_code=404, detail="Service not found for this specialist"
+        )
 
-        valid_slot = None
+    booking_start = datetime.combine(booking.booking_date, booking.start_time)
+    booking_end = booking_start + timedelta(minutes=service.duration)
 
-        # Check calendar availability events
-        for cal_event in calendar_availability:
-            # Check if booking fits within this calendar availability
-            if (
-                booking_start >= cal_event.start_datetime
-                and booking_end <= cal_event.end_datetime
-            ):
-                valid_slot = cal_event  # Use calendar event as valid slot indicator
-                break
+    # Availability coverage and booking conflicts are evaluated server-side as
+    # two EXISTS predicates in a single round-trip
+    covering_availability = (
+        db.query(CalendarEvent.id)
+        .filter(
+            CalendarEvent.specialist_id == booking.specialist_id,
+            CalendarEvent.event_type == "availability",
+            CalendarEvent.status == "confirmed",
+            CalendarEvent.is_active == True,
+            # Same day as a range (index-friendly) rather than date(...)
+            CalendarEvent.start_datetime
+            >= datetime.combine(booking.booking_date, time.min),
+            CalendarEvent.start_datetime <= booking_start,
+            CalendarEvent.end_datetime >= booking_end,
+        )
+        .exists()
+    )
+    conflicting_booking = (
+        db.query(Booking.id)
+        .filter(
+            Booking.specialist_id == booking.specialist_id,
+            Booking.date == booking.booking_date,
+            Booking.status == "confirmed",
+        )
+        .filter(
+            # Check for time overlap
+            (Booking.start_time < booking_end.time())
+            & (Booking.end_time > booking_start.time())
+        )
+        .exists()
+    )
 
-        if not valid_slot:
-            raise HTTPException(
-                status_code=404, detail="No availability slot covers the requested time"
-            )
+    has_availability, has_conflict = db.query(
+        covering_availability, conflicting_booking
+    ).one()
 
-        # Check for conflicts with existing bookings
-        existing_booking = (
-            db.query(Booking)
-            .filter(
-                Booking.specialist_id == booking.specialist_id,
-                Booking.date == booking.booking_date,
-                Booking.status == "confirmed",
-            )
-            .filter(
-                # Check for time overlap
-                (Booking.start_time < booking_end.time())
-                & (Booking.end_time > booking_start.time())
-            )
-            .first()
+    if not has_availability:
+        raise HTTPException(
+            status_code=404, detail="No availability slot covers the requested time"
         )
 
-        if existing_booking:
-            raise HTTPException(
-                status_code=400, detail="Time slot conflicts with existing booking"
-            )
-
-        # Get or create consumer using normalized matching
-        matching_consumers = find_matching_consumers(
-            db, email=booking.client_email, phone=booking.client_phone
+    if has_conflict:
+        raise HTTPException(
+            status_code=400, detail="Time slot conflicts with existing booking"
         )
 
-        if matching_consumers:
-            # Use most recent matching consumer (sorted by updated_at DESC)
-            consumer = matching_consumers[0]
-        else:
-            # Create new consumer
-            consumer = Consumer(
-                name=booking.client_name,
-                email=booking.client_email,
-                phone=booking.client_phone,
-            )
-            db.add(consumer)
-            db.flush()  # Get consumer ID without committing
+    # Get or create consumer using normalized matching
+    matching_consumers = find_matching_consumers(
+        db, email=booking.client_email, phone=booking.client_phone
+    )
 
-            # Create referral tracking for first booking
-            referral = Referral(
-                consumer_id=consumer.id,
-                specialist_id=booking.specialist_id,
-                referred_by_specialist_id=(
-                    None if booking.source_workplace_id else booking.specialist_id
-                ),
-                referred_by_workplace_id=booking.source_workplace_id,
-            )
-            db.add(referral)
+    if matching_consumers:
+        # Use most recent matching consumer (sorted by updated_at DESC)
+        consumer = matching_consumers[0]
+    else:
+        # Create new consumer. The rows below reference it through relationships
+        # rather than consumer.id, so no flush is needed to get the ID and all
+        # of them go out in the booking's single flush.
+        consumer = Consumer(
+            name=booking.client_name,
+            email=booking.client_email,
+            phone=booking.client_phone,
+        )
 
-            # Auto-create client profile
-            client_profile = ClientProfile(
-                specialist_id=booking.specialist_id,
-                consumer_id=consumer.id,
-            )
-            db.add(client_profile)
+        # Create referral tracking for first booking
+        referral = Referral(
+            consumer=consumer,
+            specialist_id=booking.specialist_id,
+            referred_by_specialist_id=(
+                None if booking.source_workplace_id else booking.specialist_id
+            ),
+            referred_by_workplace_id=booking.source_workplace_id,
+        )
 
-        # Create the booking
-        db_booking = Booking(
+        # Auto-create client profile
+        client_profile = ClientProfile(
             specialist_id=booking.specialist_id,
-            service_id=booking.service_id,
-            consumer_id=consumer.id,
-            client_name=booking.client_name,
-            client_email=booking.client_email,
-            client_phone=booking.client_phone,
-            date=booking.booking_date,
-            start_time=booking.start_time,
-            end_time=booking_end.time(),
-            notes=booking.notes,
-            status="confirmed",
-        )
-
-        db.add(db_booking)
-        db.commit()
-        db.refresh(db_booking)
+            consumer=consumer,
+        )
+        db.add_all([consumer, referral, client_profile])
 
-        return db_booking
+    # Create the booking
+    db_booking = Booking(
+        specialist_id=booking.specialist_id,
+        service_id=booking.service_id,
+        consumer=consumer,
+        client_name=booking.client_name,
+        client_email=booking.client_email,
+        client_phone=booking.client_phone,
+        date=booking.booking_date,
+        start_time=booking.start_time,
+        end_time=booking_end.time(),
+        notes=booking.notes,
+        status="confirmed",
+    )
 
-    except Exception as e:
+    db.add(db_booking)
+    try:
+        # uq_booking_confirmed_slot rejects a concurrent request that
+        # passed the conflict check for the same start time
+        db.flush()
+    except IntegrityError as e:
         db.rollback()
-        if isinstance(e, HTTPException):
-            raise e
-        else:
-            raise HTTPException(
-                status_code=500, detail=f"Internal server error: {str(e)}"
-            )
+        if not is_booking_slot_conflict(e):
+            raise
+        raise HTTPException(
+            status_code=400, detail="Time slot conflicts with existing booking"
+        )
+    refresh_day_availability(db, booking.specialist_id, [booking.booking_date])
+    db.flush()
+
+    # Build the response from the flushed row (id is populated) so the
+    # commit doesn't need a follow-up SELECT to reload expired attributes
+    booking_response = BookingResponse.model_validate(db_booking)
+    db.commit()
+
+    return booking_response
 
 
 @app.get(
@@ -3077,57 +3994,24 @@ def get_specialist_bookings(specialist_id: int, db: Session = Depends(get_db)):
     Get all bookings for a specialist with service details.
     Optimized with eager loading to prevent N+1 queries.
     """
-    from sqlalchemy.orm import joinedload
+    from sqlalchemy.orm import joinedload, selectinload
 
-    # ✅ Optimized: Single query with eager loading (was N+1 before)
+    # ✅ Optimized: eager loading (was N+1 before). The many-to-one service is
+    # joined; the sessions collection is loaded with one IN query so booking
+    # rows are not multiplied per session
     bookings = (
         db.query(Booking)
         .options(
-            joinedload(Booking.sessions),  # Eager load appointment sessions
+            selectinload(Booking.sessions),  # Eager load appointment sessions
             joinedload(Booking.service),  # Eager load service details
         )
         .filter(Booking.specialist_id == specialist_id)
         .all()
     )
 
-    # Add service details to each booking
-    booking_responses = []
-    for booking in bookings:
-        # Session is already loaded, no additional query needed
-        session = booking.sessions[0] if booking.sessions else None
-
-        booking_dict = {
-            "id": booking.id,
-            "specialist_id": booking.specialist_id,
-            "consumer_id": booking.consumer_id,  # Add consumer_id for client profile linking
-            "service_id": booking.service_id,
-            "client_name": booking.client_name,
-            "client_email": booking.client_email,
-            "client_phone": booking.client_phone,
-            "notes": booking.notes,
-            "date": booking.date,
-            "start_time": booking.start_time,
-            "end_time": booking.end_time,
-            "status": booking.status,
-            "service": (
-                {
-                    "id": booking.service.id,
-                    "name": booking.service.name,
-                    "price": booking.service.price,
-                    "duration": booking.service.duration,
-                }
-                if booking.service
-                else None
-            ),
-            # Add session information
-            "session_id": session.id if session else None,
-            "session_started": session.actual_start if session else None,
-            "session_ended": session.actual_end if session else None,
-            "actual_duration": session.actual_duration_minutes if session else None,
-        }
-        booking_responses.append(booking_dict)
-
-    return booking_responses
+    # response_model reads service and session summaries straight from the
+    # eager-loaded relationships (from_attributes) - no per-booking dict building
+    return bookings
 
 
 @app.put("/booking/{booking_id}/status")
@@ -3160,8 +4044,18 @@ def update_booking_status(
     # Update the status
     old_status = booking.status
     booking.status = status_update.status
+    try:
+        # Re-confirming is rejected if the slot was booked in the meantime
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        if not is_booking_slot_conflict(e):
+            raise
+        raise HTTPException(
+            status_code=400, detail="Time slot conflicts with existing booking"
+        )
+    refresh_day_availability(db, booking.specialist_id, [booking.date])
     db.commit()
-    db.refresh(booking)
     
     # If cancelled, trigger customer conversation in terminal
     if status_update.status == "cancelled" and old_status != "cancelled":
@@ -3377,11 +4271,13 @@ def start_appointment_session(
         session_notes=session.session_notes,
     )
 
+    # Flush assigns the id and Python-side defaults; no refresh needed
     db.add(db_session)
+    db.flush()
+    response = AppointmentSessionResponse.model_validate(db_session)
     db.commit()
-    db.refresh(db_session)
 
-    return db_session
+    return response
 
 
 @app.patch(
@@ -3732,35 +4628,39 @@ async def create_workplace(workplace: WorkplaceCreate, db: Session = Depends(get
         updated_at=datetime.utcnow(),
     )
 
+    # Flush for the id; a new workplace has no specialists yet
     db.add(db_workplace)
-    db.commit()
-    db.refresh(db_workplace)
-
-    # Count specialists
-    specialists_count = len(db_workplace.specialists)
+    db.flush()
+    specialists_count = 0
 
     # Convert to response model
-    response = WorkplaceResponse(
-        id=db_workplace.id,
-        name=db_workplace.name,
-        address=db_workplace.address,
-        city=db_workplace.city,
-        state=db_workplace.state,
-        zip_code=db_workplace.zip_code,
-        country=db_workplace.country,
-        phone=db_workplace.phone,
-        website=db_workplace.website,
-        description=db_workplace.description,
-        yelp_business_id=db_workplace.yelp_business_id,
-        is_verified=db_workplace.is_verified,
-        created_at=db_workplace.created_at,
-        updated_at=db_workplace.updated_at,
-        specialists_count=specialists_count,
-    )
+    db_workplace.specialists_count = specialists_count
+    response = WorkplaceResponse.model_validate(db_workplace)
+    db.commit()
 
     return response
 
 
+# Columns backing WorkplaceResponse, for list endpoints that project rows
+# instead of loading Workplace objects
+WORKPLACE_RESPONSE_COLUMNS = (
+    Workplace.id,
+    Workplace.name,
+    Workplace.address,
+    Workplace.city,
+    Workplace.state,
+    Workplace.zip_code,
+    Workplace.country,
+    Workplace.phone,
+    Workplace.website,
+    Workplace.description,
+    Workplace.yelp_business_id,
+    Workplace.is_verified,
+    Workplace.created_at,
+    Workplace.updated_at,
+)
+
+
 @app.get("/workplaces/", response_model=List[WorkplaceResponse])
 def get_workplaces(
     city: Optional[str] = None,
@@ -3771,7 +4671,20 @@ def get_workplaces(
     """
     Get all workplaces with optional filtering.
     """
-    query = db.query(Workplace)
+    # Specialist counts are aggregated in the same query (no lazy load per row)
+    query = (
+        db.query(
+            *WORKPLACE_RESPONSE_COLUMNS,
+            func.count(specialist_workplace_association.c.specialist_id).label(
+                "specialists_count"
+            ),
+        )
+        .outerjoin(
+            specialist_workplace_association,
+            specialist_workplace_association.c.workplace_id == Workplace.id,
+        )
+        .group_by(Workplace.id)
+    )
 
     if city:
         query = query.filter(Workplace.city.ilike(f"%{city}%"))
@@ -3780,32 +4693,9 @@ def get_workplaces(
     if is_verified is not None:
         query = query.filter(Workplace.is_verified == is_verified)
 
-    workplaces = query.all()
-
-    # Convert to response models
-    response_workplaces = []
-    for workplace in workplaces:
-        specialists_count = len(workplace.specialists)
-        response = WorkplaceResponse(
-            id=workplace.id,
-            name=workplace.name,
-            address=workplace.address,
-            city=workplace.city,
-            state=workplace.state,
-            zip_code=workplace.zip_code,
-            country=workplace.country,
-            phone=workplace.phone,
-            website=workplace.website,
-            description=workplace.description,
-            yelp_business_id=workplace.yelp_business_id,
-            is_verified=workplace.is_verified,
-            created_at=workplace.created_at,
-            updated_at=workplace.updated_at,
-            specialists_count=specialists_count,
-        )
-        response_workplaces.append(response)
-
-    return response_workplaces
+    # Rows carry exactly the response fields - no ORM objects are built, and
+    # trusted DB values skip a validation pass (response_model still checks)
+    return [WorkplaceResponse.model_construct(**row._mapping) for row in query.all()]
 
 
 @app.get("/workplaces/{workplace_id}", response_model=WorkplaceResponse)
@@ -3813,29 +4703,18 @@ def get_workplace(workplace_id: int, db: Session = Depends(get_db)):
     """
     Get a specific workplace by ID.
     """
-    workplace = db.query(Workplace).filter(Workplace.id == workplace_id).first()
-    if not workplace:
-        raise HTTPException(status_code=404, detail="Workplace not found")
-
-    specialists_count = len(workplace.specialists)
-
-    response = WorkplaceResponse(
-        id=workplace.id,
-        name=workplace.name,
-        address=workplace.address,
-        city=workplace.city,
-        state=workplace.state,
-        zip_code=workplace.zip_code,
-        country=workplace.country,
-        phone=workplace.phone,
-        website=workplace.website,
-        description=workplace.description,
-        yelp_business_id=workplace.yelp_business_id,
-        is_verified=workplace.is_verified,
-        created_at=workplace.created_at,
-        updated_at=workplace.updated_at,
-        specialists_count=specialists_count,
+    # Count comes back with the row; the specialists collection is never loaded
+    row = (
+        db.query(Workplace, Workplace.specialists_count)
+        .filter(Workplace.id == workplace_id)
+        .first()
     )
+    if not row:
+        raise HTTPException(status_code=404, detail="Workplace not found")
+    workplace, specialists_count = row
+
+    workplace.specialists_count = specialists_count
+    response = WorkplaceResponse.model_validate(workplace)
 
     return response
 
@@ -3847,9 +4726,15 @@ async def update_workplace(
     """
     Update a workplace.
     """
-    workplace = db.query(Workplace).filter(Workplace.id == workplace_id).first()
-    if not workplace:
+    # Membership isn't touched here, so the count is read up front with the row
+    row = (
+        db.query(Workplace, Workplace.specialists_count)
+        .filter(Workplace.id == workplace_id)
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=404, detail="Workplace not found")
+    workplace, specialists_count = row
 
     # Validate Yelp business if being updated
     if workplace_update.yelp_business_id is not None:
@@ -3874,25 +4759,8 @@ async def update_workplace(
     db.commit()
     db.refresh(workplace)
 
-    specialists_count = len(workplace.specialists)
-
-    response = WorkplaceResponse(
-        id=workplace.id,
-        name=workplace.name,
-        address=workplace.address,
-        city=workplace.city,
-        state=workplace.state,
-        zip_code=workplace.zip_code,
-        country=workplace.country,
-        phone=workplace.phone,
-        website=workplace.website,
-        description=workplace.description,
-        yelp_business_id=workplace.yelp_business_id,
-        is_verified=workplace.is_verified,
-        created_at=workplace.created_at,
-        updated_at=workplace.updated_at,
-        specialists_count=specialists_count,
-    )
+    workplace.specialists_count = specialists_count
+    response = WorkplaceResponse.model_validate(workplace)
 
     return response
 
@@ -3915,6 +4783,7 @@ def delete_workplace(workplace_id: int, db: Session = Depends(get_db)) -> dict:
 
     db.delete(workplace)
     db.commit()
+    invalidate_workplace_specialists_cache()
 
     return {"message": "Workplace deleted successfully"}
 
@@ -3942,43 +4811,51 @@ def associate_specialist_workplace(
     if not workplace:
         raise HTTPException(status_code=404, detail="Workplace not found")
 
-    # Check if association already exists and is active
-    from sqlalchemy import and_
-
-    existing_association = db.execute(
-        specialist_workplace_association.select().where(
-            and_(
-                specialist_workplace_association.c.specialist_id == specialist_id,
-                specialist_workplace_association.c.workplace_id == workplace_id,
-                specialist_workplace_association.c.is_active == True,
-            )
+    # Insert in one statement: a new pair is inserted, an inactive pair is
+    # reactivated, and an active pair is left alone (no row returned)
+    assoc = specialist_workplace_association
+    association_data = {
+        "role": association.role,
+        "start_date": association.start_date,
+        "end_date": association.end_date,
+        "is_active": association.is_active,
+        "updated_at": datetime.utcnow(),
+    }
+    stmt = (
+        dialect_insert(db, assoc)
+        .values(
+            specialist_id=specialist_id,
+            workplace_id=workplace_id,
+            created_at=datetime.utcnow(),
+            **association_data,
         )
-    ).first()
+        .on_conflict_do_update(
+            index_elements=[assoc.c.specialist_id, assoc.c.workplace_id],
+            set_=association_data,
+            where=assoc.c.is_active == False,
+        )
+        .returning(assoc.c.role)
+    )
+    inserted = db.execute(stmt).first()
 
-    if existing_association:
+    if inserted is None:
         # Return success if already associated (idempotent operation)
+        existing_role = db.execute(
+            select(assoc.c.role).where(
+                assoc.c.specialist_id == specialist_id,
+                assoc.c.workplace_id == workplace_id,
+            )
+        ).scalar()
         return {
             "message": "Specialist is already associated with this workplace",
             "specialist_id": specialist_id,
             "workplace_id": workplace_id,
-            "role": existing_association.role,
+            "role": existing_role,
             "already_exists": True,
         }
 
-    # Create new association
-    association_data = {
-        "specialist_id": specialist_id,
-        "workplace_id": workplace_id,
-        "role": association.role,
-        "start_date": association.start_date,
-        "end_date": association.end_date,
-        "is_active": association.is_active,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
-    }
-
-    db.execute(specialist_workplace_association.insert().values(**association_data))
     db.commit()
+    invalidate_workplace_specialists_cache()
 
     return {
         "message": "Specialist successfully associated with workplace",
@@ -4027,6 +4904,7 @@ def disassociate_specialist_workplace(
         .values(is_active=False, end_date=date.today(), updated_at=datetime.utcnow())
     )
     db.commit()
+    invalidate_workplace_specialists_cache()
 
     return {
         "message": "Specialist successfully disassociated from workplace",
@@ -4047,52 +4925,37 @@ def get_specialist_workplaces(specialist_id: int, db: Session = Depends(get_db))
     if not specialist:
         raise HTTPException(status_code=404, detail="Specialist not found")
 
-    # Get active workplace associations
-    from sqlalchemy import and_
-
-    associations = db.execute(
-        specialist_workplace_association.select().where(
-            and_(
-                specialist_workplace_association.c.specialist_id == specialist_id,
-                specialist_workplace_association.c.is_active == True,
-            )
+    # Active associations joined to their workplaces, with each workplace's
+    # specialist count as a correlated subquery - one query instead of 1 + 2N
+    assoc = specialist_workplace_association
+    rows = (
+        db.query(
+            Workplace,
+            assoc.c.role,
+            assoc.c.start_date,
+            assoc.c.end_date,
+            assoc.c.is_active,
+            Workplace.specialists_count,
         )
-    ).fetchall()
+        .join(assoc, assoc.c.workplace_id == Workplace.id)
+        .filter(assoc.c.specialist_id == specialist_id, assoc.c.is_active == True)
+        .all()
+    )
 
     # Build response with workplace and association data
     response_list = []
-    for assoc in associations:
-        workplace = (
-            db.query(Workplace).filter(Workplace.id == assoc.workplace_id).first()
-        )
-        if workplace:
-            specialists_count = len(workplace.specialists)
-            workplace_response = WorkplaceResponse(
-                id=workplace.id,
-                name=workplace.name,
-                address=workplace.address,
-                city=workplace.city,
-                state=workplace.state,
-                zip_code=workplace.zip_code,
-                country=workplace.country,
-                phone=workplace.phone,
-                website=workplace.website,
-                description=workplace.description,
-                yelp_business_id=workplace.yelp_business_id,
-                is_verified=workplace.is_verified,
-                created_at=workplace.created_at,
-                updated_at=workplace.updated_at,
-                specialists_count=specialists_count,
-            )
-
-            response = SpecialistWorkplaceResponse(
-                workplace=workplace_response,
-                role=assoc.role,
-                start_date=assoc.start_date,
-                end_date=assoc.end_date,
-                is_active=assoc.is_active,
-            )
-            response_list.append(response)
+    for workplace, role, start_date, end_date, is_active, specialists_count in rows:
+        workplace.specialists_count = specialists_count
+        workplace_response = WorkplaceResponse.model_validate(workplace)
+
+        response = SpecialistWorkplaceResponse(
+            workplace=workplace_response,
+            role=role,
+            start_date=start_date,
+            end_date=end_date,
+            is_active=is_active,
+        )
+        response_list.append(response)
 
     return response_list
 
@@ -4111,149 +4974,164 @@ def get_all_workplaces(
     Get all workplaces/businesses for consumer browsing.
     Optionally filter by location.
     """
-    query = db.query(Workplace)
+    # Active specialist counts are aggregated in the same query
+    query = (
+        db.query(
+            *WORKPLACE_RESPONSE_COLUMNS,
+            func.count(specialist_workplace_association.c.specialist_id).label(
+                "specialists_count"
+            ),
+        )
+        .outerjoin(
+            specialist_workplace_association,
+            (specialist_workplace_association.c.workplace_id == Workplace.id)
+            & (specialist_workplace_association.c.is_active == True),
+        )
+        .group_by(Workplace.id)
+    )
 
     if city:
         query = query.filter(Workplace.city.ilike(f"%{city}%"))
     if state:
         query = query.filter(Workplace.state.ilike(f"%{state}%"))
 
-    workplaces = query.limit(limit).all()
+    return [
+        WorkplaceResponse.model_construct(**row._mapping)
+        for row in query.limit(limit).all()
+    ]
 
-    # Add specialist count to each workplace
-    response = []
-    for workplace in workplaces:
-        specialists_count = (
-            db.query(specialist_workplace_association)
-            .filter(
-                specialist_workplace_association.c.workplace_id == workplace.id,
-                specialist_workplace_association.c.is_active == True,
-            )
-            .count()
-        )
-
-        workplace_dict = {
-            "id": workplace.id,
-            "name": workplace.name,
-            "address": workplace.address,
-            "city": workplace.city,
-            "state": workplace.state,
-            "zip_code": workplace.zip_code,
-            "country": workplace.country,
-            "phone": workplace.phone,
-            "website": workplace.website,
-            "description": workplace.description,
-            "yelp_business_id": workplace.yelp_business_id,
-            "is_verified": workplace.is_verified,
-            "created_at": workplace.created_at,
-            "updated_at": workplace.updated_at,
-            "specialists_count": specialists_count,
-        }
-        response.append(WorkplaceResponse(**workplace_dict))
 
-    return response
+# Workplace specialist listings cached in Redis (when configured). Any write that
+# changes memberships, workplaces or services bumps the generation, which moves
+# every reader to fresh keys; stale entries simply expire.
+WORKPLACE_SPECIALISTS_CACHE_TTL_SECONDS = 300
+WORKPLACE_CACHE_GENERATION_KEY = "wp:specialists:gen"
+_workplace_cache = None
+_workplace_cache_async = None
+if REDIS_AVAILABLE and settings.REDIS_URL:
+    _workplace_cache = redis.Redis.from_url(settings.REDIS_URL)
+    _workplace_cache_async = redis_asyncio.Redis.from_url(settings.REDIS_URL)
+
+
+def invalidate_workplace_specialists_cache():
+    """Invalidate cached workplace specialist listings after a relevant write."""
+    if _workplace_cache is None:
+        return
+    try:
+        _workplace_cache.incr(WORKPLACE_CACHE_GENERATION_KEY)
+    except Exception as e:
+        print(f"Error invalidating workplace cache: {e}")
 
 
 @app.get("/consumer/workplaces/{workplace_id}", response_model=WorkplaceResponse)
-def get_workplace_details(workplace_id: int, db: Session = Depends(get_db)):
+async def get_workplace_details(
+    workplace_id: int, db: AsyncSession = Depends(get_async_db)
+):
     """
     Get detailed information about a specific workplace.
     """
-    workplace = db.query(Workplace).filter(Workplace.id == workplace_id).first()
-
-    if not workplace:
-        raise HTTPException(status_code=404, detail="Workplace not found")
-
-    # Count specialists
-    specialists_count = (
-        db.query(specialist_workplace_association)
-        .filter(
-            specialist_workplace_association.c.workplace_id == workplace.id,
-            specialist_workplace_association.c.is_active == True,
-        )
-        .count()
+    # Active specialist count as a correlated subquery - one round-trip
+    assoc = specialist_workplace_association
+    active_count = (
+        select(func.count(assoc.c.specialist_id))
+        .where(assoc.c.workplace_id == Workplace.id, assoc.c.is_active == True)
+        .correlate(Workplace)
+        .scalar_subquery()
     )
+    row = (
+        await db.execute(
+            select(Workplace, active_count).where(Workplace.id == workplace_id)
+        )
+    ).first()
 
-    workplace_dict = {
-        "id": workplace.id,
-        "name": workplace.name,
-        "address": workplace.address,
-        "city": workplace.city,
-        "state": workplace.state,
-        "zip_code": workplace.zip_code,
-        "country": workplace.country,
-        "phone": workplace.phone,
-        "website": workplace.website,
-        "description": workplace.description,
-        "yelp_business_id": workplace.yelp_business_id,
-        "is_verified": workplace.is_verified,
-        "created_at": workplace.created_at,
-        "updated_at": workplace.updated_at,
-        "specialists_count": specialists_count,
-    }
+    if not row:
+        raise HTTPException(status_code=404, detail="Workplace not found")
+    workplace, specialists_count = row
 
-    return WorkplaceResponse(**workplace_dict)
+    workplace.specialists_count = specialists_count
+    return WorkplaceResponse.model_validate(workplace)
 
 
 @app.get(
     "/consumer/workplaces/{workplace_id}/specialists",
     response_model=List[SpecialistCatalogResponse],
 )
-def get_workplace_specialists(workplace_id: int, db: Session = Depends(get_db)):
+async def get_workplace_specialists(
+    workplace_id: int, db: AsyncSession = Depends(get_async_db)
+):
     """
     Get all specialists working at a specific workplace.
     This is for the business-first booking flow.
     """
-    # Verify workplace exists
-    workplace = db.query(Workplace).filter(Workplace.id == workplace_id).first()
-    if not workplace:
-        raise HTTPException(status_code=404, detail="Workplace not found")
+    cache_key = None
+    if _workplace_cache_async is not None:
+        try:
+            generation = await _workplace_cache_async.get(
+                WORKPLACE_CACHE_GENERATION_KEY
+            )
+            cache_key = f"wp:{workplace_id}:specialists:v1:{int(generation or 0)}"
+            cached = await _workplace_cache_async.get(cache_key)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+        except Exception as e:
+            print(f"Error reading workplace cache: {e}")
+            cache_key = None
 
-    # Get active specialists at this workplace
-    associations = (
-        db.query(specialist_workplace_association)
-        .filter(
-            specialist_workplace_association.c.workplace_id == workplace_id,
-            specialist_workplace_association.c.is_active == True,
-        )
-        .all()
+    # Verify workplace exists
+    workplace_id_found = await db.scalar(
+        select(Workplace.id).where(Workplace.id == workplace_id)
     )
+    if workplace_id_found is None:
+        raise HTTPException(status_code=404, detail="Workplace not found")
 
-    specialist_ids = [assoc.specialist_id for assoc in associations]
-
-    if not specialist_ids:
-        return []
-
-    # Get specialist details
-    specialists = db.query(Specialist).filter(Specialist.id.in_(specialist_ids)).all()
+    from sqlalchemy.orm import raiseload, selectinload
 
-    response = []
-    for specialist in specialists:
-        # Get services
-        services = (
-            db.query(ServiceDB).filter(ServiceDB.specialist_id == specialist.id).all()
+    # Active specialists joined through the association, with their services in
+    # one IN query; raiseload flags any other relationship touched per row
+    specialists = (
+        await db.scalars(
+            select(Specialist)
+            .join(
+                specialist_workplace_association,
+                specialist_workplace_association.c.specialist_id == Specialist.id,
+            )
+            .where(
+                specialist_workplace_association.c.workplace_id == workplace_id,
+                specialist_workplace_association.c.is_active == True,
+            )
+            .options(selectinload(Specialist.services), raiseload("*"))
         )
+    ).all()
+
+    # Trusted DB values: build the models without a validation pass
+    response = [
+        SpecialistCatalogResponse.model_construct(
+            id=specialist.id,
+            name=specialist.name,
+            bio=specialist.bio,
+            services=[
+                ServiceResponse.model_construct(
+                    id=svc.id,
+                    name=svc.name,
+                    price=svc.price,
+                    duration=svc.duration,
+                    specialist_id=svc.specialist_id,
+                )
+                for svc in specialist.services
+            ],
+        )
+        for specialist in specialists
+    ]
 
-        services_data = [
-            {
-                "id": svc.id,
-                "name": svc.name,
-                "price": svc.price,
-                "duration": svc.duration,
-                "specialist_id": svc.specialist_id,
-            }
-            for svc in services
-        ]
-
-        specialist_data = {
-            "id": specialist.id,
-            "name": specialist.name,
-            "email": specialist.email,
-            "bio": specialist.bio,
-            "phone": specialist.phone,
-            "services": services_data,
-        }
-        response.append(SpecialistCatalogResponse(**specialist_data))
+    if cache_key is not None:
+        body = orjson.dumps([specialist.model_dump() for specialist in response])
+        try:
+            await _workplace_cache_async.set(
+                cache_key, body, ex=WORKPLACE_SPECIALISTS_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            print(f"Error writing workplace cache: {e}")
+        return Response(content=body, media_type="application/json")
 
     return response
 
@@ -4262,14 +5140,14 @@ def get_workplace_specialists(workplace_id: int, db: Session = Depends(get_db)):
 
 
 @app.get("/search")
-def unified_search(
+async def unified_search(
     query: str,
     search_type: str = "professional",  # "professional" or "business"
     location: Optional[str] = None,
     city: Optional[str] = None,
     state: Optional[str] = None,
     limit: int = 20,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Unified search endpoint for professionals and businesses.
@@ -4283,7 +5161,7 @@ def unified_search(
 
     if search_type == "professional":
         # Search for professionals by name or service
-        specialists_query = db.query(Specialist)
+        specialists_query = select(Specialist)
 
         # Search in specialist name or bio
         if query:
@@ -4295,74 +5173,76 @@ def unified_search(
         # Also search in services
         service_specialists = []
         if query:
-            services = (
-                db.query(ServiceDB).filter(ServiceDB.name.ilike(f"%{query}%")).all()
-            )
-            service_specialists = [svc.specialist_id for svc in services]
+            service_specialists = (
+                await db.scalars(
+                    select(ServiceDB.specialist_id).where(
+                        ServiceDB.name.ilike(f"%{query}%")
+                    )
+                )
+            ).all()
 
         if service_specialists:
             specialists_query = specialists_query.filter(
                 Specialist.id.in_(service_specialists)
             )
 
-        specialists = specialists_query.limit(limit).all()
-
-        # Build response with workplace info
-        results = []
-        for specialist in specialists:
-            # Get services
-            services = (
-                db.query(ServiceDB)
-                .filter(ServiceDB.specialist_id == specialist.id)
-                .all()
+        # Location filters run in SQL: city/state match case-insensitively,
+        # location is a substring of the city, state or address
+        location_filters = []
+        # User input is matched literally, never as a LIKE pattern
+        if city:
+            location_filters.append(func.lower(Workplace.city) == city.lower())
+        if state:
+            location_filters.append(func.lower(Workplace.state) == state.lower())
+        if location:
+            location_filters.append(
+                Workplace.city.icontains(location, autoescape=True)
+                | Workplace.state.icontains(location, autoescape=True)
+                | Workplace.address.icontains(location, autoescape=True)
             )
 
-            # Get workplaces
-            workplace_assocs = (
-                db.query(specialist_workplace_association)
-                .filter(
-                    specialist_workplace_association.c.specialist_id == specialist.id,
-                    specialist_workplace_association.c.is_active == True,
-                )
-                .all()
+        # Only specialists with a matching active workplace are returned, so
+        # the limit applies after the location filter
+        if location_filters:
+            specialists_query = (
+                specialists_query.join(Specialist.active_workplaces)
+                .where(*location_filters)
+                .distinct()
             )
 
-            workplaces = []
-            for assoc in workplace_assocs:
-                workplace = (
-                    db.query(Workplace)
-                    .filter(Workplace.id == assoc.workplace_id)
-                    .first()
-                )
-                if workplace:
-                    # Filter by location if specified
-                    if city and workplace.city.lower() != city.lower():
-                        continue
-                    if state and workplace.state.lower() != state.lower():
-                        continue
-                    if location:
-                        loc_lower = location.lower()
-                        if not (
-                            loc_lower in workplace.city.lower()
-                            or loc_lower in workplace.state.lower()
-                            or loc_lower in workplace.address.lower()
-                        ):
-                            continue
-
-                    workplaces.append(
-                        {
-                            "id": workplace.id,
-                            "name": workplace.name,
-                            "address": workplace.address,
-                            "city": workplace.city,
-                            "state": workplace.state,
-                            "is_verified": workplace.is_verified,
-                        }
-                    )
+        # Services and active workplaces come in with one IN query each
+        # instead of ~3 queries per specialist; the workplace load carries the
+        # same location filters, so unmatched workplaces never leave the DB
+        from sqlalchemy.orm import selectinload
+
+        active_workplaces = Specialist.active_workplaces
+        if location_filters:
+            active_workplaces = active_workplaces.and_(*location_filters)
+
+        specialists = (
+            await db.scalars(
+                specialists_query.options(
+                    selectinload(Specialist.services),
+                    selectinload(active_workplaces),
+                ).limit(limit)
+            )
+        ).all()
 
-            # Skip if location filter excludes all workplaces
-            if (city or state or location) and not workplaces:
-                continue
+        # Build response with workplace info
+        results = []
+        for specialist in specialists:
+            services = specialist.services
+            workplaces = [
+                {
+                    "id": workplace.id,
+                    "name": workplace.name,
+                    "address": workplace.address,
+                    "city": workplace.city,
+                    "state": workplace.state,
+                    "is_verified": workplace.is_verified,
+                }
+                for workplace in specialist.active_workplaces
+            ]
 
             results.append(
                 {
@@ -4388,10 +5268,18 @@ def unified_search(
 
     elif search_type == "business":
         # Search for businesses
-        query_obj = db.query(Workplace)
+        query_obj = select(Workplace)
 
-        # Search in business name or description
-        if query:
+        # Search in business name or description. On PostgreSQL, queries of 3+
+        # characters use full-text search backed by ix_workplace_fts; short
+        # queries (and SQLite) fall back to substring ILIKE.
+        if query and len(query) >= 3 and db.bind.dialect.name == "postgresql":
+            query_obj = query_obj.filter(
+                workplace_search_vector().op("@@")(
+                    func.plainto_tsquery(literal_column("'english'"), query)
+                )
+            )
+        elif query:
             query_obj = query_obj.filter(
                 (Workplace.name.ilike(f"%{query}%"))
                 | (Workplace.description.ilike(f"%{query}%"))
@@ -4410,24 +5298,28 @@ def unified_search(
                 | (Workplace.address.ilike(loc_lower))
             )
 
-        workplaces = query_obj.limit(limit).all()
+        workplaces = (await db.scalars(query_obj.limit(limit))).all()
 
         # Build response with specialist info
         results = []
         for workplace in workplaces:
             # Get specialists at this workplace
-            specialist_assocs = (
-                db.query(specialist_workplace_association)
-                .filter(
-                    specialist_workplace_association.c.workplace_id == workplace.id,
-                    specialist_workplace_association.c.is_active == True,
+            specialist_ids = (
+                await db.scalars(
+                    select(specialist_workplace_association.c.specialist_id).where(
+                        specialist_workplace_association.c.workplace_id
+                        == workplace.id,
+                        specialist_workplace_association.c.is_active == True,
+                    )
                 )
-                .all()
-            )
+            ).all()
 
-            specialist_ids = [assoc.specialist_id for assoc in specialist_assocs]
             specialists = (
-                db.query(Specialist).filter(Specialist.id.in_(specialist_ids)).all()
+                (
+                    await db.scalars(
+                        select(Specialist).where(Specialist.id.in_(specialist_ids))
+                    )
+                ).all()
                 if specialist_ids
                 else []
             )
@@ -4436,8 +5328,10 @@ def unified_search(
             all_services = []
             for spec in specialists:
                 services = (
-                    db.query(ServiceDB).filter(ServiceDB.specialist_id == spec.id).all()
-                )
+                    await db.scalars(
+                        select(ServiceDB).where(ServiceDB.specialist_id == spec.id)
+                    )
+                ).all()
                 all_services.extend(
                     [
                         {
@@ -4522,42 +5416,36 @@ async def get_yelp_business(business_id: str) -> YelpBusinessResponse:
 
 
 @app.post("/workplaces/from-yelp/{business_id}", response_model=WorkplaceResponse)
-async def create_workplace_from_yelp(business_id: str, db: Session = Depends(get_db)):
+async def create_workplace_from_yelp(
+    business_id: str, db: AsyncSession = Depends(get_async_db)
+):
     """
     Create a workplace from Yelp business data.
     If workplace already exists, return the existing workplace.
     """
+    # The Yelp lookup and the existence check are independent, so they run
+    # concurrently; the lookup is cancelled if the workplace already exists
+    yelp_task = asyncio.create_task(yelp_service.get_business_details(business_id))
+    # Marks a failure as retrieved when the task's result is never awaited
+    yelp_task.add_done_callback(lambda task: task.cancelled() or task.exception())
     try:
         # Check if workplace with this Yelp ID already exists
-        existing_workplace = (
-            db.query(Workplace)
-            .filter(Workplace.yelp_business_id == business_id)
-            .first()
-        )
+        existing_row = (
+            await db.execute(
+                select(Workplace, Workplace.specialists_count).where(
+                    Workplace.yelp_business_id == business_id
+                )
+            )
+        ).first()
 
-        if existing_workplace:
+        if existing_row:
             # Return existing workplace instead of error
-            specialists_count = len(existing_workplace.specialists)
-            return WorkplaceResponse(
-                id=existing_workplace.id,
-                name=existing_workplace.name,
-                address=existing_workplace.address,
-                city=existing_workplace.city,
-                state=existing_workplace.state,
-                zip_code=existing_workplace.zip_code,
-                country=existing_workplace.country,
-                phone=existing_workplace.phone,
-                website=existing_workplace.website,
-                description=existing_workplace.description,
-                yelp_business_id=existing_workplace.yelp_business_id,
-                is_verified=existing_workplace.is_verified,
-                specialists_count=specialists_count,
-                created_at=existing_workplace.created_at,
-                updated_at=existing_workplace.updated_at,
-            )
+            existing_workplace, specialists_count = existing_row
+            existing_workplace.specialists_count = specialists_count
+            return WorkplaceResponse.model_validate(existing_workplace)
 
         # Fetch business details from Yelp
-        business = await yelp_service.get_business_details(business_id)
+        business = await yelp_task
         if not business:
             raise HTTPException(status_code=404, detail="Yelp business not found")
 
@@ -4578,38 +5466,30 @@ async def create_workplace_from_yelp(business_id: str, db: Session = Depends(get
             updated_at=datetime.utcnow(),
         )
 
+        # Flush for the id; a new workplace has no specialists yet
         db.add(db_workplace)
-        db.commit()
-        db.refresh(db_workplace)
-
-        specialists_count = len(db_workplace.specialists)
-
-        response = WorkplaceResponse(
-            id=db_workplace.id,
-            name=db_workplace.name,
-            address=db_workplace.address,
-            city=db_workplace.city,
-            state=db_workplace.state,
-            zip_code=db_workplace.zip_code,
-            country=db_workplace.country,
-            phone=db_workplace.phone,
-            website=db_workplace.website,
-            description=db_workplace.description,
-            yelp_business_id=db_workplace.yelp_business_id,
-            is_verified=db_workplace.is_verified,
-            created_at=db_workplace.created_at,
-            updated_at=db_workplace.updated_at,
-            specialists_count=specialists_count,
-        )
+        await db.flush()
+        specialists_count = 0
+
+        db_workplace.specialists_count = specialists_count
+        response = WorkplaceResponse.model_validate(db_workplace)
+        await db.commit()
 
         return response
 
     except YelpAPIError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        # Stops the lookup on an early return (e.g. the workplace already
+        # exists) or error; a no-op once it has completed
+        yelp_task.cancel()
 
 
 # ==================== Client Management Endpoints ====================
 
+# Compiled once; strips everything but digits from phone numbers
+_NON_DIGITS = re.compile(r"\D")
+
 
 def normalize_email(email):
     """Normalize email for comparison (lowercase, strip whitespace)"""
@@ -4630,7 +5510,7 @@ def normalize_phone(phone):
         return None
 
     # Remove all non-digit characters
-    digits = "".join(c for c in phone if c.isdigit())
+    digits = _NON_DIGITS.sub("", phone)
 
     # Remove leading 1 if present (country code) and we have 11 digits
     if digits.startswith("1") and len(digits) == 11:
@@ -4695,23 +5575,19 @@ def find_matching_consumers(
     norm_email = normalize_email(email)
     norm_phone = normalize_phone(phone)
 
-    # Get all consumers and check manually (for phone normalization)
-    all_consumers = db.query(Consumer).all()
-    matching_consumers = []
-
-    for consumer in all_consumers:
-        matched = False
-
-        # Check email match (case-insensitive)
-        if norm_email and normalize_email(consumer.email) == norm_email:
-            matched = True
-
-        # Check phone match (normalized - digits only)
-        if norm_phone and normalize_phone(consumer.phone) == norm_phone:
-            matched = True
+    # Match in the database instead of scanning every consumer. Emails compare
+    # case-insensitively via ix_consumer_email_normalized; phones are stored in
+    # normalize_phone form by every write path, so the indexed column compares
+    # directly.
+    conditions = []
+    if norm_email:
+        conditions.append(func.lower(func.trim(Consumer.email)) == norm_email)
+    if norm_phone:
+        conditions.append(Consumer.phone == norm_phone)
+    if not conditions:
+        return []
 
-        if matched:
-            matching_consumers.append(consumer)
+    matching_consumers = db.query(Consumer).filter(or_(*conditions)).all()
 
     # Sort by most recent first (updated_at DESC, then created_at DESC)
     matching_consumers.sort(
@@ -4731,37 +5607,23 @@ def consolidate_consumer_bookings(
     if not consumers:
         return []
 
-    consumer_ids = [c.id for c in consumers]
-    bookings = db.query(Booking).filter(Booking.consumer_id.in_(consumer_ids)).all()
-
-    # Also get legacy bookings without consumer_id but matching email/phone
-    legacy_bookings = []
-    for consumer in consumers:
-        if consumer.email:
-            legacy_by_email = (
-                db.query(Booking)
-                .filter(
-                    Booking.consumer_id.is_(None),
-                    Booking.client_email == consumer.email,
-                )
-                .all()
-            )
-            legacy_bookings.extend(legacy_by_email)
+    # One query; each row comes back once, so no dedup needed
+    return db.query(Booking).filter(consolidated_bookings_filter(consumers)).all()
 
-        if consumer.phone:
-            legacy_by_phone = (
-                db.query(Booking)
-                .filter(
-                    Booking.consumer_id.is_(None),
-                    Booking.client_phone == consumer.phone,
-                )
-                .all()
-            )
-            legacy_bookings.extend(legacy_by_phone)
 
-    # Combine and deduplicate
-    all_bookings = list(set(bookings + legacy_bookings))
-    return all_bookings
+def consolidated_bookings_filter(consumers: List[Consumer]):
+    """
+    Filter matching bookings linked to any of the consumers, plus legacy bookings
+    without consumer_id whose email/phone matches one of them.
+    """
+    consumer_ids = [c.id for c in consumers]
+    emails = [c.email for c in consumers if c.email]
+    phones = [c.phone for c in consumers if c.phone]
+
+    legacy_match = Booking.consumer_id.is_(None) & or_(
+        Booking.client_email.in_(emails), Booking.client_phone.in_(phones)
+    )
+    return or_(Booking.consumer_id.in_(consumer_ids), legacy_match)
 
 
 @app.get("/professional/clients")
@@ -4772,86 +5634,139 @@ async def get_professional_clients(specialist_id: int, db: Session = Depends(get
     Consolidates clients by email OR phone matching.
     Returns ClientSummary list with booking stats.
     """
-    # Get all bookings for this specialist
+    from sqlalchemy.orm import selectinload
+
+    # Everything is prefetched in a handful of bulk queries and grouped in
+    # Python: consolidated bookings are filtered to this specialist anyway, so
+    # the specialist's bookings are the only bookings ever needed.
     all_bookings = (
-        db.query(Booking).filter(Booking.specialist_id == specialist_id).all()
+        db.query(Booking)
+        .options(selectinload(Booking.consumer))
+        .filter(Booking.specialist_id == specialist_id)
+        .all()
     )
 
+    bookings_by_consumer = {}
+    legacy_by_email = {}
+    legacy_by_phone = {}
+    for booking in all_bookings:
+        if booking.consumer_id is not None:
+            bookings_by_consumer.setdefault(booking.consumer_id, []).append(booking)
+        else:
+            if booking.client_email:
+                legacy_by_email.setdefault(booking.client_email, []).append(booking)
+            if booking.client_phone:
+                legacy_by_phone.setdefault(booking.client_phone, []).append(booking)
+
+    # Contact info per booking, and every consumer matching any of it (same
+    # rules as find_matching_consumers) in one query
+    booking_contacts = []
+    norm_emails, norm_phones = set(), set()
+    for booking in all_bookings:
+        email = booking.consumer.email if booking.consumer else booking.client_email
+        phone = booking.consumer.phone if booking.consumer else booking.client_phone
+        booking_contacts.append((booking, email, phone))
+        if normalize_email(email):
+            norm_emails.add(normalize_email(email))
+        if normalize_phone(phone):
+            norm_phones.add(normalize_phone(phone))
+
+    consumers_by_email = {}
+    consumers_by_phone = {}
+    if norm_emails or norm_phones:
+        candidates = (
+            db.query(Consumer)
+            .filter(
+                or_(
+                    func.lower(func.trim(Consumer.email)).in_(norm_emails),
+                    Consumer.phone.in_(norm_phones),
+                )
+            )
+            .order_by(Consumer.id)
+            .all()
+        )
+        for consumer in candidates:
+            if normalize_email(consumer.email) in norm_emails:
+                consumers_by_email.setdefault(
+                    normalize_email(consumer.email), []
+                ).append(consumer)
+            if consumer.phone in norm_phones:
+                consumers_by_phone.setdefault(consumer.phone, []).append(consumer)
+
+    profiles_by_consumer = {
+        profile.consumer_id: profile
+        for profile in db.query(ClientProfile).filter(
+            ClientProfile.specialist_id == specialist_id
+        )
+    }
+
     # Build unique client list by consolidating matches
     seen_consumers = set()
     client_summaries = []
     processed_contacts = set()  # Track processed email/phone combinations
+    today = date.today()
 
-    for booking in all_bookings:
-        # Determine contact info
-        email = booking.consumer.email if booking.consumer else booking.client_email
-        phone = booking.consumer.phone if booking.consumer else booking.client_phone
-
+    for booking, email, phone in booking_contacts:
         contact_key = f"{email or 'none'}:{phone or 'none'}"
         if contact_key in processed_contacts:
             continue
         processed_contacts.add(contact_key)
 
-        # Find all matching consumers
-        matching_consumers = find_matching_consumers(db, email, phone)
-
-        if not matching_consumers:
-            # Legacy booking without consumer record
-            matching_consumers = []
+        # Find all matching consumers, most recent first
+        matches = {
+            consumer.id: consumer
+            for consumer in consumers_by_email.get(normalize_email(email), [])
+            + consumers_by_phone.get(normalize_phone(phone), [])
+        }
+        matching_consumers = sorted(
+            sorted(matches.values(), key=lambda c: c.id),
+            key=lambda c: (c.updated_at or c.created_at or datetime.min),
+            reverse=True,
+        )
 
         # Get primary consumer (most recent match or create summary from booking)
         if matching_consumers:
-            primary_consumer = matching_consumers[0]  # Already sorted by most recent
+            primary_consumer = matching_consumers[0]
             consumer_id = primary_consumer.id
 
             # Skip if we've already processed this consumer
             if consumer_id in seen_consumers:
                 continue
             seen_consumers.add(consumer_id)
-        else:
-            # Use booking data for legacy entries
-            consumer_id = None
 
-        # Get ALL bookings for this client (consolidated)
-        if matching_consumers:
-            client_bookings = consolidate_consumer_bookings(db, matching_consumers)
-            # Filter to only this specialist's bookings
-            client_bookings = [
-                b for b in client_bookings if b.specialist_id == specialist_id
-            ]
+            # Get ALL of this specialist's bookings for the client: linked to
+            # any matching consumer, plus legacy rows with matching contact info
+            client_bookings = {}
+            for consumer in matching_consumers:
+                linked = bookings_by_consumer.get(consumer.id, [])
+                legacy_email = legacy_by_email.get(consumer.email, [])
+                legacy_phone = legacy_by_phone.get(consumer.phone, [])
+                for client_booking in linked + legacy_email + legacy_phone:
+                    client_bookings[client_booking.id] = client_booking
+            client_bookings = list(client_bookings.values())
         else:
-            # Legacy booking only
+            # Legacy booking without consumer record
+            consumer_id = None
             client_bookings = [booking]
 
-        # Calculate stats
+        # Calculate stats in one pass (no sort): last booking is the most
+        # recent PAST booking, next is the earliest upcoming one
         total_bookings = len(client_bookings)
-        sorted_bookings = sorted(client_bookings, key=lambda b: b.date)
-
-        # Separate past and future
-        today = date.today()
-        past_bookings = [b for b in sorted_bookings if b.date < today]
-        future_bookings = [b for b in sorted_bookings if b.date >= today]
-
-        # Last booking should be the most recent PAST booking
-        last_booking = past_bookings[-1] if past_bookings else None
-        next_booking = future_bookings[0] if future_bookings else None
+        last_booking = max(
+            (b for b in reversed(client_bookings) if b.date < today),
+            key=lambda b: b.date,
+            default=None,
+        )
+        next_booking = min(
+            (b for b in client_bookings if b.date >= today),
+            key=lambda b: b.date,
+            default=None,
+        )
 
         # Get profile if exists
-        profile = None
-        has_profile = False
-        is_favorite = False
-        if consumer_id:
-            profile = (
-                db.query(ClientProfile)
-                .filter(
-                    ClientProfile.specialist_id == specialist_id,
-                    ClientProfile.consumer_id == consumer_id,
-                )
-                .first()
-            )
-            if profile:
-                has_profile = True
-                is_favorite = profile.is_favorite or False
+        profile = profiles_by_consumer.get(consumer_id) if consumer_id else None
+        has_profile = profile is not None
+        is_favorite = (profile.is_favorite or False) if profile else False
 
         # Build summary
         client_summary = {
@@ -4883,18 +5798,25 @@ async def get_professional_clients(specialist_id: int, db: Session = Depends(get
         client_summaries.append(client_summary)
 
     # Also include clients who have profiles but no bookings (e.g., from CSV upload)
-    profiles_without_bookings = (
-        db.query(ClientProfile)
-        .filter(ClientProfile.specialist_id == specialist_id)
-        .all()
+    profiles_without_bookings = [
+        profile
+        for consumer_id, profile in profiles_by_consumer.items()
+        if consumer_id not in seen_consumers
+    ]
+    profile_consumer_ids = [p.consumer_id for p in profiles_without_bookings]
+    profile_consumers = (
+        {
+            consumer.id: consumer
+            for consumer in db.query(Consumer).filter(
+                Consumer.id.in_(profile_consumer_ids)
+            )
+        }
+        if profile_consumer_ids
+        else {}
     )
 
     for profile in profiles_without_bookings:
-        # Skip if we already processed this consumer
-        if profile.consumer_id in seen_consumers:
-            continue
-
-        consumer = db.query(Consumer).filter(Consumer.id == profile.consumer_id).first()
+        consumer = profile_consumers.get(profile.consumer_id)
         if not consumer:
             continue  # Skip if consumer was deleted
 
@@ -4950,48 +5872,70 @@ async def get_client_detail(
     # Find all matching consumers (consolidation)
     matching_consumers = find_matching_consumers(db, consumer.email, consumer.phone)
 
-    # Get all bookings (consolidated)
-    all_bookings = consolidate_consumer_bookings(db, matching_consumers)
-
-    # Filter to this specialist's bookings only
-    specialist_bookings = [b for b in all_bookings if b.specialist_id == specialist_id]
+    # This specialist's consolidated bookings, filtered and ordered in SQL with
+    # the service columns joined in (no lazy load per booking)
+    specialist_filter = (Booking.specialist_id == specialist_id) & (
+        consolidated_bookings_filter(matching_consumers)
+        if matching_consumers
+        else False
+    )
+    booking_rows = (
+        db.query(
+            Booking.id,
+            Booking.date,
+            Booking.start_time,
+            Booking.end_time,
+            Booking.status,
+            Booking.notes,
+            ServiceDB.id.label("service_id"),
+            ServiceDB.name.label("service_name"),
+            ServiceDB.price.label("service_price"),
+        )
+        .outerjoin(ServiceDB, ServiceDB.id == Booking.service_id)
+        .filter(specialist_filter)
+        .order_by(Booking.date, Booking.start_time)
+        .all()
+    )
 
-    # Separate past and future
+    # Separate past and future (rows are already in date order)
     today = date.today()
     past_bookings = []
     future_bookings = []
 
-    for booking in specialist_bookings:
+    for row in booking_rows:
         booking_dict = {
-            "id": booking.id,
-            "date": booking.date.isoformat(),
-            "start_time": booking.start_time.isoformat(),
-            "end_time": booking.end_time.isoformat(),
-            "service_name": booking.service.name if booking.service else "Unknown",
-            "service_price": booking.service.price if booking.service else 0,
-            "status": booking.status,
-            "notes": booking.notes,
+            "id": row.id,
+            "date": row.date.isoformat(),
+            "start_time": row.start_time.isoformat(),
+            "end_time": row.end_time.isoformat(),
+            "service_name": row.service_name if row.service_id else "Unknown",
+            "service_price": row.service_price if row.service_id else 0,
+            "status": row.status,
+            "notes": row.notes,
         }
 
-        if booking.date < today:
+        if row.date < today:
             past_bookings.append(booking_dict)
         else:
             future_bookings.append(booking_dict)
 
-    # Sort bookings
-    past_bookings.sort(key=lambda x: x["date"], reverse=True)
-    future_bookings.sort(key=lambda x: x["date"])
-
-    # Calculate total revenue
-    total_revenue = sum(
-        b.service.price
-        for b in specialist_bookings
-        if b.service and b.status == "completed"
-    )
+    # Most recent past booking first
+    past_bookings.reverse()
 
-    # Get first booking date
-    first_booking_date = (
-        min(b.date for b in specialist_bookings) if specialist_bookings else None
+    # Revenue and first booking date are aggregated by the database
+    total_revenue, first_booking_date = (
+        db.query(
+            func.coalesce(
+                func.sum(
+                    case((Booking.status == "completed", ServiceDB.price), else_=0)
+                ),
+                0,
+            ),
+            func.min(Booking.date),
+        )
+        .outerjoin(ServiceDB, ServiceDB.id == Booking.service_id)
+        .filter(specialist_filter)
+        .one()
     )
 
     # Get client profile
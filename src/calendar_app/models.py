@@ -277,6 +277,18 @@ class BookingResponse(BaseModel):
         from_attributes = True
 
 
+class ServiceSummary(BaseModel):
+    """Service details nested in booking list responses"""
+
+    id: int
+    name: str
+    price: float
+    duration: int
+
+    class Config:
+        from_attributes = True
+
+
 class BookingWithServiceResponse(BaseModel):
     id: int
     specialist_id: int
@@ -290,7 +302,7 @@ class BookingWithServiceResponse(BaseModel):
     start_time: time
     end_time: time
     status: str
-    service: Optional[dict] = None
+    service: Optional[ServiceSummary] = None
     # Appointment session tracking fields
     session_id: Optional[int] = None
     session_started: Optional[datetime] = None
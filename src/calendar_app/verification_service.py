@@ -10,8 +10,20 @@ import os
 
 try:
     from .database import VerificationCode
+    from .config import settings
 except ImportError:
     from database import VerificationCode
+    from config import settings
+
+# Optional: Redis holds short-lived codes when REDIS_URL is configured
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+VERIFICATION_CODE_TTL_SECONDS = 600
 
 
 class VerificationService:
@@ -30,10 +42,54 @@ class VerificationService:
         # Twilio client will be None for now (can be implemented later)
         self.twilio_client = None
 
+        # Codes live in Redis (SET EX / atomic DEL) when available, else in the DB
+        self.redis = None
+        if REDIS_AVAILABLE and settings.REDIS_URL:
+            self.redis = redis.Redis.from_url(settings.REDIS_URL)
+
+    def _redis_key(self, identifier: str, verification_type: str, code: str) -> str:
+        return f"verify:{identifier}:{verification_type}:{code}"
+
     def generate_verification_code(self) -> str:
         """Generate a 6-digit verification code"""
         return str(random.randint(100000, 999999))
 
+    def create_verification_code(
+        self,
+        db: Session,
+        channel: Literal["email", "sms"],
+        verification_type: Literal["registration", "login"] = "registration",
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+    ) -> str:
+        """Generate a verification code, store it, and return it for delivery"""
+        # Generate verification code
+        code = self.generate_verification_code()
+
+        if self.redis is not None:
+            # Expiry is handled by Redis; no DB write on the auth path
+            self.redis.set(
+                self._redis_key(email or phone, verification_type, code),
+                1,
+                ex=VERIFICATION_CODE_TTL_SECONDS,
+            )
+            return code
+
+        # Store in database
+        expires_at = datetime.utcnow() + timedelta(minutes=10)  # 10 minute expiry
+        verification = VerificationCode(
+            email=email,
+            phone=phone,
+            code=code,
+            verification_type=f"{channel}_{verification_type}",
+            created_at=datetime.utcnow(),
+            expires_at=expires_at,
+            is_used=False,
+        )
+        db.add(verification)
+        db.commit()
+        return code
+
     async def send_email_verification(
         self,
         db: Session,
@@ -42,22 +98,22 @@ class VerificationService:
     ) -> bool:
         """Send verification code via email"""
         try:
-            # Generate verification code
-            code = self.generate_verification_code()
-
-            # Store in database
-            expires_at = datetime.utcnow() + timedelta(minutes=10)  # 10 minute expiry
-            verification = VerificationCode(
-                email=email,
-                code=code,
-                verification_type=f"email_{verification_type}",
-                created_at=datetime.utcnow(),
-                expires_at=expires_at,
-                is_used=False,
+            code = self.create_verification_code(
+                db, "email", verification_type, email=email
             )
-            db.add(verification)
-            db.commit()
+        except Exception as e:
+            print(f"Error sending email verification: {e}")
+            return False
+        return await self.deliver_email_code(email, code, verification_type)
 
+    async def deliver_email_code(
+        self,
+        email: str,
+        code: str,
+        verification_type: Literal["registration", "login"] = "registration",
+    ) -> bool:
+        """Deliver an already-stored verification code via email (no DB access)"""
+        try:
             # Prepare email content
             subject = "Élite Platform - Verification Code"
 
@@ -110,22 +166,22 @@ class VerificationService:
     ) -> bool:
         """Send verification code via SMS"""
         try:
-            # Generate verification code
-            code = self.generate_verification_code()
-
-            # Store in database
-            expires_at = datetime.utcnow() + timedelta(minutes=10)  # 10 minute expiry
-            verification = VerificationCode(
-                phone=phone,
-                code=code,
-                verification_type=f"sms_{verification_type}",
-                created_at=datetime.utcnow(),
-                expires_at=expires_at,
-                is_used=False,
+            code = self.create_verification_code(
+                db, "sms", verification_type, phone=phone
             )
-            db.add(verification)
-            db.commit()
+        except Exception as e:
+            print(f"Error sending SMS verification: {e}")
+            return False
+        return await self.deliver_sms_code(phone, code, verification_type)
 
+    async def deliver_sms_code(
+        self,
+        phone: str,
+        code: str,
+        verification_type: Literal["registration", "login"] = "registration",
+    ) -> bool:
+        """Deliver an already-stored verification code via SMS (no DB access)"""
+        try:
             # Prepare SMS content
             message_body = f"""
 Élite Platform 👑
@@ -155,6 +211,22 @@ If you didn't request this, please ignore.
         verification_type: str = "",
     ) -> bool:
         """Verify the provided code"""
+        if self.redis is not None:
+            # Codes are sent to the email when both are given, matching send
+            identifier = email or phone
+            types = (
+                [verification_type] if verification_type else ["registration", "login"]
+            )
+            try:
+                # DEL is an atomic lookup-and-consume; a wrong code deletes nothing
+                return any(
+                    self.redis.delete(self._redis_key(identifier, vtype, code)) == 1
+                    for vtype in types
+                )
+            except Exception as e:
+                print(f"Error verifying code: {e}")
+                return False
+
         try:
             # Build query based on provided identifiers
             query = db.query(VerificationCode).filter(
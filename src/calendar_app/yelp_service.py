@@ -5,11 +5,22 @@ This module provides functionality to search for businesses using the Yelp API
 and validate workplace information.
 """
 
+import hashlib
+import time
 import httpx
+import orjson
 from typing import List, Optional, Dict, Any
 from .config import settings
 from .models import YelpBusinessResponse, YelpBusinessSearch
 
+# Optional: Redis caches Yelp responses across workers when REDIS_URL is configured
+try:
+    import redis.asyncio as redis_asyncio
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 
 class YelpAPIError(Exception):
     """Custom exception for Yelp API errors."""
@@ -17,6 +28,13 @@ class YelpAPIError(Exception):
     pass
 
 
+# Business validity rarely changes; cache validate_business results briefly
+VALIDATION_CACHE_TTL_SECONDS = 600
+VALIDATION_CACHE_MAX_ENTRIES = 4096
+# Search results and business details (Redis only)
+YELP_RESPONSE_CACHE_TTL_SECONDS = 3600
+
+
 class YelpService:
     """Service class for interacting with the Yelp Fusion API."""
 
@@ -27,6 +45,33 @@ class YelpService:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        # yelp_business_id -> (is_valid, expires_at monotonic seconds)
+        self._validation_cache: Dict[str, tuple] = {}
+        self.redis = None
+        if REDIS_AVAILABLE and settings.REDIS_URL:
+            self.redis = redis_asyncio.Redis.from_url(settings.REDIS_URL)
+
+    async def _cache_get(self, key: str) -> Optional[Any]:
+        """Return the decoded cached value for key, or None on a miss."""
+        if self.redis is None:
+            return None
+        try:
+            cached = await self.redis.get(key)
+        except Exception as e:
+            print(f"Error reading Yelp cache: {e}")
+            return None
+        return orjson.loads(cached) if cached is not None else None
+
+    async def _cache_set(self, key: str, value: Any):
+        """Store value under key for YELP_RESPONSE_CACHE_TTL_SECONDS."""
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(
+                key, orjson.dumps(value), ex=YELP_RESPONSE_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            print(f"Error writing Yelp cache: {e}")
 
     async def search_businesses(
         self, search_params: YelpBusinessSearch
@@ -59,6 +104,13 @@ class YelpService:
         if search_params.categories:
             params["categories"] = search_params.categories
 
+        cache_key = "yelp:search:" + hashlib.sha256(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return [YelpBusinessResponse(**business) for business in cached]
+
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.get(
@@ -104,6 +156,9 @@ class YelpService:
                     )
                     businesses.append(business_response)
 
+                await self._cache_set(
+                    cache_key, [business.model_dump() for business in businesses]
+                )
                 return businesses
 
         except httpx.HTTPStatusError as e:
@@ -138,6 +193,11 @@ class YelpService:
         if not self.api_key:
             raise YelpAPIError("Yelp API key is not configured")
 
+        cache_key = f"yelp:business:{business_id}"
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return YelpBusinessResponse(**cached)
+
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.get(
@@ -164,7 +224,7 @@ class YelpService:
                     cat.get("title", "") for cat in business.get("categories", [])
                 ]
 
-                return YelpBusinessResponse(
+                business_response = YelpBusinessResponse(
                     id=business.get("id", ""),
                     name=business.get("name", ""),
                     url=business.get("url", ""),
@@ -182,6 +242,8 @@ class YelpService:
                     is_closed=business.get("is_closed", False),
                     distance=business.get("distance"),
                 )
+                await self._cache_set(cache_key, business_response.model_dump())
+                return business_response
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -205,12 +267,26 @@ class YelpService:
         Returns:
             True if business exists and is not closed, False otherwise
         """
+        now = time.monotonic()
+        cached = self._validation_cache.get(yelp_business_id)
+        if cached and cached[1] > now:
+            return cached[0]
+
         try:
             business = await self.get_business_details(yelp_business_id)
-            return business is not None and not business.is_closed
         except YelpAPIError:
+            # Not cached, so a transient API failure doesn't stick
             return False
 
+        is_valid = business is not None and not business.is_closed
+        if len(self._validation_cache) >= VALIDATION_CACHE_MAX_ENTRIES:
+            self._validation_cache.clear()
+        self._validation_cache[yelp_business_id] = (
+            is_valid,
+            now + VALIDATION_CACHE_TTL_SECONDS,
+        )
+        return is_valid
+
 
 # Global instance
 yelp_service = YelpService()